@@ -0,0 +1,82 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Date conversion in the parser: strptime vs. fixed-position slicing + memo.
+
+Collects the date fields of a synthetic BMF file (see ``synthetic.py``) and
+times converting all of them with the previous strptime/strftime round
+trip, with the slicer alone and with ``_convert_date`` (slicer plus cache),
+then times ``parse_bmf_csv`` on the whole file with either converter::
+
+    python benchmarks/bench_dates.py [--rows 100k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+from synthetic import iter_lines, parse_count, write_bmf_csv
+
+from scheinfirmen_at import parse
+from scheinfirmen_at.parse import _convert_date_strptime, _slice_date, parse_bmf_csv
+
+DATE_COLUMNS = (2, 3, 4, 5)
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=parse_count, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = list(iter_lines(args.rows))[1:-2]
+    dates = [
+        value.strip()
+        for line in lines
+        for i, value in enumerate(line.split("~"))
+        if i in DATE_COLUMNS and value.strip()
+    ]
+    print(f"{len(dates)} dates ({len(set(dates))} distinct) from {args.rows} rows")
+
+    def convert_cached() -> None:
+        parse._DATE_CACHE.clear()
+        for d in dates:
+            parse._convert_date(d)
+
+    results = {
+        "strptime + strftime": _best(lambda: [_convert_date_strptime(d) for d in dates], 1),
+        "slicer": _best(lambda: [_slice_date(d) for d in dates], args.repeat),
+        "slicer + cache": _best(convert_cached, args.repeat),
+    }
+    base = results["strptime + strftime"]
+    for label, seconds in results.items():
+        print(f"  {label:<22}{seconds * 1000:>9.1f} ms{base / seconds:>8.1f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = Path(tmp) / "bmf.csv"
+        write_bmf_csv(raw, args.rows)
+        data = raw.read_bytes()
+        new = _best(lambda: parse_bmf_csv(data), args.repeat)
+        with mock.patch.object(parse, "_convert_date", _convert_date_strptime):
+            old = _best(lambda: parse_bmf_csv(data), args.repeat)
+    print(f"parse_bmf_csv ({args.rows} rows)")
+    print(f"  {'strptime':<22}{old * 1000:>9.1f} ms{args.rows / old:>12.0f} rows/s")
+    print(f"  {'slicer + cache':<22}{new * 1000:>9.1f} ms{args.rows / new:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Records per second of the row parser: converter table vs. per-row closures.
+
+Parses the rows of a synthetic BMF file (see ``synthetic.py``) with the
+current ``RowParser`` (precompiled per-column converter table) and with the
+previous implementation, which defined ``opt``/``opt_date`` closures for
+every row and indexed the split fields one by one. Runs alternate to even
+out noise; the best of ``--repeat`` is reported::
+
+    python benchmarks/bench_parse_rows.py [--rows 100k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import html
+import time
+from collections.abc import Callable
+
+from synthetic import iter_lines, parse_count
+
+from scheinfirmen_at.parse import (
+    ScheinfirmaRecord,
+    _clean_field,
+    _convert_date,
+    _parse_row,
+    _strip_quotes,
+)
+
+
+def parse_row_closures(line_no: int, line: str) -> ScheinfirmaRecord:
+    """The previous row parser, kept for comparison."""
+    clean: Callable[[str], str]
+    if "&" not in line:
+        clean, fields = str.strip, line.split("~")
+    elif "&#" not in line:
+        clean, fields = str.strip, html.unescape(line).split("~")
+    else:
+        clean, fields = _clean_field, line.split("~")
+    if len(fields) == 10 and fields[-1] == "":
+        fields = fields[:9]
+    if len(fields) != 9:
+        raise ValueError(f"Line {line_no}: expected 9 fields, got {len(fields)}: {line!r}")
+
+    def opt(v: str) -> str | None:
+        cleaned = clean(v)
+        return cleaned if cleaned else None
+
+    def opt_date(v: str) -> str | None:
+        cleaned = clean(v)
+        return _convert_date(cleaned) if cleaned else None
+
+    return ScheinfirmaRecord(
+        name=clean(fields[0]),
+        anschrift=clean(fields[1]),
+        veroeffentlicht=_convert_date(clean(fields[2])),
+        rechtskraeftig=_convert_date(clean(fields[3])),
+        seit=opt_date(fields[4]),
+        geburtsdatum=opt_date(fields[5]),
+        fbnr=opt(fields[6]),
+        uid=opt(fields[7]),
+        kennziffer=_strip_quotes(clean(fields[8])),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=parse_count, default=100_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    lines = list(iter_lines(args.rows))[1:-2]
+    parsers = {"closures per row": parse_row_closures, "converter table": _parse_row}
+    expected = [parse_row_closures(i, line) for i, line in enumerate(lines)]
+    assert [_parse_row(i, line) for i, line in enumerate(lines)] == expected
+
+    best = dict.fromkeys(parsers, float("inf"))
+    gc.disable()  # collections would land on whichever run happens to trigger them
+    try:
+        for _ in range(args.repeat):
+            for label, parse_row in parsers.items():
+                t = time.perf_counter()
+                records = [parse_row(i, line) for i, line in enumerate(lines)]
+                best[label] = min(best[label], time.perf_counter() - t)
+                del records
+                gc.collect()
+    finally:
+        gc.enable()
+
+    base = best["closures per row"]
+    print(f"{len(lines)} rows")
+    for label, seconds in best.items():
+        print(
+            f"  {label:<20}{seconds * 1000:>9.1f} ms{len(lines) / seconds:>12.0f} rows/s"
+            f"{base / seconds:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Time and memory of every pipeline stage on synthetic BMF files.
+
+Generates a deterministic input per size (see ``synthetic.py``), runs each
+stage separately — parse, normalize, validate, every writer, verify and
+stats — and prints a JSON report to stdout (or ``--output``)::
+
+    python benchmarks/bench_pipeline.py --rows 1k 100k --output before.json
+    python benchmarks/bench_pipeline.py --rows 1k 100k --compare before.json
+
+Per stage the report holds the best wall and CPU time of ``--repeat`` runs,
+records per second and the peak of Python allocations (tracemalloc, measured
+in a separate run so it does not inflate the timings; C allocations of
+SQLite and pyarrow are not included). ``--compare`` prints the time ratio
+against an earlier report to stderr. For 10M rows, keep the generated input
+with ``--work-dir`` and use ``--repeat 1 --no-memory``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from synthetic import parse_count, write_bmf_csv
+
+from scheinfirmen_at import __version__
+from scheinfirmen_at.convert import (
+    import_pyarrow,
+    write_csv,
+    write_feather,
+    write_jsonl,
+    write_parquet,
+    write_sqlite,
+    write_xml,
+)
+from scheinfirmen_at.normalize import normalize_field_swaps
+from scheinfirmen_at.parse import ParseResult, parse_bmf_csv
+from scheinfirmen_at.schema import write_json_schema, write_xsd
+from scheinfirmen_at.stats import generate_stats
+from scheinfirmen_at.validate import validate_records
+from scheinfirmen_at.verify import verify_outputs
+
+
+def _have_pyarrow() -> bool:
+    try:
+        import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def measure(fn: Callable[[], Any], rows: int, repeat: int, memory: bool) -> dict[str, Any]:
+    """Run ``fn`` ``repeat`` times and return the best timings (and peak memory)."""
+    best_wall = best_cpu = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        fn()
+        best_wall = min(best_wall, time.perf_counter() - wall)
+        best_cpu = min(best_cpu, time.process_time() - cpu)
+    stats: dict[str, Any] = {
+        "wall_s": round(best_wall, 6),
+        "cpu_s": round(best_cpu, 6),
+        "rows_per_s": round(rows / best_wall) if best_wall > 0 else None,
+    }
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return stats
+
+
+def run(rows: int, seed: int, work: Path, repeat: int, memory: bool) -> dict[str, Any]:
+    """Benchmark all stages for one input size."""
+    raw = work / f"bmf-{rows}-{seed}.csv"
+    if not raw.exists():
+        print(f"generating {raw} ...", file=sys.stderr)
+        write_bmf_csv(raw, rows, seed)
+    out = work / f"out-{rows}"
+    out.mkdir(exist_ok=True)
+    paths = {
+        fmt: out / f"scheinfirmen.{fmt}"
+        for fmt in ("csv", "jsonl", "xml", "sqlite", "parquet", "feather")
+    }
+    json_schema, xsd = out / "scheinfirmen.json-schema.json", out / "scheinfirmen.xsd"
+    write_json_schema(json_schema)
+    write_xsd(xsd)
+
+    def parse() -> ParseResult:
+        with raw.open("rb") as f:
+            return parse_bmf_csv(f)
+
+    result = parse()
+    writers: dict[str, Callable[[ParseResult, Path], Any]] = {
+        "csv": write_csv,
+        "jsonl": write_jsonl,
+        "xml": write_xml,
+        "sqlite": write_sqlite,
+    }
+    if _have_pyarrow():
+        writers.update(parquet=write_parquet, feather=write_feather)
+
+    stages: list[tuple[str, Callable[[], Any]]] = [
+        ("parse_bmf_csv", parse),
+        ("normalize_field_swaps", lambda: normalize_field_swaps(result)),
+        ("validate_records", lambda: validate_records(result, min_rows=1)),
+    ]
+    stages += [
+        (f"write_{fmt}", partial(writer, result, paths[fmt])) for fmt, writer in writers.items()
+    ]
+    stages += [
+        (
+            "verify_outputs",
+            lambda: verify_outputs(
+                paths["csv"],
+                paths["jsonl"],
+                paths["xml"],
+                result.raw_row_count,
+                json_schema_path=json_schema,
+                xsd_path=xsd,
+                sqlite_path=paths["sqlite"],
+                parquet_path=paths["parquet"] if "parquet" in writers else None,
+                feather_path=paths["feather"] if "feather" in writers else None,
+            ),
+        ),
+        ("generate_stats", lambda: generate_stats(paths["jsonl"], out / "STATS.md")),
+    ]
+
+    report: dict[str, Any] = {
+        "rows": rows,
+        "seed": seed,
+        "input_bytes": raw.stat().st_size,
+        "stages": {},
+    }
+    for name, fn in stages:
+        print(f"{rows} rows: {name} ...", file=sys.stderr)
+        report["stages"][name] = measure(fn, rows, repeat, memory)
+    return report
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print per-stage wall time ratios (new / baseline) to stderr."""
+    base_runs = {entry["rows"]: entry for entry in baseline.get("runs", [])}
+    print(f"\ncompared to {baseline.get('commit') or 'baseline'}:", file=sys.stderr)
+    for entry in report["runs"]:
+        base = base_runs.get(entry["rows"])
+        if base is None:
+            continue
+        for name, stats in entry["stages"].items():
+            old = base["stages"].get(name)
+            if not old or not old["wall_s"]:
+                continue
+            ratio = stats["wall_s"] / old["wall_s"]
+            print(
+                f"{entry['rows']:>10} {name:<24}{old['wall_s']:>10.3f}s"
+                f"{stats['wall_s']:>10.3f}s{ratio:>8.2f}x",
+                file=sys.stderr,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", nargs="+", type=parse_count, default=[1_000, 100_000],
+        help="input sizes (e.g. 1k 100k 10M; default: 1k 100k)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument(
+        "--work-dir", type=Path, help="keep inputs and outputs here (default: temp dir)"
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="earlier JSON report to compare with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="scheinfirmen-bench-") as tmp:
+        work = args.work_dir or Path(tmp)
+        work.mkdir(parents=True, exist_ok=True)
+        report = {
+            "benchmark": "pipeline",
+            "version": __version__,
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "runs": [
+                run(rows, args.seed, work, args.repeat, not args.no_memory)
+                for rows in args.rows
+            ],
+        }
+
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    if args.compare is not None:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-record memory of ScheinfirmaRecord vs. a plain (dict-backed) dataclass.
+
+Loads the records of a JSONL file (default: data/scheinfirmen.jsonl) once
+into the slotted, interning ScheinfirmaRecord and once into an equivalent
+dataclass without slots or interning, and reports the memory allocated per
+record as measured by tracemalloc::
+
+    python benchmarks/bench_record_memory.py [data/scheinfirmen.jsonl] [--copies N]
+
+``--copies`` holds N independent copies of the snapshot in memory, as
+history and diff work do.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+from typing import Any
+
+from scheinfirmen_at.parse import ScheinfirmaRecord
+
+FIELDS = [f.name for f in fields(ScheinfirmaRecord)]
+
+# The previous representation: same fields, per-instance __dict__, no interning
+PlainRecord = make_dataclass("PlainRecord", [(name, Any) for name in FIELDS])
+
+
+def _load_rows(path: Path) -> list[dict[str, Any]]:
+    rows = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            obj = json.loads(line)
+            if "_metadata" not in obj:
+                rows.append(obj)
+    return rows
+
+
+def _measure(factory: Callable[..., Any], rows: list[dict[str, Any]], copies: int) -> int:
+    """Bytes allocated while building ``copies`` snapshots from fresh strings."""
+    # json.loads per copy, so every snapshot has its own string objects
+    # (as when snapshots come from different files)
+    encoded = [json.dumps(row, ensure_ascii=False) for row in rows]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    snapshots = []
+    for _ in range(copies):
+        records = []
+        for text in encoded:
+            obj = json.loads(text)
+            records.append(factory(**{k: obj.get(k) for k in FIELDS}))
+        snapshots.append(records)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del snapshots
+    return used
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("jsonl", nargs="?", type=Path, default=Path("data/scheinfirmen.jsonl"))
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = _load_rows(args.jsonl)
+    n = len(rows) * args.copies
+    plain = _measure(PlainRecord, rows, args.copies)
+    slotted = _measure(ScheinfirmaRecord, rows, args.copies)
+
+    print(f"{len(rows)} records x {args.copies} copies")
+    print(f"{'representation':<28}{'bytes/record':>14}{'total MiB':>12}")
+    for label, used in (
+        ("dataclass (__dict__)", plain),
+        ("slots + interned dates", slotted),
+    ):
+        print(f"{label:<28}{used / n:>14.0f}{used / 2**20:>12.1f}")
+    print(f"saving: {(plain - slotted) / n:.0f} bytes/record ({1 - slotted / plain:.0%})")
+
+
+if __name__ == "__main__":
+    main()
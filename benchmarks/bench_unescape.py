@@ -0,0 +1,68 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Field cleaning in the parser: html.unescape per field vs. only where needed.
+
+Splits and cleans the rows of a synthetic BMF file (see ``synthetic.py``)
+the previous way — ``html.unescape(field).strip()`` for all nine fields —
+and the current way: plain ``strip()`` for rows without ``&``, one
+``html.unescape`` of the whole row when it has only named entities, per
+field otherwise. Also times ``_parse_row`` on the same rows::
+
+    python benchmarks/bench_unescape.py [--rows 100k]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import time
+from collections.abc import Callable
+
+from synthetic import iter_lines, parse_count
+
+from scheinfirmen_at.parse import _clean_field, _parse_row
+
+
+def clean_per_field(line: str) -> list[str]:
+    return [html.unescape(f).strip() for f in line.split("~")]
+
+
+def clean_where_needed(line: str) -> list[str]:
+    if "&" not in line:
+        return [f.strip() for f in line.split("~")]
+    if "&#" not in line:
+        return [f.strip() for f in html.unescape(line).split("~")]
+    return [_clean_field(f) for f in line.split("~")]
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=parse_count, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = list(iter_lines(args.rows))[1:-2]
+    with_amp = sum("&" in line for line in lines)
+    print(f"{len(lines)} rows, {with_amp / len(lines):.1%} containing '&'")
+    assert all(clean_per_field(line) == clean_where_needed(line) for line in lines)
+
+    old = _best(lambda: [clean_per_field(line) for line in lines], args.repeat)
+    new = _best(lambda: [clean_where_needed(line) for line in lines], args.repeat)
+    print(f"  {'unescape every field':<26}{old * 1000:>9.1f} ms")
+    print(f"  {'unescape where needed':<26}{new * 1000:>9.1f} ms{old / new:>8.1f}x")
+    rows = _best(lambda: [_parse_row(i, line) for i, line in enumerate(lines)], args.repeat)
+    print(f"  {'_parse_row (all rows)':<26}{rows * 1000:>9.1f} ms{len(lines) / rows:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Deterministic generator for synthetic BMF Scheinunternehmer CSV files.
+
+Produces files in the exact upstream format (ISO-8859-1, CRLF, ``~``
+delimiter, padded header, blank line and ``Stand:`` footer) with the quirks
+the parser has to handle: HTML entities in names and addresses,
+``&quot;``-wrapped Kennziffer values, ``" "`` placeholders in empty date
+fields and a trailing tilde on some rows without Kennziffer. The same
+``rows`` and ``seed`` always give byte-identical output::
+
+    python benchmarks/synthetic.py 100k /tmp/bmf-100k.csv [--seed 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
+from pathlib import Path
+
+HEADER = (
+    "Name~ Anschrift~ Veröffentlichung~ Rechtskraft Bescheid~ "
+    "Zeitpunkt als Scheinunternehmen~ Geburts-Datum~ Firmenbuch-Nr~ UID-Nr.~ "
+    "Kennziffer des UR "
+)
+STAND = "10.02.2026 09:51:32"
+
+_SYLLABLES = [
+    "Alp", "Bau", "Bern", "Do", "Fer", "Gra", "Hof", "Inn", "Kra", "Lin", "Mur",
+    "Nord", "Ost", "Pan", "Rhe", "Sal", "Ter", "Ul", "Wal", "Zen", "Öko", "Süd",
+]
+_LEGAL_FORMS = ["GmbH", "Bau GmbH", "Handels GmbH", "KG", "OG", "e.U.", "AG", "GmbH & Co KG"]
+_FIRST_NAMES = ["Anna", "Bernd", "Dragan", "Elif", "Jürgen", "Marija", "Stefan", "Zoltán"]
+_LAST_NAMES = ["Bauer", "Gruber", "Horvat", "Kovács", "Müller", "Nowak", "Wagner", "Yilmaz"]
+_PLACES = [
+    ("1010", "Wien"), ("1100", "Wien"), ("1210", "Wien"), ("2700", "Wiener Neustadt"),
+    ("3100", "St. Pölten"), ("4020", "Linz"), ("5020", "Salzburg"), ("6020", "Innsbruck"),
+    ("7000", "Eisenstadt"), ("8010", "Graz"), ("9020", "Klagenfurt"),
+]
+_STREETS = ["Hauptstraße", "Bahnhofstraße", "Kirchengasse", "Industriestraße", "Lände"]
+
+# Publications come in batches, so relatively few distinct dates repeat
+# across many rows — as in the real list.
+_PUBLICATION_DATES = [date(2015, 1, 7) + timedelta(weeks=w) for w in range(580)]
+
+
+def _ddmmyyyy(d: date) -> str:
+    return f"{d.day:02d}.{d.month:02d}.{d.year}"
+
+
+def _row(i: int, rng: random.Random) -> str:
+    person = rng.random() < 0.08
+    if person:
+        name = f"{rng.choice(_LAST_NAMES)} {rng.choice(_FIRST_NAMES)}"
+        birth = _ddmmyyyy(date(1950, 1, 1) + timedelta(days=rng.randrange(20000)))
+    else:
+        stem = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+        name = f"{stem} {rng.choice(_LEGAL_FORMS)}"
+        if rng.random() < 0.05:
+            name = f"{stem} &amp; Partner {rng.choice(_LEGAL_FORMS)}"
+        birth = ""
+    if rng.random() < 0.01:
+        name = f"&quot;{name}&quot;"
+
+    plz, ort = rng.choice(_PLACES)
+    anschrift = f"{plz} {ort}, {rng.choice(_STREETS)} {rng.randint(1, 250)}"
+    if rng.random() < 0.02:
+        anschrift += f"/Top {rng.randint(1, 30)} &#8211; Hof"
+
+    published = rng.choice(_PUBLICATION_DATES)
+    legal = published - timedelta(days=rng.randint(1, 20))
+    seit = " "
+    if rng.random() < 0.4:
+        seit = _ddmmyyyy(legal - timedelta(days=rng.randint(30, 900))) + " "
+
+    fbnr = "" if person else f"{100000 + (i * 37) % 900000}{'abcdfghikmpstvwxyz'[i % 18]}"
+    uid = f"ATU{(i * 7919 + 10_000_000) % 100_000_000:08d}" if rng.random() < 0.9 else ""
+
+    r = rng.random()
+    if r < 0.45:
+        letter = chr(65 + rng.randrange(26))
+        kennziffer = f"R{rng.randint(100, 999)}{letter}{rng.randint(1000, 9999)}"
+    elif r < 0.5:
+        kennziffer = f"&quot;R{rng.randint(100, 999)}Z{rng.randint(100, 999)}&quot;"
+    else:
+        kennziffer = ""
+    fields = [
+        name, anschrift, _ddmmyyyy(published), _ddmmyyyy(legal), seit, birth, fbnr, uid,
+        kennziffer,
+    ]
+    line = "~".join(fields)
+    if not kennziffer and rng.random() < 0.3:
+        line += "~"
+    return line
+
+
+def iter_lines(rows: int, seed: int = 0) -> Iterator[str]:
+    """Yield all lines of a synthetic file (without line terminators)."""
+    rng = random.Random(seed)
+    yield HEADER
+    for i in range(rows):
+        yield _row(i, rng)
+    yield ""
+    yield f"Stand:  {STAND}"
+
+
+def write_bmf_csv(path: str | Path, rows: int, seed: int = 0) -> int:
+    """Write a synthetic BMF CSV with ``rows`` data rows; returns its size in bytes."""
+    path = Path(path)
+    batch: list[str] = []
+    with path.open("w", encoding="iso-8859-1", newline="\r\n") as f:
+        for line in iter_lines(rows, seed):
+            batch.append(line)
+            if len(batch) >= 10_000:
+                f.write("\n".join(batch) + "\n")
+                batch.clear()
+        f.write("\n".join(batch) + "\n")
+    return path.stat().st_size
+
+
+def parse_count(text: str) -> int:
+    """Parse a row count such as ``1000``, ``1k``, ``100k`` or ``10M``."""
+    factor = {"k": 1_000, "m": 1_000_000}.get(text[-1:].lower(), 1)
+    digits = text[:-1] if factor > 1 else text
+    return int(digits) * factor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rows", type=parse_count, help="number of data rows (e.g. 1k, 10M)")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    size = write_bmf_csv(args.output, args.rows, args.seed)
+    print(f"wrote {args.rows} rows ({size / 2**20:.1f} MiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,33 @@ from importlib.metadata import version as _version
 
 __version__ = _version("scheinfirmen-at")
 
-from scheinfirmen_at.convert import write_csv, write_jsonl, write_xml
-from scheinfirmen_at.download import download_csv
-from scheinfirmen_at.parse import parse_bmf_csv
+from scheinfirmen_at.convert import (
+    read_jsonl,
+    write_csv,
+    write_feather,
+    write_jsonl,
+    write_parquet,
+    write_sqlite,
+    write_xml,
+)
+from scheinfirmen_at.download import download_csv, stream_csv
+from scheinfirmen_at.index import ScheinfirmenIndex
+from scheinfirmen_at.parse import parse_bmf_csv, parse_bmf_csv_iter
 from scheinfirmen_at.validate import validate_records
 
 __all__ = [
+    "ScheinfirmenIndex",
     "__version__",
     "download_csv",
     "parse_bmf_csv",
+    "parse_bmf_csv_iter",
+    "read_jsonl",
+    "stream_csv",
     "validate_records",
     "write_csv",
+    "write_feather",
     "write_jsonl",
+    "write_parquet",
+    "write_sqlite",
     "write_xml",
 ]
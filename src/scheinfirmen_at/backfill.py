@@ -0,0 +1,158 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Seed a history store from the git history of the JSONL output.
+
+Every past version of ``data/scheinfirmen.jsonl`` is read straight from the
+object database: one ``git log --raw`` lists the blob id per commit, and a
+single long-running ``git cat-file --batch`` streams the blob contents. No
+commit is ever checked out. Blobs are parsed and keyed in a process pool
+(bounded window, so only a few snapshots are in memory at once). Workers
+send back only the stand and each row's key and JSON text (see
+:func:`~scheinfirmen_at.history.snapshot_rows`) — strings pickle far
+cheaper than record objects — and the parent appends them to the
+:class:`~scheinfirmen_at.history.HistoryStore` in commit order, comparing
+strings to find the per-stand changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import subprocess
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+from scheinfirmen_at.convert import parse_jsonl
+from scheinfirmen_at.history import HistoryStore, snapshot_rows
+
+logger = logging.getLogger("scheinfirmen_at")
+
+DEFAULT_PATH = "data/scheinfirmen.jsonl"
+_NULL_SHA = "0" * 40
+
+
+def _git(repo: Path, *args: str) -> str:
+    proc = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {proc.stderr.strip()}")
+    return proc.stdout
+
+
+def list_blobs(repo: str | Path, path: str = DEFAULT_PATH, ref: str = "HEAD") -> list[str]:
+    """Blob ids of ``path`` in every commit that touched it, oldest first.
+
+    Deletions are skipped, and so are consecutive duplicates (e.g. a revert
+    to identical content).
+    """
+    out = _git(
+        Path(repo), "log", "--reverse", "--format=", "--raw", "--no-abbrev",
+        "--no-renames", ref, "--", path,
+    )
+    blobs: list[str] = []
+    for line in out.splitlines():
+        # :100644 100644 <old> <new> M\t<path>
+        if not line.startswith(":"):
+            continue
+        new_sha = line.split("\t", 1)[0].split()[3]
+        if new_sha != _NULL_SHA and (not blobs or blobs[-1] != new_sha):
+            blobs.append(new_sha)
+    return blobs
+
+
+def iter_blobs(repo: str | Path, shas: Iterable[str]) -> Iterator[bytes]:
+    """Stream the contents of the given blobs via one ``git cat-file --batch``."""
+    proc = subprocess.Popen(
+        ["git", "-C", str(repo), "cat-file", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for sha in shas:
+            proc.stdin.write(f"{sha}\n".encode())
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if len(header) != 3 or header[1] != b"blob":
+                raise RuntimeError(f"git cat-file: unexpected reply for {sha}: {header!r}")
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # trailing LF
+            yield data
+    finally:
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait()
+
+
+# What _read_blob raises for a revision it cannot parse (UnicodeDecodeError
+# and JSONDecodeError are ValueErrors; the rest come from malformed lines)
+_UNREADABLE = (ValueError, KeyError, TypeError, AttributeError)
+
+
+def _read_blob(data: bytes) -> tuple[str, dict[str, str]]:
+    """Parse one JSONL revision in a worker: (stand, snapshot rows)."""
+    result = parse_jsonl(data.decode("utf-8").splitlines())
+    return f"{result.stand_datum}T{result.stand_zeit}", snapshot_rows(result.records)
+
+
+def backfill(
+    repo: str | Path,
+    store: HistoryStore,
+    path: str = DEFAULT_PATH,
+    ref: str = "HEAD",
+    workers: int | None = None,
+) -> int:
+    """Append every historical snapshot of ``path`` newer than the store's
+    latest stand. Returns the number of snapshots appended.
+
+    Running it again later only adds what is new, so it doubles as an
+    incremental import.
+
+    Raises:
+        RuntimeError: if a git command fails.
+    """
+    shas = list_blobs(repo, path, ref)
+    logger.info("Found %d revisions of %s", len(shas), path)
+    workers = workers or os.cpu_count() or 1
+    window = workers * 2
+
+    appended = 0
+    # "spawn" so workers don't inherit (and hold open) the cat-file pipes
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        pending: deque[tuple[str, Future[tuple[str, dict[str, str]]]]] = deque()
+
+        def drain_one() -> None:
+            nonlocal appended
+            sha, future = pending.popleft()
+            try:
+                stand, rows = future.result()
+            except _UNREADABLE as exc:
+                # Not valid UTF-8 / JSONL, or early revisions without the
+                # _metadata line: skip that revision, keep the others.
+                # Pool failures (BrokenProcessPool, MemoryError) propagate.
+                logger.warning("Skipping blob %s: %s: %s", sha, type(exc).__name__, exc)
+                return
+            latest = store.latest_stand
+            if latest is not None and stand <= latest:
+                return
+            n_events = store.append_rows(stand, rows)
+            appended += 1
+            logger.debug("%s: %d records, %d changes", stand, len(rows), n_events)
+
+        for sha, data in zip(shas, iter_blobs(repo, shas), strict=True):
+            pending.append((sha, pool.submit(_read_blob, data)))
+            if len(pending) >= window:
+                drain_one()
+        while pending:
+            drain_one()
+
+    return appended
@@ -4,22 +4,64 @@
 """Command-line interface for scheinfirmen-at."""
 
 import argparse
+import json
 import logging
 import sys
 from pathlib import Path
 
 from scheinfirmen_at import __version__
-from scheinfirmen_at.convert import write_csv, write_jsonl, write_xml
-from scheinfirmen_at.download import BMF_URL, download_csv
+from scheinfirmen_at.backfill import DEFAULT_PATH as DEFAULT_BACKFILL_PATH
+from scheinfirmen_at.backfill import backfill
+from scheinfirmen_at.columnar import ColumnarView
+from scheinfirmen_at.convert import (
+    CsvSink,
+    JsonlSink,
+    OutputMeta,
+    XmlSink,
+    import_pyarrow,
+    read_jsonl,
+    refresh_stand,
+    write_feather,
+    write_parquet,
+    write_records,
+    write_sqlite,
+)
+from scheinfirmen_at.diff import diff_records, write_changes
+from scheinfirmen_at.download import BMF_URL, HttpCache, NotModifiedError, stream_csv
+from scheinfirmen_at.history import HistoryStore
+from scheinfirmen_at.metrics import PipelineMetrics
 from scheinfirmen_at.normalize import normalize_field_swaps
-from scheinfirmen_at.parse import parse_bmf_csv
+from scheinfirmen_at.parse import BmfSource, parse_bmf_csv_iter
+from scheinfirmen_at.publish import StagingDir, atomic_write_text
 from scheinfirmen_at.schema import write_csvw_metadata, write_json_schema, write_xsd
-from scheinfirmen_at.stats import generate_stats
+from scheinfirmen_at.serve import serve
+from scheinfirmen_at.stats import WEEKLY_STATE_FILE, generate_stats
 from scheinfirmen_at.validate import validate_records
 from scheinfirmen_at.verify import verify_outputs
 
 logger = logging.getLogger("scheinfirmen_at")
 
+# Exit status when a conditional download reports the data as unchanged
+EXIT_NOT_MODIFIED = 3
+
+# Hash of the last processed source payload (excluding the Stand: line)
+SOURCE_HASH_FILE = "scheinfirmen.source.sha256"
+
+
+def _read_source_hash(path: Path) -> dict[str, str] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_source_hash(path: Path, content_hash: str) -> None:
+    # The package version is stored too: a new release may change the
+    # output format, so unchanged source data must still be re-converted.
+    data = {"sha256": content_hash, "version": __version__}
+    atomic_write_text(path, json.dumps(data) + "\n")
+
 
 def main(argv: list[str] | None = None) -> None:
     """Main entry point for the scheinfirmen-at CLI."""
@@ -53,6 +95,32 @@ def main(argv: list[str] | None = None) -> None:
         metavar="FILE",
         help="Use a local file instead of downloading",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Remember ETag/Last-Modified in DIR and send a conditional request; "
+            f"exit with status {EXIT_NOT_MODIFIED} if the data is unchanged"
+        ),
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Skip normalize/validate/write/verify when the source content "
+            "(ignoring the Stand: line) is unchanged since the last run"
+        ),
+    )
+    parser.add_argument(
+        "--refresh-stand",
+        action="store_true",
+        help=(
+            "With --skip-unchanged: still update the Stand timestamp in JSONL, XML and "
+            "the --sqlite/--parquet/--feather outputs (changes.jsonl keeps its delta)"
+        ),
+    )
     parser.add_argument(
         "--min-rows",
         type=int,
@@ -60,6 +128,28 @@ def main(argv: list[str] | None = None) -> None:
         metavar="N",
         help="Minimum expected record count (default: 100)",
     )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="Also write an indexed SQLite database (scheinfirmen.sqlite)",
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also write typed Parquet (scheinfirmen.parquet; needs the 'parquet' extra)",
+    )
+    parser.add_argument(
+        "--feather",
+        action="store_true",
+        help="Also write Arrow IPC/Feather (scheinfirmen.feather; needs the 'parquet' extra)",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Append the snapshot's changes to a history store (e.g. data/history.jsonl)",
+    )
     parser.add_argument(
         "--skip-verify",
         action="store_true",
@@ -72,12 +162,85 @@ def main(argv: list[str] | None = None) -> None:
         metavar="FILE",
         help="Generate a Markdown statistics report (e.g. data/STATS.md)",
     )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Write per-stage timing, CPU, memory and throughput metrics as JSON",
+    )
+    parser.add_argument(
+        "--metrics-prometheus",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Write the same metrics in Prometheus text format (e.g. for node_exporter)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable verbose (DEBUG) logging",
     )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local HTTP lookup service over the converted data",
+        description=(
+            "Serve /uid/{uid}, /fbnr/{nr}, /kennziffer/{kz}, POST /lookup and /meta "
+            "from an in-memory index; the data file is reloaded when it changes."
+        ),
+    )
+    serve_parser.add_argument(
+        "--data",
+        type=Path,
+        default=Path("data/scheinfirmen.jsonl"),
+        metavar="FILE",
+        help="JSONL data file to serve (default: data/scheinfirmen.jsonl)",
+    )
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=8080, help="Port to listen on (default: 8080)"
+    )
+    serve_parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=5.0,
+        metavar="SECONDS",
+        help="How often to check the data file for changes (default: 5)",
+    )
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Seed a history store from the git history of the JSONL output",
+        description=(
+            "Read every committed version of the JSONL file straight from git "
+            "(no checkouts) and append the per-stand changes to a history store."
+        ),
+    )
+    backfill_parser.add_argument(
+        "--repo", type=Path, default=Path("."), help="Git repository (default: .)"
+    )
+    backfill_parser.add_argument(
+        "--path",
+        default=DEFAULT_BACKFILL_PATH,
+        help=f"Path of the JSONL file inside the repository (default: {DEFAULT_BACKFILL_PATH})",
+    )
+    backfill_parser.add_argument(
+        "--ref", default="HEAD", help="Commit to walk back from (default: HEAD)"
+    )
+    backfill_parser.add_argument(
+        "--history",
+        type=Path,
+        default=Path("data/history.jsonl"),
+        metavar="FILE",
+        help="History store to append to (default: data/history.jsonl)",
+    )
+    backfill_parser.add_argument(
+        "--workers", type=int, default=None, help="Parser processes (default: CPU count)"
+    )
     args = parser.parse_args(argv)
 
     logging.basicConfig(
@@ -86,39 +249,157 @@ def main(argv: list[str] | None = None) -> None:
         stream=sys.stderr,
     )
 
-    # --- Step 1: Acquire raw CSV data ---
+    if args.command == "serve":
+        try:
+            serve(args.data, args.host, args.port, args.reload_interval)
+        except (OSError, ValueError) as exc:
+            logger.error("Cannot serve %s: %s", args.data, exc)
+            sys.exit(1)
+        return
+
+    if args.command == "backfill":
+        try:
+            n = backfill(
+                args.repo, HistoryStore(args.history), args.path, args.ref, args.workers
+            )
+        except (OSError, RuntimeError, ValueError) as exc:
+            logger.error("Backfill failed: %s", exc)
+            sys.exit(1)
+        print(f"OK: appended {n} snapshots to {args.history}")
+        return
+
+    metrics = PipelineMetrics()
+    try:
+        _run(args, metrics)
+    except SystemExit as exc:
+        # sys.exit() / sys.exit(None) mean success, any message means failure
+        metrics.exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        raise
+    else:
+        metrics.exit_code = 0
+    finally:
+        _write_metrics(args, metrics)
+
+
+def _write_metrics(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    # Metrics are best-effort: failing to write them must not fail the run
+    try:
+        if args.metrics is not None:
+            metrics.write_json(args.metrics)
+        if args.metrics_prometheus is not None:
+            metrics.write_prometheus(args.metrics_prometheus)
+    except OSError as exc:
+        logger.warning("Cannot write metrics: %s", exc)
+
+
+def _run(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    """Download/parse, validate, write, verify and publish (the default command)."""
+    out = args.output_dir
+    csv_path = out / "scheinfirmen.csv"
+    jsonl_path = out / "scheinfirmen.jsonl"
+    xml_path = out / "scheinfirmen.xml"
+    json_schema_path = out / "scheinfirmen.json-schema.json"
+    csvw_path = out / "scheinfirmen.csv-metadata.json"
+    xsd_path = out / "scheinfirmen.xsd"
+    changes_path = out / "changes.jsonl"
+    sqlite_path = out / "scheinfirmen.sqlite" if args.sqlite else None
+    parquet_path = out / "scheinfirmen.parquet" if args.parquet else None
+    feather_path = out / "scheinfirmen.feather" if args.feather else None
+    source_hash_path = out / SOURCE_HASH_FILE
+    outputs = [csv_path, jsonl_path, xml_path, json_schema_path, csvw_path, xsd_path]
+    outputs.extend(p for p in (sqlite_path, parquet_path, feather_path) if p is not None)
+
+    # Fail before downloading if an optional output can't be written
+    if parquet_path is not None or feather_path is not None:
+        try:
+            import_pyarrow()
+        except ImportError as exc:
+            logger.error("%s", exc)
+            sys.exit(1)
+
+    cache = HttpCache(args.cache_dir) if args.cache_dir is not None else None
+
+    # --- Step 1: Open raw CSV source (local file or streaming download) ---
+    # The body is transferred while parsing, so "download" only covers the
+    # request up to the response headers.
+    source: BmfSource
     if args.input is not None:
         logger.info("Reading from local file: %s", args.input)
         try:
-            raw_data = args.input.read_bytes()
+            source = args.input.open("rb")
         except OSError as exc:
             logger.error("Cannot read input file: %s", exc)
             sys.exit(1)
     else:
         logger.info("Downloading from %s", args.url)
+        if cache is not None and not jsonl_path.exists():
+            # No previous outputs to keep — a 304 would leave nothing behind.
+            cache.discard(args.url)
+        with metrics.stage("download"):
+            try:
+                source = stream_csv(url=args.url, cache=cache)
+            except NotModifiedError:
+                logger.info("Source not modified since last run — skipping pipeline")
+                print(f"UNCHANGED: {args.url} not modified, {out}/ left as is")
+                sys.exit(EXIT_NOT_MODIFIED)
+            except RuntimeError as exc:
+                logger.error("Download failed: %s", exc)
+                sys.exit(1)
+
+    # --- Step 2: Parse (overlaps with the download) ---
+    logger.info("Parsing CSV data...")
+    stream = parse_bmf_csv_iter(source)
+    with metrics.stage("parse") as m:
         try:
-            raw_data = download_csv(url=args.url)
-        except RuntimeError as exc:
+            result = stream.collect()
+        except ValueError as exc:
+            logger.error("Parse error: %s", exc)
+            sys.exit(1)
+        except (RuntimeError, OSError) as exc:
             logger.error("Download failed: %s", exc)
             sys.exit(1)
-    logger.debug("Downloaded %d bytes", len(raw_data))
-
-    # --- Step 2: Parse ---
-    logger.info("Parsing CSV data...")
-    try:
-        result = parse_bmf_csv(raw_data)
-    except ValueError as exc:
-        logger.error("Parse error: %s", exc)
-        sys.exit(1)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+            m.records = stream.row_count
+            m.payload_bytes = stream.bytes_read
+    logger.debug("Read %d bytes", stream.bytes_read)
     logger.info(
         "Parsed %d records (Stand: %s %s)",
         result.raw_row_count,
         result.stand_datum,
         result.stand_zeit,
     )
+    n_records = len(result.records)
+
+    # --- Step 2a: Short-circuit when the source content is unchanged ---
+    if args.skip_unchanged:
+        previous_hash = _read_source_hash(source_hash_path)
+        unchanged = previous_hash == {"sha256": stream.content_hash, "version": __version__}
+        if unchanged and all(p.exists() for p in outputs):
+            if args.refresh_stand:
+                refresh_stand(
+                    jsonl_path,
+                    xml_path,
+                    result.stand_datum,
+                    result.stand_zeit,
+                    sqlite_path=sqlite_path,
+                    parquet_path=parquet_path,
+                    feather_path=feather_path,
+                )
+                logger.info("Refreshed Stand timestamp in the outputs in %s/", out)
+            if cache is not None:
+                cache.commit()
+            print(
+                f"UNCHANGED: source content identical to {out}/ "
+                f"(Stand: {result.stand_datum} {result.stand_zeit})"
+            )
+            return
 
     # --- Step 2b: Normalize known BMF data-entry quirks ---
-    fixes = normalize_field_swaps(result)
+    with metrics.stage("normalize", n_records):
+        fixes = normalize_field_swaps(result)
     for f in fixes:
         logger.warning("NORMALIZE: %s", f)
     if fixes:
@@ -129,7 +410,11 @@ def main(argv: list[str] | None = None) -> None:
 
     # --- Step 3: Validate ---
     logger.info("Validating records...")
-    validation = validate_records(result, min_rows=args.min_rows)
+    with metrics.stage("validate", n_records):
+        # One column view of the (normalized) records, shared by validation,
+        # the Arrow writers and the stats report
+        columns = ColumnarView.from_result(result)
+        validation = validate_records(result, min_rows=args.min_rows, columns=columns)
 
     if validation.warnings:
         for w in validation.warnings:
@@ -144,58 +429,148 @@ def main(argv: list[str] | None = None) -> None:
 
     logger.info("Validation passed (%d warnings)", len(validation.warnings))
 
-    # --- Step 4: Write outputs ---
-    out = args.output_dir
-    csv_path = out / "scheinfirmen.csv"
-    jsonl_path = out / "scheinfirmen.jsonl"
-    xml_path = out / "scheinfirmen.xml"
-    json_schema_path = out / "scheinfirmen.json-schema.json"
-    csvw_path = out / "scheinfirmen.csv-metadata.json"
-    xsd_path = out / "scheinfirmen.xsd"
+    # --- Step 3b: Delta against the previous snapshot in the output dir ---
+    with metrics.stage("diff", n_records):
+        previous = None
+        if jsonl_path.exists():
+            try:
+                previous = read_jsonl(jsonl_path)
+            except (OSError, ValueError) as exc:
+                logger.warning("Cannot read previous snapshot %s: %s", jsonl_path, exc)
+        diff = diff_records(previous.records if previous else [], result.records)
+    logger.info("Changes since previous snapshot: %s", diff)
+    # A rerun on the published stand would replace the real delta with an
+    # empty one before every consumer has fetched it: keep the old file
+    same_stand = (
+        previous is not None
+        and previous.stand_datum == result.stand_datum
+        and previous.stand_zeit == result.stand_zeit
+    )
+    write_delta = not (same_stand and changes_path.exists())
+    if not write_delta:
+        logger.info("Stand unchanged — keeping %s", changes_path)
+    changes = [changes_path] if write_delta else []
 
-    logger.info("Writing outputs to %s/", out)
-    n_csv = write_csv(result, csv_path)
-    logger.debug("Wrote %d rows to %s", n_csv, csv_path)
+    # --- Step 4: Write outputs to a staging directory next to the targets ---
+    # Nothing in out/ changes until every file is written and verified; a
+    # crash or failed check leaves the previously published data in place.
+    with StagingDir(out) as staging:
+        staged = {p: staging.path / p.name for p in [*outputs, *changes]}
+        logger.info("Writing outputs to %s/", staging.path)
+        # CSV, JSONL and XML are written in one interleaved pass
+        with metrics.stage("write_csv_jsonl_xml", n_records):
+            n_written = write_records(
+                result.records,
+                OutputMeta.from_result(result),
+                [
+                    CsvSink(staged[csv_path]),
+                    JsonlSink(staged[jsonl_path]),
+                    XmlSink(staged[xml_path]),
+                ],
+            )
+        logger.debug("Wrote %d rows to %s, %s and %s", n_written, csv_path, jsonl_path, xml_path)
 
-    n_jsonl = write_jsonl(result, jsonl_path)
-    logger.debug("Wrote %d rows to %s", n_jsonl, jsonl_path)
+        if sqlite_path is not None:
+            with metrics.stage("write_sqlite", n_records):
+                n_sqlite = write_sqlite(result, staged[sqlite_path])
+            logger.debug("Wrote %d rows to %s", n_sqlite, sqlite_path)
 
-    n_xml = write_xml(result, xml_path)
-    logger.debug("Wrote %d rows to %s", n_xml, xml_path)
+        if parquet_path is not None:
+            with metrics.stage("write_parquet", n_records):
+                n_parquet = write_parquet(result, staged[parquet_path], columns)
+            logger.debug("Wrote %d rows to %s", n_parquet, parquet_path)
 
-    write_json_schema(json_schema_path)
-    logger.debug("Wrote JSON Schema to %s", json_schema_path)
+        if feather_path is not None:
+            with metrics.stage("write_feather", n_records):
+                n_feather = write_feather(result, staged[feather_path], columns)
+            logger.debug("Wrote %d rows to %s", n_feather, feather_path)
 
-    write_csvw_metadata(csvw_path)
-    logger.debug("Wrote CSVW metadata to %s", csvw_path)
+        if write_delta:
+            with metrics.stage("write_changes") as m:
+                n_changes = write_changes(
+                    diff,
+                    staged[changes_path],
+                    stand=f"{result.stand_datum}T{result.stand_zeit}",
+                    previous_stand=(
+                        f"{previous.stand_datum}T{previous.stand_zeit}" if previous else None
+                    ),
+                )
+                m.records = n_changes
+            logger.debug("Wrote %d change entries to %s", n_changes, changes_path)
 
-    write_xsd(xsd_path)
-    logger.debug("Wrote XSD to %s", xsd_path)
+        with metrics.stage("write_schemas"):
+            write_json_schema(staged[json_schema_path])
+            logger.debug("Wrote JSON Schema to %s", json_schema_path)
 
-    # --- Step 5: Cross-format verification ---
-    if not args.skip_verify:
-        logger.info("Verifying output consistency and schemas...")
-        verify_errors = verify_outputs(
-            csv_path,
-            jsonl_path,
-            xml_path,
-            result.raw_row_count,
-            json_schema_path=json_schema_path,
-            xsd_path=xsd_path,
-        )
-        if verify_errors:
-            for ve in verify_errors:
-                logger.error("VERIFY ERROR: %s", ve)
-            logger.error("Cross-format verification failed — outputs may be inconsistent")
-            sys.exit(1)
-        logger.info("Verification passed: all formats contain %d records", result.raw_row_count)
+            write_csvw_metadata(staged[csvw_path])
+            logger.debug("Wrote CSVW metadata to %s", csvw_path)
+
+            write_xsd(staged[xsd_path])
+            logger.debug("Wrote XSD to %s", xsd_path)
+
+        # --- Step 5: Cross-format verification (on the staged files) ---
+        if not args.skip_verify:
+            logger.info("Verifying output consistency and schemas...")
+            with metrics.stage("verify", n_records):
+                verify_errors = verify_outputs(
+                    staged[csv_path],
+                    staged[jsonl_path],
+                    staged[xml_path],
+                    result.raw_row_count,
+                    json_schema_path=staged[json_schema_path],
+                    xsd_path=staged[xsd_path],
+                    sqlite_path=staged[sqlite_path] if sqlite_path is not None else None,
+                    parquet_path=staged[parquet_path] if parquet_path is not None else None,
+                    feather_path=staged[feather_path] if feather_path is not None else None,
+                )
+            if verify_errors:
+                for ve in verify_errors:
+                    logger.error("VERIFY ERROR: %s", ve)
+                logger.error("Cross-format verification failed — %s/ left unchanged", out)
+                sys.exit(1)
+            logger.info(
+                "Verification passed: all formats contain %d records", result.raw_row_count
+            )
+
+        # --- Step 5a: Publish — schemas first, so data never refers to a
+        # schema that isn't there yet; changes.jsonl last ---
+        schemas = [json_schema_path, csvw_path, xsd_path]
+        data = [p for p in outputs if p not in schemas]
+        with metrics.stage("publish"):
+            staging.publish(p.name for p in [*schemas, *data, *changes])
+        logger.debug("Published %d files to %s/", len(outputs) + len(changes), out)
+
+    # --- Step 5b: History store (optional) ---
+    if args.history is not None:
+        with metrics.stage("history") as m:
+            try:
+                n_events = HistoryStore(args.history).append(result)
+                m.records = n_events
+                logger.debug("Appended %d history events to %s", n_events, args.history)
+            except ValueError as exc:
+                logger.warning("History not updated: %s", exc)
 
     # --- Step 6: Stats report (optional) ---
     if args.stats is not None:
-        try:
-            generate_stats(jsonl_path.resolve(), args.stats.resolve())
-        except Exception as exc:
-            logger.warning("Stats generation failed (non-fatal): %s", exc)
+        with metrics.stage("stats", n_records):
+            try:
+                stats_path = args.stats.resolve()
+                generate_stats(
+                    jsonl_path.resolve(),
+                    stats_path,
+                    changes_path=changes_path.resolve(),
+                    weekly_path=stats_path.with_name(WEEKLY_STATE_FILE),
+                    result=result,
+                    columns=columns,
+                )
+            except Exception as exc:
+                logger.warning("Stats generation failed (non-fatal): %s", exc)
+
+    # Only remember the source hash and validators once the new data has
+    # been published
+    _write_source_hash(source_hash_path, stream.content_hash)
+    if cache is not None:
+        cache.commit()
 
     # --- Done ---
     print(
@@ -0,0 +1,139 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Columnar (struct-of-arrays) view of a list of records.
+
+Stats and validation look at one field across all records at a time.
+:class:`ColumnarView` stores each field contiguously instead:
+
+- date fields as day ordinals in an ``array('i')``
+  (:data:`NULL_DATE` for a missing value, :data:`INVALID_DATE` for a
+  value that is not an ISO date),
+- every field as a :class:`StringColumn`: one concatenated ``str`` with
+  an offsets array and a validity mask for ``None``.
+
+The view is built once from the record list and is read-only.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import fields
+from datetime import date
+from itertools import accumulate, repeat
+from operator import attrgetter, is_not
+from typing import Any, overload
+
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+
+FIELDS = tuple(f.name for f in fields(ScheinfirmaRecord))
+DATE_FIELDS = ("veroeffentlicht", "rechtskraeftig", "seit", "geburtsdatum")
+
+NULL_DATE = 0  # value is None
+INVALID_DATE = -1  # value is not an ISO date (YYYY-MM-DD), including ""
+
+_RE_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class StringColumn(Sequence[str | None]):
+    """Nullable string column backed by one string and an offsets array."""
+
+    __slots__ = ("_data", "_offsets", "_valid")
+
+    def __init__(self, values: Iterable[str | None]) -> None:
+        values = values if isinstance(values, list) else list(values)
+        # None contributes nothing to the data; the mask tells it from ""
+        filled = [v or "" for v in values]
+        self._data = "".join(filled)
+        self._offsets = array("q", [0])
+        self._offsets.extend(accumulate(map(len, filled)))
+        self._valid = bytearray(map(is_not, values, repeat(None)))
+
+    def __len__(self) -> int:
+        return len(self._valid)
+
+    @overload
+    def __getitem__(self, i: int) -> str | None: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[str | None]: ...
+
+    def __getitem__(self, i: int | slice) -> str | None | list[str | None]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("StringColumn index out of range")
+        if not self._valid[i]:
+            return None
+        return self._data[self._offsets[i] : self._offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[str | None]:
+        data, offsets, valid = self._data, self._offsets, self._valid
+        for i in range(len(valid)):
+            yield data[offsets[i] : offsets[i + 1]] if valid[i] else None
+
+    def is_null(self, i: int) -> bool:
+        return not self._valid[i]
+
+    def empty_rows(self) -> Iterator[int]:
+        """Indices whose value is None or the empty string (no slicing)."""
+        offsets = self._offsets
+        for i in range(len(self._valid)):
+            if offsets[i] == offsets[i + 1]:
+                yield i
+
+
+def _to_ordinal(value: str) -> int:
+    if not _RE_ISO_DATE.match(value):
+        return INVALID_DATE
+    try:
+        return date.fromisoformat(value).toordinal()
+    except ValueError:  # e.g. 2024-02-30
+        return INVALID_DATE
+
+
+def _date_ordinals(values: list[str | None]) -> array[int]:
+    # Only a few hundred distinct dates: convert each once, then map
+    memo: dict[str | None, int] = {None: NULL_DATE}
+    for value in set(values):
+        if value is not None:
+            memo[value] = _to_ordinal(value)
+    return array("i", map(memo.__getitem__, values))
+
+
+class ColumnarView:
+    """Per-field arrays over a list of ScheinfirmaRecord."""
+
+    def __init__(self, records: Sequence[ScheinfirmaRecord]) -> None:
+        self._len = len(records)
+        self.strings: dict[str, StringColumn] = {}
+        self.dates: dict[str, array[int]] = {}
+        for name in FIELDS:
+            values = list(map(attrgetter(name), records))
+            self.strings[name] = StringColumn(values)
+            if name in DATE_FIELDS:
+                self.dates[name] = _date_ordinals(values)
+
+    @classmethod
+    def from_result(cls, result: ParseResult) -> ColumnarView:
+        return cls(result.records)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def column(self, name: str) -> StringColumn:
+        """String column of a field (raises KeyError for unknown fields)."""
+        return self.strings[name]
+
+    def date_ordinals(self, name: str) -> array[int]:
+        """Day ordinals of a date field (see :data:`NULL_DATE`, :data:`INVALID_DATE`)."""
+        return self.dates[name]
+
+    def record(self, i: int) -> ScheinfirmaRecord:
+        """Rebuild the i-th record."""
+        values: dict[str, Any] = {name: self.strings[name][i] for name in FIELDS}
+        return ScheinfirmaRecord(**values)
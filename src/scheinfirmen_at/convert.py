@@ -1,16 +1,25 @@
 # Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
 # SPDX-License-Identifier: Apache-2.0
 
-"""Convert Scheinfirma records to CSV, JSONL, and XML output formats."""
+"""Convert Scheinfirma records to CSV, JSONL, XML, SQLite, Parquet and Feather output formats."""
+
+from __future__ import annotations
 
 import csv
 import json
-import xml.etree.ElementTree as ET
-from dataclasses import asdict
+import re
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
+from typing import Any, Protocol, TextIO
 
+from scheinfirmen_at.columnar import DATE_FIELDS, INVALID_DATE, NULL_DATE, ColumnarView
 from scheinfirmen_at.download import BMF_URL
 from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+from scheinfirmen_at.publish import atomic_write_bytes, atomic_write_text
+from scheinfirmen_at.schema import SQLITE_DDL, SQLITE_INDEXES
 
 # Human-readable German header names for CSV output
 CSV_HEADERS = [
@@ -26,7 +35,7 @@ CSV_HEADERS = [
 ]
 
 # Mapping from dataclass field names to CSV/JSON keys
-_FIELD_ORDER = [
+FIELD_ORDER = [
     "name",
     "anschrift",
     "veroeffentlicht",
@@ -39,10 +48,198 @@ _FIELD_ORDER = [
 ]
 
 
-def _record_to_dict(rec: ScheinfirmaRecord) -> dict[str, str | None]:
-    """Convert a ScheinfirmaRecord to an ordered dict."""
-    d = asdict(rec)
-    return {k: d[k] for k in _FIELD_ORDER}
+def record_to_dict(rec: ScheinfirmaRecord) -> dict[str, str | None]:
+    """Convert a ScheinfirmaRecord to an ordered dict (flat, no deep copy)."""
+    return {k: getattr(rec, k) for k in FIELD_ORDER}
+
+
+_JSON_SCHEMA_URL = (
+    "https://raw.githubusercontent.com/arjoma/scheinfirmen-at/main/data/scheinfirmen.json-schema.json"
+)
+_XSD_URL = "https://raw.githubusercontent.com/arjoma/scheinfirmen-at/main/data/scheinfirmen.xsd"
+
+
+@dataclass
+class OutputMeta:
+    """Header information every output format records once per file."""
+
+    stand_datum: str  # ISO 8601: YYYY-MM-DD
+    stand_zeit: str  # HH:MM:SS
+    count: int  # number of records in the source
+
+    @classmethod
+    def from_result(cls, result: ParseResult) -> OutputMeta:
+        return cls(result.stand_datum, result.stand_zeit, result.raw_row_count)
+
+
+class RecordSink(Protocol):
+    """An output format fed by :func:`write_records`.
+
+    ``open`` is called once before the first record, ``write`` once per
+    record with the converted row (field name → value, in output field
+    order; shared between sinks, do not modify), ``close`` once at the end.
+    """
+
+    def open(self, meta: OutputMeta) -> None: ...
+
+    def write(self, row: dict[str, str | None]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def write_records(
+    records: Iterable[ScheinfirmaRecord], meta: OutputMeta, sinks: Sequence[RecordSink]
+) -> int:
+    """Convert each record once and stream it to all ``sinks`` in one pass.
+
+    ``records`` may be any iterable, e.g. a generator; it is consumed once.
+    Returns number of records written.
+    """
+    for sink in sinks:
+        sink.open(meta)
+    n = 0
+    try:
+        for rec in records:
+            row = record_to_dict(rec)
+            for sink in sinks:
+                sink.write(row)
+            n += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+    return n
+
+
+class CsvSink:
+    """UTF-8 CSV with BOM (Excel), German header row; None → empty field."""
+
+    def __init__(self, output: str | Path) -> None:
+        self.path = Path(output)
+        self._file: TextIO | None = None
+        self._writer: Any = None
+
+    def open(self, meta: OutputMeta) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8-sig", newline="")
+        self._writer = csv.writer(self._file, quoting=csv.QUOTE_MINIMAL)
+        self._writer.writerow(CSV_HEADERS)
+
+    def write(self, row: dict[str, str | None]) -> None:
+        self._writer.writerow([v if v is not None else "" for v in row.values()])
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonlSink:
+    """JSONL: metadata object on the first line, then one object per record."""
+
+    def __init__(self, output: str | Path) -> None:
+        self.path = Path(output)
+        self._file: TextIO | None = None
+
+    def open(self, meta: OutputMeta) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        metadata = {
+            "$schema": _JSON_SCHEMA_URL,
+            "_metadata": {
+                "stand": f"{meta.stand_datum}T{meta.stand_zeit}",
+                "source": BMF_URL,
+                "count": meta.count,
+            },
+        }
+        self._file.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+
+    def write(self, row: dict[str, str | None]) -> None:
+        assert self._file is not None
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _xml_escape_text(text: str) -> str:
+    # Same replacements, in the same order, as ElementTree's serializer
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _xml_escape_attr(text: str) -> str:
+    text = _xml_escape_text(text)
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+class XmlSink:
+    """Pretty-printed XML, streamed one <scheinfirma> line at a time.
+
+    The output is byte-identical to building the tree with ElementTree,
+    running ``ET.indent(root, space="  ")`` and writing it with an XML
+    declaration: same quoting, escaping, attribute order and self-closing
+    tags for empty elements. Memory use does not grow with the record count.
+    """
+
+    def __init__(self, output: str | Path) -> None:
+        self.path = Path(output)
+        self._file: TextIO | None = None
+        self._count = 0
+
+    def open(self, meta: OutputMeta) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # newline="\n" and xmlcharrefreplace as in ElementTree.write()
+        self._file = self.path.open(
+            "w", encoding="utf-8", errors="xmlcharrefreplace", newline="\n"
+        )
+        root_attribs = {
+            "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+            "xsi:noNamespaceSchemaLocation": _XSD_URL,
+            "stand": meta.stand_datum,
+            "zeit": meta.stand_zeit,
+            "quelle": BMF_URL,
+            "anzahl": str(meta.count),
+        }
+        self._file.write("<?xml version='1.0' encoding='utf-8'?>\n<scheinfirmen")
+        # The start tag is finished by the first record (">") or close() (" />")
+        self._file.write(self._attributes(root_attribs))
+        self._count = 0
+
+    @staticmethod
+    def _attributes(attribs: dict[str, str]) -> str:
+        return "".join(f' {k}="{_xml_escape_attr(v)}"' for k, v in attribs.items())
+
+    def write(self, row: dict[str, str | None]) -> None:
+        assert self._file is not None
+        attribs = {k: v for k, v in row.items() if k != "name" and v is not None}
+        name = row["name"]
+        element = f"<scheinfirma{self._attributes(attribs)}"
+        if name:
+            element += f">{_xml_escape_text(name)}</scheinfirma>"
+        else:
+            element += " />"
+        self._file.write((">\n  " if self._count == 0 else "\n  ") + element)
+        self._count += 1
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.write("\n</scheinfirmen>" if self._count else " />")
+        self._file.close()
+        self._file = None
 
 
 def write_csv(result: ParseResult, output: str | Path) -> int:
@@ -55,18 +252,7 @@ def write_csv(result: ParseResult, output: str | Path) -> int:
 
     Returns number of data rows written.
     """
-    path = Path(output)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    with path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
-        writer.writerow(CSV_HEADERS)
-
-        for rec in result.records:
-            row = [v if v is not None else "" for v in _record_to_dict(rec).values()]
-            writer.writerow(row)
-
-    return len(result.records)
+    return write_records(result.records, OutputMeta.from_result(result), [CsvSink(output)])
 
 
 def write_jsonl(result: ParseResult, output: str | Path) -> int:
@@ -78,25 +264,7 @@ def write_jsonl(result: ParseResult, output: str | Path) -> int:
 
     Returns number of data rows written.
     """
-    path = Path(output)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    with path.open("w", encoding="utf-8") as f:
-        metadata = {
-            "$schema": "https://raw.githubusercontent.com/arjoma/scheinfirmen-at/main/data/scheinfirmen.json-schema.json",
-            "_metadata": {
-                "stand": f"{result.stand_datum}T{result.stand_zeit}",
-                "source": BMF_URL,
-                "count": result.raw_row_count,
-            },
-        }
-        f.write(json.dumps(metadata, ensure_ascii=False) + "\n")
-
-        for rec in result.records:
-            obj = _record_to_dict(rec)
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-
-    return len(result.records)
+    return write_records(result.records, OutputMeta.from_result(result), [JsonlSink(output)])
 
 
 def write_xml(result: ParseResult, output: str | Path) -> int:
@@ -115,33 +283,251 @@ def write_xml(result: ParseResult, output: str | Path) -> int:
 
     Returns number of records written.
     """
+    return write_records(result.records, OutputMeta.from_result(result), [XmlSink(output)])
+
+
+def write_sqlite(result: ParseResult, output: str | Path) -> int:
+    """Write records to an SQLite database file.
+
+    Schema (see ``schema.SQLITE_DDL``):
+    - ``scheinfirmen``: one row per record, columns in output field order,
+      None → NULL; B-tree indexes on uid, fbnr, kennziffer, name and
+      veroeffentlicht for cheap point lookups
+    - ``metadata``: key/value rows for ``stand``, ``source`` and ``count``
+
+    An existing file at ``output`` is replaced. Returns number of records written.
+    """
     path = Path(output)
     path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
 
-    root = ET.Element("scheinfirmen")
-    root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
-    root.set(
-        "xsi:noNamespaceSchemaLocation",
-        "https://raw.githubusercontent.com/arjoma/scheinfirmen-at/main/data/scheinfirmen.xsd",
-    )
-    root.set("stand", result.stand_datum)
-    root.set("zeit", result.stand_zeit)
-    root.set("quelle", BMF_URL)
-    root.set("anzahl", str(result.raw_row_count))
-
-    for rec in result.records:
-        attribs = {}
-        for field_name, value in _record_to_dict(rec).items():
-            if field_name == "name" or value is None:
-                continue
-            attribs[field_name] = value
-        elem = ET.SubElement(root, "scheinfirma", attribs)
-        elem.text = rec.name
-
-    ET.indent(root, space="  ")
-    tree = ET.ElementTree(root)
-
-    with path.open("wb") as f:
-        tree.write(f, encoding="utf-8", xml_declaration=True)
+    columns = ", ".join(FIELD_ORDER)
+    placeholders = ", ".join("?" for _ in FIELD_ORDER)
+    con = sqlite3.connect(path)
+    try:
+        with con:
+            con.executescript(SQLITE_DDL)
+            con.executemany(
+                f"INSERT INTO scheinfirmen ({columns}) VALUES ({placeholders})",
+                (tuple(record_to_dict(rec).values()) for rec in result.records),
+            )
+            con.executemany(
+                "INSERT INTO metadata (key, value) VALUES (?, ?)",
+                [
+                    ("stand", f"{result.stand_datum}T{result.stand_zeit}"),
+                    ("source", BMF_URL),
+                    ("count", str(result.raw_row_count)),
+                ],
+            )
+            # Build indexes after the bulk insert (cheaper than maintaining them)
+            con.executescript(SQLITE_INDEXES)
+        con.execute("ANALYZE")
+    finally:
+        con.close()
+
+    return len(result.records)
+
+
+# "1100 Wien, Quellenstraße 145" → PLZ "1100", Ort "Wien"
+_RE_PLZ_ORT = re.compile(r"^(\d{4,5})\s+([^,]+?)\s*,")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def import_pyarrow() -> Any:
+    """Import the optional pyarrow dependency, or raise ImportError with an install hint."""
+    try:
+        import pyarrow  # type: ignore[import-not-found,import-untyped,unused-ignore]
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet/Feather output requires pyarrow: pip install 'scheinfirmen-at[parquet]'"
+        ) from exc
+    return pyarrow
+
+
+def split_anschrift(anschrift: str | None) -> tuple[str | None, str | None]:
+    """Split the leading "PLZ Ort," of an address; (None, None) if it has none."""
+    m = _RE_PLZ_ORT.match(anschrift or "")
+    return (m.group(1), m.group(2)) if m else (None, None)
+
+
+def _arrow_table(result: ParseResult, columns: ColumnarView | None = None) -> Any:
+    """Build a typed pyarrow Table: date32 dates, dictionary-encoded PLZ/Ort,
+    Stand/source/count in the schema's key-value metadata."""
+    pa = import_pyarrow()
+    view = columns if columns is not None else ColumnarView.from_result(result)
+
+    names: list[str] = []
+    arrays: list[Any] = []
+    for name in FIELD_ORDER:
+        if name in DATE_FIELDS:
+            ordinals = view.date_ordinals(name)
+            if INVALID_DATE in ordinals:
+                i = ordinals.index(INVALID_DATE)
+                value = view.column(name)[i]
+                raise ValueError(f"Row {i + 1} [{name}]: not an ISO date: {value!r}")
+            days = [o - _EPOCH_ORDINAL if o != NULL_DATE else None for o in ordinals]
+            arrays.append(pa.array(days, type=pa.date32()))
+        else:
+            arrays.append(pa.array(list(view.column(name)), type=pa.string()))
+        names.append(name)
+        if name == "anschrift":
+            parts = [split_anschrift(a) for a in view.column(name)]
+            arrays.append(pa.array([p[0] for p in parts], type=pa.string()).dictionary_encode())
+            arrays.append(pa.array([p[1] for p in parts], type=pa.string()).dictionary_encode())
+            names.extend(["plz", "ort"])
+
+    metadata = {
+        "stand": f"{result.stand_datum}T{result.stand_zeit}",
+        "source": BMF_URL,
+        "count": str(result.raw_row_count),
+    }
+    return pa.Table.from_arrays(arrays, names=names, metadata=metadata)
+
+
+def write_parquet(
+    result: ParseResult, output: str | Path, columns: ColumnarView | None = None
+) -> int:
+    """Write records to a Parquet file (zstd-compressed).
+
+    Columns are typed: the four date fields are ``date32``, ``plz`` and
+    ``ort`` (split from the address) are dictionary-encoded, everything else
+    is a nullable string. The schema metadata carries ``stand``, ``source``
+    and ``count``. Requires the optional ``pyarrow`` dependency
+    (``pip install 'scheinfirmen-at[parquet]'``).
+
+    ``columns`` may pass a prebuilt :class:`ColumnarView` of ``result``;
+    otherwise one is built here.
+
+    Returns number of records written.
+    """
+    table = _arrow_table(result, columns)
+    import pyarrow.parquet as pq  # type: ignore[import-not-found,import-untyped,unused-ignore]
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, compression="zstd")
+    return len(result.records)
+
+
+def write_feather(
+    result: ParseResult, output: str | Path, columns: ColumnarView | None = None
+) -> int:
+    """Write records to an Arrow IPC (Feather v2) file, same schema as Parquet.
+
+    ``columns`` works as for :func:`write_parquet`.
+
+    Returns number of records written.
+    """
+    table = _arrow_table(result, columns)
+    import pyarrow.feather as feather  # type: ignore[import-not-found,import-untyped,unused-ignore]
 
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    feather.write_feather(table, path, compression="zstd")
     return len(result.records)
+
+
+_RE_XML_ROOT_STAND = re.compile(r'(<scheinfirmen\b[^>]*?\sstand=")[^"]*("[^>]*?\szeit=")[^"]*(")')
+
+
+def refresh_stand(
+    jsonl_path: str | Path,
+    xml_path: str | Path,
+    stand_datum: str,
+    stand_zeit: str,
+    *,
+    sqlite_path: str | Path | None = None,
+    parquet_path: str | Path | None = None,
+    feather_path: str | Path | None = None,
+) -> None:
+    """Update only the Stand timestamp in existing outputs.
+
+    Used when the source content is unchanged apart from its timestamp; the
+    records are left untouched. JSONL and XML are always refreshed; the
+    SQLite ``metadata`` table and the Parquet/Feather schema metadata when
+    their paths are given. The CSV output carries no timestamp.
+    """
+    stand = f"{stand_datum}T{stand_zeit}"
+    jsonl = Path(jsonl_path)
+    first, sep, rest = jsonl.read_text(encoding="utf-8").partition("\n")
+    metadata = json.loads(first)
+    metadata["_metadata"]["stand"] = stand
+    atomic_write_text(jsonl, json.dumps(metadata, ensure_ascii=False) + sep + rest)
+
+    xml = Path(xml_path)
+    text = xml.read_bytes().decode("utf-8")
+    text = _RE_XML_ROOT_STAND.sub(
+        lambda m: f"{m.group(1)}{stand_datum}{m.group(2)}{stand_zeit}{m.group(3)}",
+        text,
+        count=1,
+    )
+    atomic_write_text(xml, text)
+
+    if sqlite_path is not None:
+        # One transaction: readers see the old or the new value
+        con = sqlite3.connect(sqlite_path)
+        try:
+            with con:
+                con.execute("UPDATE metadata SET value = ? WHERE key = 'stand'", (stand,))
+        finally:
+            con.close()
+
+    if parquet_path is not None or feather_path is not None:
+        pa = import_pyarrow()
+        import pyarrow.feather as feather  # type: ignore[import-not-found,import-untyped,unused-ignore]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found,import-untyped,unused-ignore]
+
+        def with_stand(table: Any) -> Any:
+            return table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b"stand": stand.encode()}
+            )
+
+        # Arrow files can't be patched in place: rewrite them from memory
+        if parquet_path is not None:
+            sink = pa.BufferOutputStream()
+            pq.write_table(with_stand(pq.read_table(parquet_path)), sink, compression="zstd")
+            atomic_write_bytes(parquet_path, sink.getvalue().to_pybytes())
+        if feather_path is not None:
+            sink = pa.BufferOutputStream()
+            feather.write_feather(
+                with_stand(feather.read_table(feather_path)), sink, compression="zstd"
+            )
+            atomic_write_bytes(feather_path, sink.getvalue().to_pybytes())
+
+
+def parse_jsonl(lines: Iterable[str]) -> ParseResult:
+    """Rebuild a ParseResult from the lines of a JSONL output file.
+
+    The inverse of :func:`write_jsonl`: the ``_metadata`` line supplies the
+    Stand timestamp, every other non-empty line becomes a ScheinfirmaRecord.
+
+    Raises:
+        ValueError: if a line is not valid JSON or the metadata line is missing.
+    """
+    records: list[ScheinfirmaRecord] = []
+    stand: str | None = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        obj = json.loads(line)
+        if "_metadata" in obj:
+            stand = obj["_metadata"].get("stand")
+            continue
+        records.append(ScheinfirmaRecord(**{k: obj.get(k) for k in FIELD_ORDER}))
+
+    if stand is None:
+        raise ValueError("JSONL metadata line (_metadata with stand) not found")
+    stand_datum, _, stand_zeit = stand.partition("T")
+    return ParseResult(
+        records=records,
+        stand_datum=stand_datum,
+        stand_zeit=stand_zeit,
+        raw_row_count=len(records),
+    )
+
+
+def read_jsonl(path: str | Path) -> ParseResult:
+    """Read a JSONL output file (as written by :func:`write_jsonl`)."""
+    with Path(path).open(encoding="utf-8") as f:
+        return parse_jsonl(f)
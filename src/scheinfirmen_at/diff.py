@@ -0,0 +1,181 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare two snapshots of the list: added, removed, and modified records.
+
+Records are matched by a stable identity key (see :func:`record_key`):
+
+1. the UID, if present,
+2. otherwise the Firmenbuch-Nr,
+3. otherwise name plus birth date (natural persons usually have neither).
+
+Both snapshots are bucketed by key in a dict and joined in one pass, so a
+diff is linear in the number of records.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from scheinfirmen_at.convert import FIELD_ORDER, read_jsonl, record_to_dict
+from scheinfirmen_at.download import BMF_URL
+from scheinfirmen_at.index import normalize_fbnr, normalize_uid
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+
+
+def record_key(rec: ScheinfirmaRecord) -> str:
+    """Return the stable identity key of a record."""
+    if rec.uid:
+        return f"uid:{normalize_uid(rec.uid)}"
+    if rec.fbnr:
+        return f"fbnr:{normalize_fbnr(rec.fbnr)}"
+    return f"name:{' '.join(rec.name.casefold().split())}|{rec.geburtsdatum or ''}"
+
+
+def keyed_records(records: Iterable[ScheinfirmaRecord]) -> dict[str, ScheinfirmaRecord]:
+    """Map identity key → record, in input order.
+
+    The BMF list occasionally repeats an identity; the n-th repetition of a
+    key gets a ``#n`` suffix so every row keeps a distinct key.
+    """
+    keyed: dict[str, ScheinfirmaRecord] = {}
+    for rec in records:
+        key = base = record_key(rec)
+        n = 1
+        while key in keyed:
+            n += 1
+            key = f"{base}#{n}"
+        keyed[key] = rec
+    return keyed
+
+
+@dataclass
+class RecordChange:
+    """A record present in both snapshots with different field values."""
+
+    key: str
+    old: ScheinfirmaRecord
+    new: ScheinfirmaRecord
+    fields: list[str]  # names of the fields that differ
+
+
+@dataclass
+class SnapshotDiff:
+    """Differences between an old and a new snapshot."""
+
+    # Keyed like keyed_records(), so repeated identities keep their ``#n`` key
+    added: dict[str, ScheinfirmaRecord]  # in new-snapshot order
+    removed: dict[str, ScheinfirmaRecord]  # in old-snapshot order
+    modified: list[RecordChange]  # in new-snapshot order
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+    def __str__(self) -> str:
+        return (
+            f"+{len(self.added)} added, -{len(self.removed)} removed, "
+            f"~{len(self.modified)} modified"
+        )
+
+
+def diff_records(
+    old: Iterable[ScheinfirmaRecord], new: Iterable[ScheinfirmaRecord]
+) -> SnapshotDiff:
+    """Diff two record sequences by identity key (hash join, linear time)."""
+    old_by_key = keyed_records(old)
+    added: dict[str, ScheinfirmaRecord] = {}
+    modified: list[RecordChange] = []
+    for key, rec in keyed_records(new).items():
+        before = old_by_key.pop(key, None)
+        if before is None:
+            added[key] = rec
+        elif before != rec:
+            fields = [f for f in FIELD_ORDER if getattr(before, f) != getattr(rec, f)]
+            modified.append(RecordChange(key=key, old=before, new=rec, fields=fields))
+    # Whatever was not matched by the new snapshot has been removed
+    return SnapshotDiff(added=added, removed=old_by_key, modified=modified)
+
+
+def diff_results(old: ParseResult, new: ParseResult) -> SnapshotDiff:
+    """Diff two ParseResults."""
+    return diff_records(old.records, new.records)
+
+
+def diff_jsonl(old_path: str | Path, new_path: str | Path) -> SnapshotDiff:
+    """Diff two JSONL output files."""
+    return diff_results(read_jsonl(old_path), read_jsonl(new_path))
+
+
+def change_entries(diff: SnapshotDiff, stand: str) -> list[dict[str, object]]:
+    """Flatten a diff into change entries (the lines of ``changes.jsonl``).
+
+    Each entry has ``op`` (``add``, ``remove`` or ``change``), the ``stand``
+    timestamp of the new snapshot, the identity ``key`` and the ``record``
+    (the new version; the old one for removals). Changes also carry the
+    list of changed ``fields``. Keys are those of :func:`keyed_records`, so
+    a repeated identity is addressed by its ``#n`` key in every operation.
+    """
+    entries: list[dict[str, object]] = []
+    for key, rec in diff.removed.items():
+        entries.append(
+            {"op": "remove", "stand": stand, "key": key, "record": record_to_dict(rec)}
+        )
+    for change in diff.modified:
+        entries.append(
+            {
+                "op": "change",
+                "stand": stand,
+                "key": change.key,
+                "fields": change.fields,
+                "record": record_to_dict(change.new),
+            }
+        )
+    for key, rec in diff.added.items():
+        entries.append(
+            {"op": "add", "stand": stand, "key": key, "record": record_to_dict(rec)}
+        )
+    return entries
+
+
+def write_changes(
+    diff: SnapshotDiff,
+    output: str | Path,
+    stand: str,
+    previous_stand: str | None = None,
+) -> int:
+    """Write a diff as a JSONL delta file.
+
+    Format:
+    - Line 1: metadata object (``_metadata``: stand, previous_stand, source,
+      and the number of added/removed/changed records)
+    - Lines 2+: one change entry per line (see :func:`change_entries`),
+      removals first, then changes, then additions
+
+    ``stand`` and ``previous_stand`` are ISO timestamps (``YYYY-MM-DDTHH:MM:SS``);
+    ``previous_stand`` is None when there was no previous snapshot.
+    Returns number of change entries written.
+    """
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries = change_entries(diff, stand)
+    with path.open("w", encoding="utf-8") as f:
+        metadata = {
+            "_metadata": {
+                "stand": stand,
+                "previous_stand": previous_stand,
+                "source": BMF_URL,
+                "added": len(diff.added),
+                "removed": len(diff.removed),
+                "changed": len(diff.modified),
+            },
+        }
+        f.write(json.dumps(metadata, ensure_ascii=False) + "\n")
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    return len(entries)
@@ -3,14 +3,27 @@
 
 """Download BMF Scheinfirmen CSV data."""
 
+import hashlib
+import json
 import time
 import urllib.error
 import urllib.request
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from email.message import Message
+from http.client import HTTPResponse
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_version
+from pathlib import Path
+from typing import TypeVar
 
 BMF_URL = "https://service.bmf.gv.at/service/allg/lsu/__Gen_Csv.asp"
 
+# Read size for streaming downloads
+CHUNK_SIZE = 64 * 1024
+
+_T = TypeVar("_T")
+
 
 def _get_user_agent() -> str:
     try:
@@ -23,15 +36,103 @@ def _get_user_agent() -> str:
 _USER_AGENT = _get_user_agent()
 
 
-def download_csv(
-    url: str = BMF_URL,
-    retries: int = 3,
-    delay: float = 5.0,
-    timeout: float = 30.0,
-) -> bytes:
-    """Download raw CSV bytes from the given URL.
+class NotModifiedError(Exception):
+    """The server answered 304 Not Modified to a conditional request."""
+
+
+@dataclass
+class CacheEntry:
+    """HTTP validators remembered for one URL."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+
+
+class HttpCache:
+    """On-disk store of ETag/Last-Modified validators, keyed by URL.
+
+    Validators from a successful response are only *staged* by the download
+    functions; call :meth:`commit` once the payload has been fully processed.
+    Otherwise a run that fails after the download (e.g. validation errors)
+    would be skipped as "not modified" on the next attempt.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._staged: dict[str, CacheEntry] = {}
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{key}.json"
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the stored validators for ``url``, or None."""
+        try:
+            data = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("url") != url:
+            return None
+        return CacheEntry(
+            url=url, etag=data.get("etag"), last_modified=data.get("last_modified")
+        )
+
+    def discard(self, url: str) -> None:
+        """Forget the validators for ``url`` (forces a full download)."""
+        self._path(url).unlink(missing_ok=True)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for ``url``."""
+        entry = self.get(url)
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def stage(self, url: str, headers: Message) -> None:
+        """Remember the validators of a 200 response until :meth:`commit`."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self._staged[url] = CacheEntry(url=url, etag=etag, last_modified=last_modified)
+
+    def commit(self) -> None:
+        """Persist all staged validators to disk."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for url, entry in self._staged.items():
+            self._path(url).write_text(
+                json.dumps(asdict(entry), ensure_ascii=False) + "\n", encoding="utf-8"
+            )
+        self._staged.clear()
+
+
+def _request(url: str, cache: HttpCache | None = None) -> urllib.request.Request:
+    headers = {"User-Agent": _USER_AGENT}
+    if cache is not None:
+        headers.update(cache.conditional_headers(url))
+    return urllib.request.Request(url, headers=headers)
+
+
+def _urlopen(url: str, timeout: float, cache: HttpCache | None) -> HTTPResponse:
+    """Open ``url``, translating a 304 answer into NotModifiedError."""
+    try:
+        resp: HTTPResponse = urllib.request.urlopen(_request(url, cache), timeout=timeout)
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304:
+            raise NotModifiedError(f"{url} not modified since last download") from exc
+        raise
+    if cache is not None:
+        cache.stage(url, resp.headers)
+    return resp
+
+
+def _with_retries(action: Callable[[], _T], url: str, retries: int, delay: float) -> _T:
+    """Run ``action`` with exponential backoff on network errors.
 
-    Returns raw bytes (ISO-8859-1 encoded as served by BMF).
     Raises RuntimeError after all retries are exhausted.
     """
     last_error: Exception | None = None
@@ -40,11 +141,97 @@ def download_csv(
             wait = delay * (2 ** (attempt - 1))
             time.sleep(wait)
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return resp.read()  # type: ignore[no-any-return]
+            return action()
         except (urllib.error.URLError, OSError) as exc:
             last_error = exc
     raise RuntimeError(
         f"Failed to download {url} after {retries} attempt(s): {last_error}"
     )
+
+
+def download_csv(
+    url: str = BMF_URL,
+    retries: int = 3,
+    delay: float = 5.0,
+    timeout: float = 30.0,
+    cache: HttpCache | None = None,
+) -> bytes:
+    """Download raw CSV bytes from the given URL.
+
+    Returns raw bytes (ISO-8859-1 encoded as served by BMF).
+    Raises RuntimeError after all retries are exhausted.
+
+    With a ``cache``, a conditional request is sent and NotModifiedError is
+    raised when the server reports the content as unchanged.
+    """
+
+    def fetch() -> bytes:
+        with _urlopen(url, timeout, cache) as resp:
+            return resp.read()
+
+    return _with_retries(fetch, url, retries, delay)
+
+
+def stream_csv(
+    url: str = BMF_URL,
+    retries: int = 3,
+    delay: float = 5.0,
+    timeout: float = 30.0,
+    chunk_size: int = CHUNK_SIZE,
+    cache: HttpCache | None = None,
+) -> "DownloadStream":
+    """Open the given URL and return an iterator over raw CSV byte chunks.
+
+    The connection is established eagerly (with the same retry/backoff as
+    :func:`download_csv`), so connection failures raise RuntimeError from
+    this call. Once bytes are flowing a failed read cannot be retried
+    without re-sending data the consumer has already seen; it is raised as
+    RuntimeError from the iterator instead.
+
+    The returned :class:`DownloadStream` holds the open connection until it
+    is exhausted or closed; use it as a context manager (or call
+    ``close()``) so the connection is released even if it is never read.
+
+    Intended to be piped into :func:`scheinfirmen_at.parse.parse_bmf_csv_iter`
+    so parsing overlaps with the download. ``cache`` works as for
+    :func:`download_csv`; NotModifiedError is raised from this call.
+    """
+    resp = _with_retries(lambda: _urlopen(url, timeout, cache), url, retries, delay)
+    return DownloadStream(resp, url, chunk_size)
+
+
+class DownloadStream:
+    """Iterator over the body of an open HTTP response, in chunks."""
+
+    def __init__(self, resp: HTTPResponse, url: str, chunk_size: int = CHUNK_SIZE) -> None:
+        self._resp: HTTPResponse | None = resp
+        self.url = url
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        if self._resp is None:
+            raise StopIteration
+        try:
+            chunk = self._resp.read(self.chunk_size)
+        except OSError as exc:
+            self.close()
+            raise RuntimeError(f"Download of {self.url} interrupted: {exc}") from exc
+        if not chunk:
+            self.close()
+            raise StopIteration
+        return chunk
+
+    def close(self) -> None:
+        """Close the connection (idempotent)."""
+        if self._resp is not None:
+            resp, self._resp = self._resp, None
+            resp.close()
+
+    def __enter__(self) -> "DownloadStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
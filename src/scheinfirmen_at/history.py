@@ -0,0 +1,280 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Append-only history of the list with time-travel queries.
+
+The store is a JSONL file. Each appended snapshot contributes a marker
+line followed by the changes against the previous snapshot::
+
+    {"_snapshot": {"stand": "2026-02-10T09:51:32", "count": 1525}}
+    {"op": "add", "key": "uid:ATU79209223", "at": 17, "record": {...}}
+    {"op": "change", "key": "uid:ATU78016816", "record": {...}}
+    {"op": "remove", "key": "fbnr:123456a"}
+
+Unchanged records cost nothing, so years of daily snapshots stay small.
+``at`` is the row index of an added record in its snapshot, so the list's
+row order can be rebuilt; if rows that stayed were reordered, the marker
+carries the full key ``order`` instead.
+
+On load the events are folded once into :class:`RecordVersion` intervals
+(``valid_from`` ≤ t < ``valid_to``), and every ``CHECKPOINT_INTERVAL``-th
+snapshot's rows are kept as a checkpoint. :meth:`HistoryStore.as_of`
+starts from the nearest checkpoint and replays at most
+``CHECKPOINT_INTERVAL - 1`` deltas, regardless of how long the history is.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from scheinfirmen_at.convert import FIELD_ORDER, record_to_dict
+from scheinfirmen_at.diff import keyed_records, record_key
+from scheinfirmen_at.index import normalize_uid
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+
+# Snapshots between two full row lists kept in memory
+CHECKPOINT_INTERVAL = 16
+
+
+@dataclass
+class RecordVersion:
+    """One version of a record and the stand interval it was listed in."""
+
+    key: str
+    record: ScheinfirmaRecord
+    valid_from: str  # stand (YYYY-MM-DDTHH:MM:SS) of the first snapshot with it
+    valid_to: str | None  # stand of the first snapshot without it; None = current
+
+    def valid_at(self, stand: str) -> bool:
+        return self.valid_from <= stand and (self.valid_to is None or stand < self.valid_to)
+
+
+@dataclass
+class _Delta:
+    """The changes of one snapshot against the previous one."""
+
+    stand: str
+    order: list[str] | None = None  # full key order if surviving rows were reordered
+    removed: set[str] = field(default_factory=set)
+    # (row index or None for "append", key), in ascending row order
+    added: list[tuple[int | None, str]] = field(default_factory=list)
+    versions: dict[str, RecordVersion] = field(default_factory=dict)  # added or changed
+
+    def reorder(self, keys: list[str]) -> list[str]:
+        """Return this snapshot's row keys given the previous ones (may modify ``keys``)."""
+        if self.order is not None:
+            return list(self.order)
+        if len(self.removed) < 16:
+            for key in self.removed:
+                keys.remove(key)
+        else:
+            keys = [k for k in keys if k not in self.removed]
+        for at, key in self.added:
+            if at is None:
+                keys.append(key)
+            else:
+                keys.insert(at, key)
+        return keys
+
+
+def _record_json(rec: ScheinfirmaRecord) -> str:
+    return json.dumps(record_to_dict(rec), ensure_ascii=False)
+
+
+def snapshot_rows(records: Iterable[ScheinfirmaRecord]) -> dict[str, str]:
+    """Map identity key (see :func:`~scheinfirmen_at.diff.keyed_records`) →
+    record as JSON text, in row order — the input of :meth:`HistoryStore.append_rows`.
+
+    Plain strings are cheap to pickle, so this can be built in a worker
+    process and the parent only compares strings.
+    """
+    return {key: _record_json(rec) for key, rec in keyed_records(records).items()}
+
+
+def _as_stand(when: str | date | datetime) -> str:
+    """Convert a query time to a comparable stand string.
+
+    A bare date means the end of that day, so every snapshot published on
+    it is included.
+    """
+    if isinstance(when, datetime):
+        return when.isoformat(timespec="seconds")
+    if isinstance(when, date):
+        return f"{when.isoformat()}T23:59:59"
+    return f"{when}T23:59:59" if len(when) == 10 else when
+
+
+class HistoryStore:
+    """Versioned record history backed by an append-only JSONL file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.stands: list[str] = []  # all snapshot stands, ascending
+        self.versions: list[RecordVersion] = []  # sorted by valid_from
+        self._deltas: list[_Delta] = []  # one per stand
+        # Rows of every CHECKPOINT_INTERVAL-th snapshot (index i → stand i * interval)
+        self._checkpoints: list[list[RecordVersion]] = []
+        self._keys: list[str] = []  # row keys of the latest snapshot
+        self._current: dict[str, RecordVersion] = {}  # open versions by key
+        self._json: dict[str, str] = {}  # JSON text of open versions (filled lazily)
+        self._by_identity: dict[str, list[RecordVersion]] = {}
+        if self.path.exists():
+            self._load()
+
+    # --- Loading and appending ---
+
+    def _load(self) -> None:
+        delta: _Delta | None = None
+        with self.path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                obj = json.loads(line)
+                if "_snapshot" in obj:
+                    if delta is not None:
+                        self._commit(delta)
+                    meta = obj["_snapshot"]
+                    delta = _Delta(meta["stand"], order=meta.get("order"))
+                    continue
+                if delta is None:
+                    raise ValueError(f"{self.path}:{line_no}: event before first snapshot marker")
+                self._apply(delta, obj)
+        if delta is not None:
+            self._commit(delta)
+
+    def _apply(self, delta: _Delta, event: dict[str, Any]) -> None:
+        key = str(event["key"])
+        previous = self._current.pop(key, None)
+        if previous is not None:
+            previous.valid_to = delta.stand
+        self._json.pop(key, None)
+        if event["op"] == "remove":
+            delta.removed.add(key)
+            return
+        data = event["record"]
+        rec = ScheinfirmaRecord(**{k: data.get(k) for k in FIELD_ORDER})
+        version = RecordVersion(key=key, record=rec, valid_from=delta.stand, valid_to=None)
+        self.versions.append(version)
+        self._current[key] = version
+        self._by_identity.setdefault(record_key(rec), []).append(version)
+        delta.versions[key] = version
+        if event["op"] == "add":
+            delta.added.append((event.get("at"), key))
+
+    def _commit(self, delta: _Delta) -> None:
+        """Finish a snapshot: advance the latest rows and checkpoint if due."""
+        self._keys = delta.reorder(self._keys)
+        if len(self.stands) % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append([self._current[key] for key in self._keys])
+        self.stands.append(delta.stand)
+        self._deltas.append(delta)
+
+    def append(self, result: ParseResult) -> int:
+        """Append a snapshot, storing only its changes. Returns number of events.
+
+        Raises:
+            ValueError: if the snapshot's stand is not newer than the latest one.
+        """
+        stand = f"{result.stand_datum}T{result.stand_zeit}"
+        return self.append_rows(stand, snapshot_rows(result.records))
+
+    def append_rows(self, stand: str, rows: dict[str, str]) -> int:
+        """Append a snapshot given as :func:`snapshot_rows`. Returns number of events.
+
+        Raises:
+            ValueError: if ``stand`` is not newer than the latest one.
+        """
+        if self.stands and stand <= self.stands[-1]:
+            raise ValueError(
+                f"Snapshot stand {stand} is not newer than latest stand {self.stands[-1]}"
+            )
+
+        events: list[dict[str, Any]] = [
+            {"op": "remove", "key": key} for key in self._keys if key not in rows
+        ]
+        for at, (key, text) in enumerate(rows.items()):
+            version = self._current.get(key)
+            if version is None:
+                events.append({"op": "add", "key": key, "at": at, "record": json.loads(text)})
+                continue
+            old = self._json.get(key)
+            if old is None:
+                old = self._json[key] = _record_json(version.record)
+            if old != text:
+                events.append({"op": "change", "key": key, "record": json.loads(text)})
+        marker: dict[str, Any] = {"stand": stand, "count": len(rows)}
+        # Inserting the additions at their row index only restores the order
+        # if the rows that stayed kept their relative order
+        kept_before = [key for key in self._keys if key in rows]
+        kept_after = [key for key in rows if key in self._current]
+        if kept_before != kept_after:
+            marker["order"] = list(rows)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"_snapshot": marker}, ensure_ascii=False) + "\n")
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+        delta = _Delta(stand, order=marker.get("order"))
+        for event in events:
+            self._apply(delta, event)
+            if event["op"] != "remove":
+                self._json[event["key"]] = rows[event["key"]]
+        self._commit(delta)
+        return len(events)
+
+    # --- Queries ---
+
+    @property
+    def latest_stand(self) -> str | None:
+        return self.stands[-1] if self.stands else None
+
+    def as_of(self, when: str | date | datetime) -> ParseResult:
+        """Rebuild the list as published at the latest stand ≤ ``when``.
+
+        Records are returned in the row order of that snapshot.
+
+        Raises:
+            ValueError: if ``when`` is before the first stored snapshot.
+        """
+        t = _as_stand(when)
+        idx = bisect.bisect_right(self.stands, t)
+        if idx == 0:
+            raise ValueError(f"No snapshot at or before {t}")
+        stand = self.stands[idx - 1]
+        checkpoint = (idx - 1) // CHECKPOINT_INTERVAL
+        rows = self._checkpoints[checkpoint]
+        keys = [v.key for v in rows]
+        versions = {v.key: v for v in rows}
+        for delta in self._deltas[checkpoint * CHECKPOINT_INTERVAL + 1 : idx]:
+            keys = delta.reorder(keys)
+            versions.update(delta.versions)
+        records = [versions[key].record for key in keys]
+        stand_datum, _, stand_zeit = stand.partition("T")
+        return ParseResult(
+            records=records,
+            stand_datum=stand_datum,
+            stand_zeit=stand_zeit,
+            raw_row_count=len(records),
+        )
+
+    def versions_of(self, identity: str) -> list[RecordVersion]:
+        """All versions of a record by identity key (see diff.record_key)."""
+        return list(self._by_identity.get(identity, []))
+
+    def was_listed(self, uid: str, when: str | date | datetime) -> bool:
+        """Was a record with this UID on the list at the latest stand ≤ ``when``?"""
+        t = _as_stand(when)
+        idx = bisect.bisect_right(self.stands, t)
+        if idx == 0:
+            return False
+        stand = self.stands[idx - 1]
+        return any(v.valid_at(stand) for v in self.versions_of(f"uid:{normalize_uid(uid)}"))
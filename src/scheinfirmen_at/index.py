@@ -0,0 +1,118 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-memory lookup index for screening UIDs, Firmenbuch and Kennziffer values.
+
+Build a :class:`ScheinfirmenIndex` once from a ParseResult or a JSONL output
+file; every lookup afterwards is a single dict access on a normalized key.
+
+Example::
+
+    index = ScheinfirmenIndex.from_jsonl("data/scheinfirmen.jsonl")
+    if index.by_uid("atu 7920 9223"):
+        ...  # listed as Scheinfirma
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from scheinfirmen_at.convert import read_jsonl
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+
+# Lookup kinds accepted by ScheinfirmenIndex.lookup_many()
+KINDS = ("uid", "fbnr", "kennziffer")
+
+
+def normalize_uid(value: str) -> str:
+    """Normalize a UID for lookup: remove all whitespace, uppercase."""
+    return "".join(value.split()).upper()
+
+
+def normalize_fbnr(value: str) -> str:
+    """Normalize a Firmenbuch-Nr: remove whitespace and an ``FN`` prefix, lowercase."""
+    key = "".join(value.split()).lower()
+    return key[2:] if key.startswith("fn") else key
+
+
+def normalize_kennziffer(value: str) -> str:
+    """Normalize a Kennziffer: remove all whitespace, uppercase."""
+    return "".join(value.split()).upper()
+
+
+_NORMALIZERS: dict[str, Callable[[str], str]] = {
+    "uid": normalize_uid,
+    "fbnr": normalize_fbnr,
+    "kennziffer": normalize_kennziffer,
+}
+
+
+class ScheinfirmenIndex:
+    """Hash index over Scheinfirma records by UID, Firmenbuch-Nr and Kennziffer.
+
+    Each lookup returns a tuple of matching records (empty if not listed);
+    a tuple because the BMF list occasionally contains the same identifier
+    on more than one row. Keys are computed at build time, so build the
+    index after :func:`~scheinfirmen_at.normalize.normalize_field_swaps`.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[ScheinfirmaRecord],
+        stand_datum: str | None = None,
+        stand_zeit: str | None = None,
+    ) -> None:
+        self.stand_datum = stand_datum
+        self.stand_zeit = stand_zeit
+        self.records = list(records)
+        self._maps: dict[str, dict[str, tuple[ScheinfirmaRecord, ...]]] = {}
+        for kind, normalize in _NORMALIZERS.items():
+            buckets: dict[str, list[ScheinfirmaRecord]] = {}
+            for rec in self.records:
+                value = getattr(rec, kind)
+                if value:
+                    buckets.setdefault(normalize(value), []).append(rec)
+            self._maps[kind] = {k: tuple(v) for k, v in buckets.items()}
+
+    @classmethod
+    def from_result(cls, result: ParseResult) -> ScheinfirmenIndex:
+        """Build an index from a ParseResult."""
+        return cls(result.records, result.stand_datum, result.stand_zeit)
+
+    @classmethod
+    def from_jsonl(cls, path: str | Path) -> ScheinfirmenIndex:
+        """Build an index from a JSONL output file."""
+        return cls.from_result(read_jsonl(path))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def by_uid(self, uid: str) -> tuple[ScheinfirmaRecord, ...]:
+        """Return records with the given UID (case and whitespace insensitive)."""
+        return self._maps["uid"].get(normalize_uid(uid), ())
+
+    def by_fbnr(self, fbnr: str) -> tuple[ScheinfirmaRecord, ...]:
+        """Return records with the given Firmenbuch-Nr (``FN`` prefix optional)."""
+        return self._maps["fbnr"].get(normalize_fbnr(fbnr), ())
+
+    def by_kennziffer(self, kennziffer: str) -> tuple[ScheinfirmaRecord, ...]:
+        """Return records with the given Kennziffer des UR."""
+        return self._maps["kennziffer"].get(normalize_kennziffer(kennziffer), ())
+
+    def lookup_many(
+        self, values: Iterable[str], kind: str = "uid"
+    ) -> dict[str, tuple[ScheinfirmaRecord, ...]]:
+        """Look up a batch of identifiers of one kind.
+
+        Returns a dict mapping each input value (as given) to its matches,
+        in input order; values without a match map to an empty tuple.
+
+        Raises:
+            ValueError: if ``kind`` is not one of ``KINDS``.
+        """
+        if kind not in _NORMALIZERS:
+            raise ValueError(f"Unknown lookup kind {kind!r} (expected one of {KINDS})")
+        normalize = _NORMALIZERS[kind]
+        get = self._maps[kind].get
+        return {value: get(normalize(value), ()) for value in values}
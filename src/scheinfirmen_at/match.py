@@ -0,0 +1,177 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Fuzzy matching of supplier names and addresses against the Scheinfirmen list.
+
+Suppliers often show up without a UID, so they have to be screened by name
+and address. Both are normalized into comparable token strings:
+
+1. Case folding, umlaut folding (``ä`` → ``ae``, ``ß`` → ``ss``) and removal
+   of remaining accents (``ř`` → ``r``).
+2. Dots are dropped so abbreviations collapse (``Ges.m.b.H.`` → ``gesmbh``,
+   ``e.U.`` → ``eu``); all other punctuation separates tokens.
+3. Names only: legal-form tokens such as GmbH, KG, OG or e.U. are removed,
+   so ``Muster Bau GmbH`` and ``Muster Bau KG`` compare as equal.
+
+Each normalized string is split into character trigrams. A
+:class:`NameMatcher` keeps an inverted index from trigram to record
+positions, so a query only scores the records sharing at least one
+trigram. The score is the Jaccard similarity of the trigram sets
+(1.0 = identical after normalization).
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from scheinfirmen_at.convert import read_jsonl
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+
+# Legal-form tokens (after dot removal and folding) that carry no identity
+LEGAL_FORMS = frozenset(
+    {
+        "ag", "bv", "co", "doo", "eg", "eu", "gbr", "gesmbh", "gmbh", "inc", "kft",
+        "kg", "keg", "ltd", "limited", "og", "oeg", "sa", "sarl", "se", "srl",
+        "sro", "ug",
+    }
+)
+
+# Weight of the name score when an address is also compared
+NAME_WEIGHT = 0.7
+
+_FOLD = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_RE_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def _fold(value: str) -> str:
+    folded = value.casefold().translate(_FOLD).replace(".", "")
+    decomposed = unicodedata.normalize("NFKD", folded)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_name(value: str) -> str:
+    """Normalize a company or person name for fuzzy comparison."""
+    tokens = _RE_NON_ALNUM.sub(" ", _fold(value)).split()
+    kept = [t for t in tokens if t not in LEGAL_FORMS]
+    # A name consisting only of a legal form keeps it rather than vanishing
+    return " ".join(kept or tokens)
+
+
+def normalize_address(value: str) -> str:
+    """Normalize an address (``PLZ Ort, Straße Nr``) for fuzzy comparison."""
+    tokens = _RE_NON_ALNUM.sub(" ", _fold(value)).split()
+    # Expand the common "str." abbreviation so "Hauptstr." matches "Hauptstraße"
+    return " ".join(t + "asse" if t.endswith("str") else t for t in tokens)
+
+
+def trigrams(normalized: str) -> frozenset[str]:
+    """Return the set of character trigrams of a normalized string.
+
+    The string is padded with two leading and one trailing blank, so short
+    words and word starts get their own trigrams.
+    """
+    if not normalized:
+        return frozenset()
+    padded = f"  {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+@dataclass
+class MatchCandidate:
+    """A ranked fuzzy match for one query."""
+
+    record: ScheinfirmaRecord
+    score: float  # combined score in [0, 1]
+    name_score: float
+    address_score: float | None  # None when no address was queried
+
+
+class NameMatcher:
+    """Trigram index over record names (and addresses) for fuzzy screening."""
+
+    def __init__(self, records: Iterable[ScheinfirmaRecord]) -> None:
+        self.records = list(records)
+        self._name_grams = [trigrams(normalize_name(r.name)) for r in self.records]
+        self._addr_grams = [trigrams(normalize_address(r.anschrift)) for r in self.records]
+        self._postings: dict[str, list[int]] = {}
+        for pos, grams in enumerate(self._name_grams):
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(pos)
+
+    @classmethod
+    def from_result(cls, result: ParseResult) -> NameMatcher:
+        """Build a matcher from a ParseResult."""
+        return cls(result.records)
+
+    @classmethod
+    def from_jsonl(cls, path: str | Path) -> NameMatcher:
+        """Build a matcher from a JSONL output file."""
+        return cls(read_jsonl(path).records)
+
+    def search(
+        self,
+        name: str,
+        anschrift: str | None = None,
+        limit: int = 10,
+        min_score: float = 0.5,
+    ) -> list[MatchCandidate]:
+        """Return up to ``limit`` candidates with ``score >= min_score``, best first.
+
+        Without ``anschrift`` the score is the name similarity. With it, the
+        score is ``NAME_WEIGHT * name + (1 - NAME_WEIGHT) * address``.
+        """
+        query = trigrams(normalize_name(name))
+        if not query:
+            return []
+        addr_query = trigrams(normalize_address(anschrift)) if anschrift else None
+
+        # Count shared trigrams per record via the inverted index
+        shared: dict[int, int] = {}
+        for gram in query:
+            for pos in self._postings.get(gram, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+
+        candidates: list[MatchCandidate] = []
+        for pos, common in shared.items():
+            name_score = common / (len(query) + len(self._name_grams[pos]) - common)
+            if addr_query is None:
+                address_score = None
+                score = name_score
+            elif NAME_WEIGHT * name_score + (1 - NAME_WEIGHT) < min_score:
+                continue  # cannot reach min_score even with a perfect address
+            else:
+                address_score = _jaccard(addr_query, self._addr_grams[pos])
+                score = NAME_WEIGHT * name_score + (1 - NAME_WEIGHT) * address_score
+            if score >= min_score:
+                candidates.append(
+                    MatchCandidate(self.records[pos], score, name_score, address_score)
+                )
+
+        candidates.sort(key=lambda c: (-c.score, c.record.name))
+        return candidates[:limit]
+
+    def match_many(
+        self,
+        queries: Iterable[tuple[str, str | None]],
+        limit: int = 10,
+        min_score: float = 0.5,
+    ) -> list[list[MatchCandidate]]:
+        """Match a batch of ``(name, anschrift)`` pairs, e.g. a supplier master file.
+
+        Returns one candidate list per query, in input order.
+        """
+        return [
+            self.search(name, anschrift, limit=limit, min_score=min_score)
+            for name, anschrift in queries
+        ]
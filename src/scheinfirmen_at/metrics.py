@@ -0,0 +1,158 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-stage timing and memory metrics for the conversion pipeline.
+
+Each pipeline step runs inside :meth:`PipelineMetrics.stage`, which records
+wall time, CPU time, growth of the process' peak RSS and (where known) the
+number of records and bytes handled. The collected metrics can be written
+as JSON or in the Prometheus text exposition format (e.g. for the
+node_exporter textfile collector)::
+
+    metrics = PipelineMetrics()
+    with metrics.stage("parse") as m:
+        result = parse_bmf_csv(raw)
+        m.records = len(result.records)
+    metrics.write_json("metrics.json")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from scheinfirmen_at.publish import atomic_write_text
+
+logger = logging.getLogger("scheinfirmen_at")
+
+PROMETHEUS_PREFIX = "scheinfirmen"
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+@dataclass
+class StageMetrics:
+    """Measurements for one pipeline step."""
+
+    name: str
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    # Growth of the peak RSS during the step (0 if it stayed below an
+    # earlier peak); None where the platform can't tell
+    peak_rss_delta_bytes: int | None = None
+    records: int | None = None
+    payload_bytes: int | None = None
+
+    @property
+    def records_per_s(self) -> float | None:
+        if self.records is None or self.wall_s <= 0:
+            return None
+        return self.records / self.wall_s
+
+    def to_dict(self) -> dict[str, Any]:
+        rate = self.records_per_s
+        return {
+            "stage": self.name,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "peak_rss_delta_bytes": self.peak_rss_delta_bytes,
+            "records": self.records,
+            "records_per_s": round(rate, 1) if rate is not None else None,
+            "payload_bytes": self.payload_bytes,
+        }
+
+
+class PipelineMetrics:
+    """Collects :class:`StageMetrics` for one CLI run."""
+
+    def __init__(self) -> None:
+        self.stages: list[StageMetrics] = []
+        self.exit_code: int | None = None
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, records: int | None = None) -> Iterator[StageMetrics]:
+        """Measure the enclosed block as stage ``name``.
+
+        The stage is recorded even if the block raises (including
+        ``sys.exit``), so failed runs still report how far they got. Set
+        ``records`` / ``payload_bytes`` on the yielded object when they are
+        only known at the end of the step.
+        """
+        m = StageMetrics(name, records=records)
+        rss_before = peak_rss_bytes()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield m
+        finally:
+            m.wall_s = time.perf_counter() - wall
+            m.cpu_s = time.process_time() - cpu
+            rss_after = peak_rss_bytes()
+            if rss_before is not None and rss_after is not None:
+                m.peak_rss_delta_bytes = rss_after - rss_before
+            self.stages.append(m)
+            logger.debug("%s: %.3f s (CPU %.3f s)", name, m.wall_s, m.cpu_s)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started_at": round(self.started_at, 3),
+            "wall_s": round(time.perf_counter() - self._start, 6),
+            "exit_code": self.exit_code,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": [s.to_dict() for s in self.stages],
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        data = self.to_dict()
+        p = PROMETHEUS_PREFIX
+        lines: list[str] = []
+
+        def gauge(name: str, help_text: str, samples: list[tuple[str, Any]]) -> None:
+            samples = [(labels, v) for labels, v in samples if v is not None]
+            if not samples:
+                return
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} gauge")
+            lines.extend(f"{p}_{name}{labels} {value}" for labels, value in samples)
+
+        gauge("run_timestamp_seconds", "Start time of the run.", [("", data["started_at"])])
+        gauge("run_wall_seconds", "Wall time of the whole run.", [("", data["wall_s"])])
+        gauge("run_exit_code", "Exit status of the run.", [("", data["exit_code"])])
+        gauge("peak_rss_bytes", "Peak resident set size.", [("", data["peak_rss_bytes"])])
+        stages = data["stages"]
+        for key, name, help_text in (
+            ("wall_s", "stage_wall_seconds", "Wall time per pipeline stage."),
+            ("cpu_s", "stage_cpu_seconds", "CPU time per pipeline stage."),
+            ("peak_rss_delta_bytes", "stage_peak_rss_delta_bytes",
+             "Growth of the peak RSS during the stage."),
+            ("records", "stage_records", "Records handled by the stage."),
+            ("records_per_s", "stage_records_per_second", "Record throughput of the stage."),
+            ("payload_bytes", "stage_payload_bytes", "Bytes read by the stage."),
+        ):
+            gauge(name, help_text, [(f'{{stage="{s["stage"]}"}}', s[key]) for s in stages])
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str | Path) -> None:
+        atomic_write_text(path, json.dumps(self.to_dict(), indent=2) + "\n")
+
+    def write_prometheus(self, path: str | Path) -> None:
+        # Written atomically: the textfile collector must never see a partial file
+        atomic_write_text(path, self.to_prometheus())
@@ -3,32 +3,39 @@
 
 """Parse BMF tilde-delimited CSV into structured records."""
 
+from __future__ import annotations
+
+import codecs
+import hashlib
 import html
 import re
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields
 from datetime import datetime
-
-# Expected column names after stripping whitespace
-EXPECTED_HEADERS = [
-    "Name",
-    "Anschrift",
-    "Veröffentlichung",
-    "Rechtskraft Bescheid",
-    "Zeitpunkt als Scheinunternehmen",
-    "Geburts-Datum",
-    "Firmenbuch-Nr",
-    "UID-Nr.",
-    "Kennziffer des UR",
-]
+from typing import Any, BinaryIO
 
 _RE_STAND = re.compile(
     r"^Stand:\s+(\d{2}\.\d{2}\.\d{4})\s+(\d{2}:\d{2}:\d{2})\s*$"
 )
 
+# Read size used when parsing from a binary file object
+CHUNK_SIZE = 64 * 1024
 
-@dataclass
+# Accepted inputs for the streaming parser: a complete payload, an iterable
+# of byte chunks (e.g. a streaming download) or a binary file object.
+BmfSource = bytes | Iterable[bytes] | BinaryIO
+
+
+@dataclass(slots=True)
 class ScheinfirmaRecord:
-    """A single Scheinfirma (shell company or natural person) record."""
+    """A single Scheinfirma (shell company or natural person) record.
+
+    Slotted (no per-instance ``__dict__``) because history and diff work
+    keep several full snapshots in memory. The date fields repeat across
+    thousands of records and are interned, so each distinct date is stored
+    once.
+    """
 
     name: str
     anschrift: str
@@ -40,6 +47,20 @@ class ScheinfirmaRecord:
     uid: str | None  # ATUxxxxxxxx or None
     kennziffer: str | None
 
+    def __post_init__(self) -> None:
+        # Runs for every parsed row, hence unrolled rather than a loop over
+        # getattr/setattr. isinstance: records rebuilt from JSONL are not
+        # validated yet.
+        intern = sys.intern
+        if isinstance(self.veroeffentlicht, str):
+            self.veroeffentlicht = intern(self.veroeffentlicht)
+        if isinstance(self.rechtskraeftig, str):
+            self.rechtskraeftig = intern(self.rechtskraeftig)
+        if isinstance(self.seit, str):
+            self.seit = intern(self.seit)
+        if isinstance(self.geburtsdatum, str):
+            self.geburtsdatum = intern(self.geburtsdatum)
+
 
 @dataclass
 class ParseResult:
@@ -51,8 +72,36 @@ class ParseResult:
     raw_row_count: int  # number of data rows found (before validation)
 
 
-def _convert_date(date_str: str) -> str:
-    """Convert DD.MM.YYYY to YYYY-MM-DD. Raises ValueError on invalid date."""
+# Days per month; February is checked for leap years separately
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Already converted date strings. Publication dates repeat across hundreds
+# of rows, so most lookups hit; the cap only guards against pathological input.
+_DATE_CACHE: dict[str, str] = {}
+_DATE_CACHE_MAX = 100_000
+
+
+def _slice_date(s: str) -> str | None:
+    """Fast path for exactly ``DD.MM.YYYY`` (ASCII digits, year >= 1000).
+
+    Returns None for anything else, including impossible calendar dates,
+    so the caller can fall back to strptime for the canonical result or
+    error message.
+    """
+    if len(s) != 10 or s[2] != "." or s[5] != "." or not s.isascii():
+        return None
+    dd, mm, yyyy = s[0:2], s[3:5], s[6:10]
+    if not (dd.isdigit() and mm.isdigit() and yyyy.isdigit()):
+        return None
+    day, month, year = int(dd), int(mm), int(yyyy)
+    if year < 1000 or not 1 <= month <= 12 or not 1 <= day <= _DAYS_IN_MONTH[month]:
+        return None
+    if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 or year % 400 == 0)):
+        return None
+    return f"{yyyy}-{mm}-{dd}"
+
+
+def _convert_date_strptime(date_str: str) -> str:
     try:
         d = datetime.strptime(date_str.strip(), "%d.%m.%Y")
     except ValueError as exc:
@@ -62,107 +111,335 @@ def _convert_date(date_str: str) -> str:
     return d.strftime("%Y-%m-%d")
 
 
+def _convert_date(date_str: str) -> str:
+    """Convert DD.MM.YYYY to YYYY-MM-DD. Raises ValueError on invalid date."""
+    try:
+        return _DATE_CACHE[date_str]
+    except KeyError:
+        pass
+    # Anything the slicer doesn't accept goes through strptime, which keeps
+    # its (more lenient) parsing and the exact error message
+    iso = _slice_date(date_str.strip()) or _convert_date_strptime(date_str)
+    if len(_DATE_CACHE) < _DATE_CACHE_MAX:
+        _DATE_CACHE[date_str] = iso
+    return iso
+
+
 def _clean_field(value: str) -> str:
     """Strip whitespace and unescape HTML entities."""
-    return html.unescape(value).strip()
+    # Most fields contain no entity at all; html.unescape is comparatively slow
+    return html.unescape(value).strip() if "&" in value else value.strip()
 
 
-def _clean_kennziffer(value: str) -> str | None:
-    """Clean the Kennziffer field: unescape HTML, strip surrounding quotes."""
-    cleaned = html.unescape(value).strip()
+def _strip_quotes(cleaned: str) -> str | None:
+    """Clean the (already unescaped) Kennziffer field: strip surrounding quotes."""
     # Handle &quot;...&quot; wrapping (becomes "..." after unescape)
     cleaned = cleaned.strip('"').strip()
     return cleaned if cleaned else None
 
 
-def parse_bmf_csv(raw_data: bytes, encoding: str = "iso-8859-1") -> ParseResult:
-    """Parse raw BMF CSV bytes into structured records.
+def _iter_chunks(source: BmfSource) -> Iterator[bytes]:
+    """Normalize the accepted input types to an iterator of byte chunks."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield bytes(source)
+        return
+    read = getattr(source, "read", None)
+    if read is not None:
+        while chunk := read(CHUNK_SIZE):
+            yield chunk
+        return
+    yield from source
 
-    Steps:
-    1. Decode from ISO-8859-1
-    2. Normalize line endings (CRLF → LF)
-    3. Validate header line against EXPECTED_HEADERS
-    4. Parse each data row (split by ~, strip/clean fields)
-    5. Extract Stand: timestamp from footer
-    6. Convert dates from DD.MM.YYYY to YYYY-MM-DD
 
-    Raises:
-        ValueError: if header doesn't match, row has wrong field count, or
-                    required dates cannot be parsed, or Stand line is missing.
+def _iter_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decode byte chunks incrementally and yield lines without terminators.
+
+    CRLF and lone CR are treated as line breaks, exactly like the
+    ``replace("\r\n", "\n").replace("\r", "\n")`` normalization in the
+    non-streaming parser. A trailing empty string is yielded when the input
+    ends with a line break (matching ``str.split("\n")``).
     """
-    text = raw_data.decode(encoding)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        # A CR at the very end may be the first half of a CRLF split across
+        # two chunks — hold it back until the next chunk arrives.
+        held = ""
+        if pending.endswith("\r"):
+            pending, held = pending[:-1], "\r"
+        lines = pending.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        pending = lines.pop() + held
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    yield from pending.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+
+def _text(cleaned: str) -> str:
+    # Kept as is; empty required fields are reported by validation
+    return cleaned
+
+
+def _optional(cleaned: str) -> str | None:
+    return cleaned if cleaned else None
 
-    # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = text.split("\n")
 
-    if not lines:
-        raise ValueError("Empty input: no lines found")
+def _optional_date(cleaned: str) -> str | None:
+    return _convert_date(cleaned) if cleaned else None
 
-    # --- Validate header ---
-    raw_headers = lines[0].split("~")
-    actual_headers = [h.strip() for h in raw_headers]
-    if actual_headers != EXPECTED_HEADERS:
-        raise ValueError(
-            f"Unexpected CSV headers.\n"
-            f"  Expected: {EXPECTED_HEADERS}\n"
-            f"  Got:      {actual_headers}"
-        )
 
-    # --- Parse data rows and find Stand ---
-    records: list[ScheinfirmaRecord] = []
-    stand_datum: str | None = None
-    stand_zeit: str | None = None
-
-    for line_no, line in enumerate(lines[1:], start=2):
-        stripped = line.strip()
-        if not stripped:
-            continue
-
-        # Check for Stand: timestamp line
-        m = _RE_STAND.match(stripped)
-        if m:
-            stand_datum = _convert_date(m.group(1))
-            stand_zeit = m.group(2)
-            continue
-
-        # Data row — the BMF format uses a trailing tilde on rows with empty
-        # Kennziffer, producing 10 parts when split. Strip the trailing empty part.
-        fields = line.split("~")
-        if len(fields) == 10 and fields[-1] == "":
-            fields = fields[:9]
-        if len(fields) != 9:
+@dataclass(frozen=True)
+class Column:
+    """One column of the BMF CSV: header text, record field and converter.
+
+    ``convert`` receives the field with HTML entities resolved and
+    surrounding whitespace stripped and returns the value stored in the
+    :class:`ScheinfirmaRecord` field ``field`` (raising ValueError if the
+    value is invalid).
+    """
+
+    header: str
+    field: str
+    convert: Callable[[str], str | None]
+
+
+# The BMF column layout, in file order. A format change (renamed, added or
+# reordered columns, a new date format) is handled by passing a different
+# table to parse_bmf_csv()/parse_bmf_csv_iter().
+COLUMNS: tuple[Column, ...] = (
+    Column("Name", "name", _text),
+    Column("Anschrift", "anschrift", _text),
+    Column("Veröffentlichung", "veroeffentlicht", _convert_date),
+    Column("Rechtskraft Bescheid", "rechtskraeftig", _convert_date),
+    Column("Zeitpunkt als Scheinunternehmen", "seit", _optional_date),
+    Column("Geburts-Datum", "geburtsdatum", _optional_date),
+    Column("Firmenbuch-Nr", "fbnr", _optional),
+    Column("UID-Nr.", "uid", _optional),
+    Column("Kennziffer des UR", "kennziffer", _strip_quotes),
+)
+
+# Expected column names after stripping whitespace
+EXPECTED_HEADERS = [c.header for c in COLUMNS]
+
+_RECORD_FIELDS = tuple(f.name for f in fields(ScheinfirmaRecord))
+
+
+def _build_bmf_record(parts: list[str], clean: Callable[[str], str]) -> ScheinfirmaRecord:
+    """:data:`COLUMNS` written out by hand — the same conversions as the
+    generic loop in :class:`RowParser`, without a call per column."""
+    name, anschrift, veroeffentlicht, rechtskraeftig, seit, geburtsdatum, fbnr, uid, kz = parts
+    seit = clean(seit)
+    geburtsdatum = clean(geburtsdatum)
+    return ScheinfirmaRecord(
+        name=clean(name),
+        anschrift=clean(anschrift),
+        veroeffentlicht=_convert_date(clean(veroeffentlicht)),
+        rechtskraeftig=_convert_date(clean(rechtskraeftig)),
+        seit=_convert_date(seit) if seit else None,
+        geburtsdatum=_convert_date(geburtsdatum) if geburtsdatum else None,
+        fbnr=clean(fbnr) or None,
+        uid=clean(uid) or None,
+        kennziffer=_strip_quotes(clean(kz)),
+    )
+
+
+class RowParser:
+    """Turns data rows into records through a per-column converter table."""
+
+    __slots__ = ("columns", "headers", "_converters", "_build")
+
+    def __init__(self, columns: Sequence[Column] = COLUMNS) -> None:
+        names = sorted(c.field for c in columns)
+        if names != sorted(_RECORD_FIELDS):
+            raise ValueError(
+                f"Columns must map to each ScheinfirmaRecord field once, got {names}"
+            )
+        self.columns = tuple(columns)
+        self.headers = [c.header for c in self.columns]
+        self._converters = [(c.field, c.convert) for c in self.columns]
+        # The standard layout takes the unrolled builder (the hot path)
+        self._build = _build_bmf_record if self.columns == COLUMNS else self._build_record
+
+    def _build_record(self, parts: list[str], clean: Callable[[str], str]) -> ScheinfirmaRecord:
+        values: dict[str, Any] = {
+            field: convert(clean(part))
+            for (field, convert), part in zip(self._converters, parts, strict=True)
+        }
+        return ScheinfirmaRecord(**values)
+
+    def parse(self, line_no: int, line: str) -> ScheinfirmaRecord:
+        """Parse a single data row into a ScheinfirmaRecord."""
+        # Unescaping the whole row once is the same as unescaping each field
+        # as long as no entity can turn into a "~": named entities never do
+        # (and never contain one), numeric ones like "&#126;" can. Rows with
+        # numeric references are therefore unescaped field by field.
+        clean: Callable[[str], str]
+        if "&" not in line:
+            clean, parts = str.strip, line.split("~")
+        elif "&#" not in line:
+            clean, parts = str.strip, html.unescape(line).split("~")
+        else:
+            clean, parts = _clean_field, line.split("~")
+
+        # The BMF format uses a trailing tilde on rows with empty Kennziffer,
+        # producing one part too many when split. Strip the trailing empty part.
+        n = len(self.columns)
+        if len(parts) == n + 1 and parts[-1] == "":
+            parts.pop()
+        if len(parts) != n:
             raise ValueError(
-                f"Line {line_no}: expected 9 fields, got {len(fields)}: {line!r}"
+                f"Line {line_no}: expected {n} fields, got {len(parts)}: {line!r}"
             )
+        return self._build(parts, clean)
 
-        def opt(v: str) -> str | None:
-            cleaned = _clean_field(v)
-            return cleaned if cleaned else None
-
-        def opt_date(v: str) -> str | None:
-            cleaned = _clean_field(v)
-            return _convert_date(cleaned) if cleaned else None
-
-        record = ScheinfirmaRecord(
-            name=_clean_field(fields[0]),
-            anschrift=_clean_field(fields[1]),
-            veroeffentlicht=_convert_date(_clean_field(fields[2])),
-            rechtskraeftig=_convert_date(_clean_field(fields[3])),
-            seit=opt_date(fields[4]),
-            geburtsdatum=opt_date(fields[5]),
-            fbnr=opt(fields[6]),
-            uid=opt(fields[7]),
-            kennziffer=_clean_kennziffer(fields[8]),
+
+_DEFAULT_ROW_PARSER = RowParser()
+_parse_row = _DEFAULT_ROW_PARSER.parse
+
+
+class BmfCsvStream:
+    """Incremental parser over a BMF CSV byte stream.
+
+    Iterating yields one ScheinfirmaRecord per data row as soon as its line
+    is complete, so memory use is bounded by the longest line rather than
+    the payload size. The ``Stand:`` footer is the last line of the file;
+    it is available via :attr:`stand` once the stream has been exhausted.
+
+    While parsing, a SHA-256 digest of every line except the ``Stand:``
+    footer is computed (:attr:`content_hash`). It changes only when the
+    actual list content changes, not with the daily timestamp.
+
+    Raises ValueError during iteration under the same conditions as
+    :func:`parse_bmf_csv`.
+    """
+
+    def __init__(
+        self,
+        source: BmfSource,
+        encoding: str = "iso-8859-1",
+        columns: Sequence[Column] = COLUMNS,
+    ) -> None:
+        self._rows = _DEFAULT_ROW_PARSER if columns is COLUMNS else RowParser(columns)
+        self.stand_datum: str | None = None
+        self.stand_zeit: str | None = None
+        self.row_count = 0
+        self.bytes_read = 0
+        self._hasher = hashlib.sha256()
+        self._records = self._parse(_iter_lines(self._count(source), encoding))
+
+    def __iter__(self) -> BmfCsvStream:
+        return self
+
+    def __next__(self) -> ScheinfirmaRecord:
+        return next(self._records)
+
+    @property
+    def stand(self) -> tuple[str, str]:
+        """Return (stand_datum, stand_zeit). Only valid after exhaustion."""
+        if self.stand_datum is None or self.stand_zeit is None:
+            raise ValueError("Stand: timestamp not available (stream not fully consumed)")
+        return self.stand_datum, self.stand_zeit
+
+    @property
+    def content_hash(self) -> str:
+        """Hex SHA-256 of all lines read so far, excluding the Stand: line."""
+        return self._hasher.hexdigest()
+
+    def collect(self) -> ParseResult:
+        """Consume the remaining stream and return it as a ParseResult."""
+        records = list(self)
+        stand_datum, stand_zeit = self.stand
+        return ParseResult(
+            records=records,
+            stand_datum=stand_datum,
+            stand_zeit=stand_zeit,
+            raw_row_count=len(records),
         )
-        records.append(record)
 
-    if stand_datum is None or stand_zeit is None:
-        raise ValueError("Stand: timestamp line not found in CSV")
+    def _count(self, source: BmfSource) -> Iterator[bytes]:
+        for chunk in _iter_chunks(source):
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def _parse(self, lines: Iterator[str]) -> Iterator[ScheinfirmaRecord]:
+        # --- Validate header ---
+        header = next(lines, "")
+        self._hasher.update(header.encode("utf-8") + b"\n")
+        actual_headers = [h.strip() for h in header.split("~")]
+        expected_headers = self._rows.headers
+        if actual_headers != expected_headers:
+            raise ValueError(
+                f"Unexpected CSV headers.\n"
+                f"  Expected: {expected_headers}\n"
+                f"  Got:      {actual_headers}"
+            )
 
-    return ParseResult(
-        records=records,
-        stand_datum=stand_datum,
-        stand_zeit=stand_zeit,
-        raw_row_count=len(records),
-    )
+        # --- Parse data rows and find Stand ---
+        parse_row = self._rows.parse
+        for line_no, line in enumerate(lines, start=2):
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            # Check for Stand: timestamp line
+            m = _RE_STAND.match(stripped)
+            if m:
+                self.stand_datum = _convert_date(m.group(1))
+                self.stand_zeit = m.group(2)
+                continue
+            self._hasher.update(line.encode("utf-8") + b"\n")
+
+            record = parse_row(line_no, line)
+            self.row_count += 1
+            yield record
+
+        if self.stand_datum is None or self.stand_zeit is None:
+            raise ValueError("Stand: timestamp line not found in CSV")
+
+
+def parse_bmf_csv_iter(
+    source: BmfSource,
+    encoding: str = "iso-8859-1",
+    columns: Sequence[Column] = COLUMNS,
+) -> BmfCsvStream:
+    """Parse BMF CSV incrementally from bytes, byte chunks, or a binary file.
+
+    ``source`` may be a ``bytes`` object, any iterable of ``bytes`` chunks
+    (e.g. a streaming download), or a binary file object opened with
+    ``open(path, "rb")``. Returns a :class:`BmfCsvStream` that yields
+    records lazily; read ``stream.stand`` after the loop finishes::
+
+        stream = parse_bmf_csv_iter(open("raw.csv", "rb"))
+        for rec in stream:
+            ...
+        stand_datum, stand_zeit = stream.stand
+    """
+    return BmfCsvStream(source, encoding, columns)
+
+
+def parse_bmf_csv(
+    raw_data: BmfSource,
+    encoding: str = "iso-8859-1",
+    columns: Sequence[Column] = COLUMNS,
+) -> ParseResult:
+    """Parse raw BMF CSV bytes into structured records.
+
+    Steps:
+    1. Decode from ISO-8859-1
+    2. Normalize line endings (CRLF → LF)
+    3. Validate header line against the column headers (EXPECTED_HEADERS)
+    4. Parse each data row (split by ~, strip/clean fields, apply the
+       per-column converters of ``columns``)
+    5. Extract Stand: timestamp from footer
+    6. Convert dates from DD.MM.YYYY to YYYY-MM-DD
+
+    ``raw_data`` is usually the complete payload, but any source accepted by
+    :func:`parse_bmf_csv_iter` works too; this is a convenience wrapper that
+    collects the stream into a list. ``columns`` replaces the BMF column
+    table (:data:`COLUMNS`) if the upstream format changes.
+
+    Raises:
+        ValueError: if header doesn't match, row has wrong field count, or
+                    required dates cannot be parsed, or Stand line is missing.
+    """
+    return parse_bmf_csv_iter(raw_data, encoding, columns).collect()
@@ -0,0 +1,148 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Crash-safe publishing of output files.
+
+Outputs are first written to a staging directory inside the output
+directory (same filesystem), verified there, and only then moved into
+place with :func:`os.replace`, which atomically swaps each file. A reader
+polling ``data/`` sees either the old or the new version of a file, never
+a half-written one; a crash or failed verification leaves the published
+files untouched.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import secrets
+import shutil
+import stat
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+STAGING_PREFIX = ".staging-"
+
+
+def _fsync_dir(directory: Path) -> None:
+    # Persist the rename itself; directories can't be opened on Windows
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: Path) -> None:
+    with path.open("rb") as f:
+        os.fsync(f.fileno())
+
+
+def _create_temp(path: Path) -> tuple[int, Path]:
+    """Create a new temporary file next to ``path``; returns (fd, temp path).
+
+    Opened with mode 0o666 like ``open()``, so the process umask applies
+    (mkstemp would create it 0600 and reading the umask means changing it).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free temporary file name next to {path}")
+
+
+def atomic_write_bytes(path: str | Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temporary file and os.replace.
+
+    A rewritten file keeps its permissions; a new one gets the usual
+    0o666 minus the umask.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):  # not on Windows before 3.13
+                with contextlib.suppress(FileNotFoundError):
+                    os.fchmod(f.fileno(), stat.S_IMODE(path.stat().st_mode))
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    _fsync_dir(path.parent)
+
+
+def atomic_write_text(path: str | Path, text: str, encoding: str = "utf-8") -> None:
+    """Text variant of :func:`atomic_write_bytes` (no newline translation)."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+class StagingDir:
+    """Temporary directory next to the published files.
+
+    Usage::
+
+        with StagingDir(out) as staging:
+            write_csv(result, staging.path / "scheinfirmen.csv")
+            ...  # verify the staged files
+            staging.publish(["scheinfirmen.csv", ...])
+
+    Leaving the block removes the staging directory together with anything
+    not published (e.g. after an exception or ``sys.exit``).
+    """
+
+    def __init__(self, output_dir: str | Path) -> None:
+        self.output_dir = Path(output_dir)
+        self._path: Path | None = None
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            raise RuntimeError("StagingDir is not active (use it as a context manager)")
+        return self._path
+
+    def __enter__(self) -> StagingDir:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._path = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.output_dir))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+
+    def publish(self, names: Iterable[str]) -> list[Path]:
+        """Move the staged files into the output directory, in the given order.
+
+        Every file is flushed to disk before its rename, so a crash can not
+        publish a file whose contents were never written. Returns the
+        published paths.
+        """
+        staged = [self.path / name for name in names]
+        for src in staged:
+            if not src.is_file():
+                raise FileNotFoundError(f"Not staged: {src}")
+            _fsync_file(src)
+        published = []
+        for src in staged:
+            dest = self.output_dir / src.name
+            os.replace(src, dest)
+            published.append(dest)
+        _fsync_dir(self.output_dir)
+        return published
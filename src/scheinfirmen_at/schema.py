@@ -1,7 +1,7 @@
 # Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
 # SPDX-License-Identifier: Apache-2.0
 
-"""JSON Schema, XSD, and CSVW metadata definitions for Scheinfirma data."""
+"""JSON Schema, XSD, CSVW metadata, and SQLite DDL for Scheinfirma data."""
 
 import json
 from pathlib import Path
@@ -198,6 +198,38 @@ XSD_CONTENT = """\
 </xs:schema>
 """
 
+# SQLite schema. Records keep the output field order; the metadata table
+# holds stand/source/count as key-value pairs. The B-tree indexes cover
+# the identifiers used for point lookups (UID, Firmenbuch, Kennziffer),
+# name prefix searches, and date range queries on publication date.
+SQLITE_DDL = """\
+CREATE TABLE scheinfirmen (
+    id              INTEGER PRIMARY KEY,
+    name            TEXT NOT NULL,
+    anschrift       TEXT NOT NULL,
+    veroeffentlicht TEXT NOT NULL,
+    rechtskraeftig  TEXT NOT NULL,
+    seit            TEXT,
+    geburtsdatum    TEXT,
+    fbnr            TEXT,
+    uid             TEXT,
+    kennziffer      TEXT
+);
+
+CREATE TABLE metadata (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+SQLITE_INDEXES = """\
+CREATE INDEX idx_scheinfirmen_uid ON scheinfirmen (uid);
+CREATE INDEX idx_scheinfirmen_fbnr ON scheinfirmen (fbnr);
+CREATE INDEX idx_scheinfirmen_kennziffer ON scheinfirmen (kennziffer);
+CREATE INDEX idx_scheinfirmen_name ON scheinfirmen (name);
+CREATE INDEX idx_scheinfirmen_veroeffentlicht ON scheinfirmen (veroeffentlicht);
+"""
+
 
 def write_csvw_metadata(output: str | Path) -> None:
     """Write the CSVW metadata to a file."""
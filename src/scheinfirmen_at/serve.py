@@ -0,0 +1,239 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Local HTTP lookup service (``scheinfirmen-at serve``).
+
+A small asyncio HTTP/1.1 server answering "is this identifier on the list?"
+from an in-memory :class:`~scheinfirmen_at.index.ScheinfirmenIndex`.
+
+Endpoints (all responses are JSON):
+
+- ``GET /uid/{uid}``, ``GET /fbnr/{nr}``, ``GET /kennziffer/{kz}``:
+  ``{"query": ..., "listed": bool, "records": [...]}``
+- ``POST /lookup`` with a body like ``{"uid": [...], "fbnr": [...]}``:
+  ``{"uid": {value: [records...]}, "fbnr": {...}}``
+- ``GET /meta``: Stand timestamp, record count and load time of the data
+
+The data file is polled for changes; a new index is built in a worker
+thread and swapped in with a single attribute assignment, so requests in
+flight keep using the old index and are never blocked by a reload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import urllib.parse
+from datetime import datetime, timezone
+from http import HTTPStatus
+from pathlib import Path
+
+from scheinfirmen_at.convert import record_to_dict
+from scheinfirmen_at.index import KINDS, ScheinfirmenIndex
+
+logger = logging.getLogger("scheinfirmen_at")
+
+# Upper bound for POST bodies and header blocks (bytes)
+MAX_BODY_SIZE = 1024 * 1024
+# Seconds a client may take to send a complete request
+REQUEST_TIMEOUT = 30.0
+
+
+class LookupServer:
+    """Serves lookups from a JSONL data file and hot-reloads it on change."""
+
+    def __init__(self, data_path: str | Path, reload_interval: float = 5.0) -> None:
+        self.data_path = Path(data_path)
+        self.reload_interval = reload_interval
+        self._mtime_ns = self.data_path.stat().st_mtime_ns
+        self.index = ScheinfirmenIndex.from_jsonl(self.data_path)
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def reload_if_changed(self) -> bool:
+        """Rebuild the index if the data file changed. Returns True on reload.
+
+        A file that cannot be read or parsed (e.g. caught mid-write) is
+        logged and the previous index stays in service.
+        """
+        try:
+            mtime_ns = self.data_path.stat().st_mtime_ns
+            if mtime_ns == self._mtime_ns:
+                return False
+            index = ScheinfirmenIndex.from_jsonl(self.data_path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Reload of %s failed, keeping old data: %s", self.data_path, exc)
+            return False
+        # Single reference assignment — atomic for concurrent readers
+        self.index = index
+        self._mtime_ns = mtime_ns
+        self.loaded_at = datetime.now(timezone.utc)
+        logger.info(
+            "Reloaded %d records from %s (Stand: %s %s)",
+            len(index), self.data_path, index.stand_datum, index.stand_zeit,
+        )
+        return True
+
+    async def watch(self) -> None:
+        """Poll the data file forever, reloading off the event loop."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await asyncio.to_thread(self.reload_if_changed)
+            except Exception:
+                # Anything unexpected from a malformed file must not end the
+                # watcher — that would silently stop hot reloading for good.
+                logger.exception("Reload of %s failed, keeping old data", self.data_path)
+
+    def dispatch(self, method: str, target: str, body: bytes) -> tuple[int, object]:
+        """Route one request. Returns (HTTP status, JSON-serializable payload)."""
+        index = self.index
+        path = urllib.parse.urlsplit(target).path
+        parts = [urllib.parse.unquote(p) for p in path.strip("/").split("/")]
+
+        if parts == ["meta"]:
+            if method != "GET":
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, {
+                "stand": f"{index.stand_datum}T{index.stand_zeit}",
+                "count": len(index),
+                "loaded_at": self.loaded_at.isoformat(timespec="seconds"),
+            }
+
+        if len(parts) == 2 and parts[0] in KINDS:
+            if method != "GET":
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED)
+            matches = index.lookup_many([parts[1]], kind=parts[0])[parts[1]]
+            return HTTPStatus.OK, {
+                "query": parts[1],
+                "listed": bool(matches),
+                "records": [record_to_dict(r) for r in matches],
+            }
+
+        if parts == ["lookup"]:
+            if method != "POST":
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED)
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                return _error(HTTPStatus.BAD_REQUEST, "body must be JSON")
+            if not isinstance(request, dict) or not set(request) <= set(KINDS):
+                return _error(HTTPStatus.BAD_REQUEST, f"expected an object with keys {KINDS}")
+            result: dict[str, dict[str, list[dict[str, str | None]]]] = {}
+            for kind, values in request.items():
+                if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                    return _error(HTTPStatus.BAD_REQUEST, f"{kind!r} must be a list of strings")
+                hits = index.lookup_many(values, kind=kind)
+                result[kind] = {v: [record_to_dict(r) for r in recs] for v, recs in hits.items()}
+            return HTTPStatus.OK, result
+
+        return _error(HTTPStatus.NOT_FOUND)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle one connection (one request, then close)."""
+        try:
+            try:
+                method, target, body = await asyncio.wait_for(
+                    _read_request(reader), REQUEST_TIMEOUT
+                )
+                status, payload = self.dispatch(method, target, body)
+            except _BadRequestError as exc:
+                status, payload = _error(exc.status, str(exc))
+            except asyncio.TimeoutError:
+                status, payload = _error(HTTPStatus.REQUEST_TIMEOUT)
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            reason = HTTPStatus(status).phrase
+            writer.write(
+                f"HTTP/1.1 {status} {reason}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii")
+                + data
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # client went away
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        """Start listening. The caller owns the returned server."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+class _BadRequestError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _error(status: int, message: str | None = None) -> tuple[int, object]:
+    return status, {"error": message or HTTPStatus(status).phrase}
+
+
+async def _readline(reader: asyncio.StreamReader) -> bytes:
+    try:
+        return await reader.readline()
+    except ValueError:
+        # Line longer than the stream's buffer limit (64 KiB by default)
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "request line too long") from None
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    """Read request line, headers and body. Returns (method, target, body)."""
+    request_line = (await _readline(reader)).decode("latin-1").strip()
+    try:
+        method, target, _version = request_line.split(" ", 2)
+    except ValueError:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+
+    headers: dict[str, str] = {}
+    size = 0
+    while True:
+        line = await _readline(reader)
+        size += len(line)
+        if size > MAX_BODY_SIZE:
+            raise _BadRequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise _BadRequestError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from None
+    if length > MAX_BODY_SIZE:
+        raise _BadRequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method.upper(), target, body
+
+
+def serve(
+    data_path: str | Path,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    reload_interval: float = 5.0,
+) -> None:
+    """Load ``data_path`` and serve lookups until interrupted (blocking)."""
+    lookup = LookupServer(data_path, reload_interval=reload_interval)
+    logger.info(
+        "Loaded %d records from %s (Stand: %s %s)",
+        len(lookup.index), data_path, lookup.index.stand_datum, lookup.index.stand_zeit,
+    )
+
+    async def main() -> None:
+        server = await lookup.start(host, port)
+        watcher = asyncio.create_task(lookup.watch())
+        logger.info("Serving on http://%s:%d/", host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(main())
@@ -11,9 +11,17 @@ import logging
 from dataclasses import dataclass
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Any
+
+from scheinfirmen_at.columnar import ColumnarView
+from scheinfirmen_at.parse import ParseResult
+from scheinfirmen_at.publish import atomic_write_text
 
 logger = logging.getLogger("scheinfirmen_at")
 
+WEEKLY_STATE_FILE = "STATS.weekly.json"
+WEEKLY_WEEKS = 26  # weeks shown in the STATS.md chart and table
+
 
 @dataclass
 class RecordInfo:
@@ -35,6 +43,16 @@ class MonthRow:
     total: int  # cumulative total through this month
 
 
+@dataclass
+class WeekRow:
+    """One row of the weekly additions/removals table."""
+
+    week_label: str  # ISO week, e.g. "2026-W07"
+    week_start: date  # Monday of the week
+    additions: int  # records added to the list in snapshots of this week
+    removals: int  # records removed from the list in snapshots of this week
+
+
 def parse_jsonl_records(jsonl_path: Path) -> tuple[list[RecordInfo], str, int]:
     """Parse JSONL file, return all records, stand timestamp, and total count."""
     records: list[RecordInfo] = []
@@ -72,18 +90,31 @@ def parse_jsonl_records(jsonl_path: Path) -> tuple[list[RecordInfo], str, int]:
     return records, stand, total
 
 
-def compute_monthly_stats(records: list[RecordInfo]) -> list[MonthRow]:
+def compute_monthly_stats(records: list[RecordInfo] | ColumnarView) -> list[MonthRow]:
     """Group records by calendar month of veroeffentlicht, compute cumulative totals.
 
+    Accepts the stats records or a :class:`ColumnarView` of the full records
+    (then the month is taken from the ``veroeffentlicht`` ordinal column).
     Only records with a veroeffentlicht date are included.
     Returns rows sorted chronologically (oldest first).
     """
     month_counts: dict[tuple[int, int], int] = {}
-    for rec in records:
-        if rec.veroeffentlicht is None:
-            continue
-        key = (rec.veroeffentlicht.year, rec.veroeffentlicht.month)
-        month_counts[key] = month_counts.get(key, 0) + 1
+    if isinstance(records, ColumnarView):
+        # Count per distinct ordinal first; only those become dates
+        per_day: dict[int, int] = {}
+        for ordinal in records.date_ordinals("veroeffentlicht"):
+            if ordinal > 0:
+                per_day[ordinal] = per_day.get(ordinal, 0) + 1
+        for ordinal, count in per_day.items():
+            day = date.fromordinal(ordinal)
+            key = (day.year, day.month)
+            month_counts[key] = month_counts.get(key, 0) + count
+    else:
+        for rec in records:
+            if rec.veroeffentlicht is None:
+                continue
+            key = (rec.veroeffentlicht.year, rec.veroeffentlicht.month)
+            month_counts[key] = month_counts.get(key, 0) + 1
 
     if not month_counts:
         return []
@@ -105,21 +136,115 @@ def compute_monthly_stats(records: list[RecordInfo]) -> list[MonthRow]:
     return rows
 
 
+def _week_label(d: date) -> str:
+    year, week, _ = d.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def load_weekly_state(path: Path) -> dict[str, Any]:
+    """Load the running weekly totals (empty state if the file is missing)."""
+    if not path.exists():
+        return {"last_stand": None, "weeks": {}}
+    with open(path, encoding="utf-8") as f:
+        state: dict[str, Any] = json.load(f)
+    return state
+
+
+def save_weekly_state(state: dict[str, Any], path: Path) -> None:
+    atomic_write_text(
+        path, json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+    )
+
+
+def fold_changes(state: dict[str, Any], changes_path: Path) -> bool:
+    """Add the counts of a changes.jsonl delta to the weekly totals.
+
+    Only the metadata line is read. Each stand is folded at most once, so
+    re-running on the same delta is harmless. The very first snapshot
+    (no ``previous_stand``) only sets the baseline — its records are not
+    additions. Returns True if the state was updated.
+    """
+    with open(changes_path, encoding="utf-8") as f:
+        meta = json.loads(f.readline())["_metadata"]
+    stand: str = meta["stand"]
+    last_stand = state.get("last_stand")
+    if last_stand is not None and stand <= last_stand:
+        return False
+
+    if meta.get("previous_stand") is not None:
+        label = _week_label(date.fromisoformat(stand[:10]))
+        week = state["weeks"].setdefault(label, {"added": 0, "removed": 0})
+        week["added"] += meta.get("added", 0)
+        week["removed"] += meta.get("removed", 0)
+    state["last_stand"] = stand
+    return True
+
+
+def compute_weekly_stats(state: dict[str, Any], weeks: int = WEEKLY_WEEKS) -> list[WeekRow]:
+    """Weekly rows for the last ``weeks`` weeks of the state, oldest first.
+
+    Weeks without any change in between are filled in with zeros.
+    """
+    if not state["weeks"]:
+        return []
+
+    mondays = []
+    for label in state["weeks"]:
+        year, _, week = label.partition("-W")
+        mondays.append(date.fromisocalendar(int(year), int(week), 1))
+    last = max(mondays)
+    start = max(min(mondays), last - timedelta(weeks=weeks - 1))
+
+    rows: list[WeekRow] = []
+    monday = start
+    while monday <= last:
+        label = _week_label(monday)
+        counts = state["weeks"].get(label, {})
+        rows.append(
+            WeekRow(
+                week_label=label,
+                week_start=monday,
+                additions=counts.get("added", 0),
+                removals=counts.get("removed", 0),
+            )
+        )
+        monday += timedelta(weeks=1)
+    return rows
+
+
 def find_recent_additions(
-    records: list[RecordInfo],
+    records: list[RecordInfo] | ColumnarView,
     days: int = 30,
     today: date | None = None,
 ) -> list[RecordInfo]:
-    """Find records with veroeffentlicht in the last N days, sorted alphabetically."""
+    """Find records with veroeffentlicht in the last N days, sorted alphabetically.
+
+    Accepts the stats records or a :class:`ColumnarView` of the full records
+    (then only the recent rows are turned into RecordInfo).
+    """
     if today is None:
         today = date.today()
     cutoff = today - timedelta(days=days)
 
-    recent = [
-        rec
-        for rec in records
-        if rec.veroeffentlicht is not None and rec.veroeffentlicht > cutoff
-    ]
+    if isinstance(records, ColumnarView):
+        name, uid, anschrift = (records.column(f) for f in ("name", "uid", "anschrift"))
+        cutoff_ordinal = cutoff.toordinal()
+        recent = [
+            RecordInfo(
+                name=name[i] or "",
+                uid=uid[i],
+                anschrift=anschrift[i] or "",
+                veroeffentlicht=date.fromordinal(ordinal),
+            )
+            for i, ordinal in enumerate(records.date_ordinals("veroeffentlicht"))
+            if ordinal > cutoff_ordinal
+        ]
+    else:
+        recent = [
+            rec
+            for rec in records
+            if rec.veroeffentlicht is not None and rec.veroeffentlicht > cutoff
+        ]
     return sorted(recent, key=lambda r: r.name)
 
 
@@ -129,13 +254,15 @@ def render_stats_md(
     stand: str,
     total: int,
     oldest_date: date | None = None,
+    weekly: list[WeekRow] | None = None,
 ) -> str:
     """Render the full STATS.md Markdown report.
 
     Order:
     1. Title + explanation + totals
     2. Mermaid chart (temporal progression by month)
-    3. Last 30 days section (recent additions, alphabetical)
+    3. Weekly additions/removals chart and table (if available)
+    4. Last 30 days section (recent additions, alphabetical)
     """
     lines: list[str] = []
 
@@ -172,6 +299,32 @@ def render_stats_md(
         lines.append(f"    line [{y_values}]")
         lines.append("```\n")
 
+    # --- Weekly additions/removals (from successive snapshots) ---
+    if weekly:
+        lines.append("## Zugänge und Abgänge pro Woche\n")
+
+        if len(weekly) >= 2:
+            x_labels = ", ".join(f'"{row.week_label[5:]}"' for row in weekly)
+            y_max = max(max(row.additions, row.removals) for row in weekly) + 5
+            lines.append("```mermaid")
+            lines.append("xychart-beta")
+            lines.append('    title "Zugänge (Balken) und Abgänge (Linie) pro Woche"')
+            lines.append(f"    x-axis [{x_labels}]")
+            lines.append(f'    y-axis "Anzahl" 0 --> {y_max}')
+            lines.append(f"    bar [{', '.join(str(row.additions) for row in weekly)}]")
+            lines.append(f"    line [{', '.join(str(row.removals) for row in weekly)}]")
+            lines.append("```\n")
+
+        lines.append("| Woche | ab | Zugänge | Abgänge | Netto |")
+        lines.append("|-------|----|--------:|--------:|------:|")
+        for row in reversed(weekly):
+            net = row.additions - row.removals
+            lines.append(
+                f"| {row.week_label} | {row.week_start.isoformat()} "
+                f"| {row.additions} | {row.removals} | {net:+d} |"
+            )
+        lines.append("")
+
     # --- Recent additions (last 30 days) ---
     lines.append("## Neueste Scheinfirmen (letzte 30 Tage)\n")
     if recent:
@@ -186,12 +339,33 @@ def render_stats_md(
     return "\n".join(lines)
 
 
-def generate_stats(jsonl_path: Path, output_path: Path) -> None:
-    """Main entry point: generate STATS.md from current data file."""
-    logger.info("Generating stats from %s", jsonl_path)
+def generate_stats(
+    jsonl_path: Path,
+    output_path: Path,
+    changes_path: Path | None = None,
+    weekly_path: Path | None = None,
+    result: ParseResult | None = None,
+    columns: ColumnarView | None = None,
+) -> None:
+    """Main entry point: generate STATS.md from current data file.
+
+    With ``weekly_path``, the running weekly totals stored there are
+    updated with the delta in ``changes_path`` (if given) and rendered as
+    an extra section.
 
-    records, stand, total = parse_jsonl_records(jsonl_path)
-    if not records:
+    If the records are already in memory, pass them as ``result`` (and
+    optionally a prebuilt :class:`ColumnarView` of them as ``columns``);
+    ``jsonl_path`` is then not read.
+    """
+    records: list[RecordInfo] | ColumnarView
+    if result is not None:
+        records = columns if columns is not None else ColumnarView.from_result(result)
+        stand = f"{result.stand_datum}T{result.stand_zeit}"
+        total = result.raw_row_count
+    else:
+        logger.info("Generating stats from %s", jsonl_path)
+        records, stand, total = parse_jsonl_records(jsonl_path)
+    if not len(records):
         logger.warning("No records found in %s — skipping stats", jsonl_path)
         return
 
@@ -201,6 +375,15 @@ def generate_stats(jsonl_path: Path, output_path: Path) -> None:
 
     oldest_date = monthly[0].month_start if monthly else None
 
-    md = render_stats_md(monthly, recent, stand, total, oldest_date)
-    output_path.write_text(md, encoding="utf-8")
+    weekly: list[WeekRow] | None = None
+    if weekly_path is not None:
+        state = load_weekly_state(weekly_path)
+        if changes_path is not None and changes_path.exists() and fold_changes(
+            state, changes_path
+        ):
+            save_weekly_state(state, weekly_path)
+        weekly = compute_weekly_stats(state)
+
+    md = render_stats_md(monthly, recent, stand, total, oldest_date, weekly)
+    atomic_write_text(output_path, md)
     logger.info("Wrote stats report to %s", output_path)
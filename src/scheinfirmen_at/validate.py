@@ -6,10 +6,10 @@
 import re
 from dataclasses import dataclass
 
-from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+from scheinfirmen_at.columnar import DATE_FIELDS, INVALID_DATE, NULL_DATE, ColumnarView
+from scheinfirmen_at.parse import ParseResult
 
 # Compiled validation regexes
-_RE_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _RE_UID = re.compile(r"^ATU\d{8}$")
 # Foreign EU VAT-style identifier: 2 country letters + alphanumeric tail.
 # Used to accept non-Austrian VAT numbers (e.g. RO, DE) that the BMF
@@ -45,7 +45,9 @@ class ValidationResult:
 
 
 def validate_records(
-    result: ParseResult, min_rows: int = 100  # safe lower bound; BMF list has ~1000+ entries
+    result: ParseResult,
+    min_rows: int = 100,  # safe lower bound; BMF list has ~1000+ entries
+    columns: ColumnarView | None = None,
 ) -> ValidationResult:
     """Validate all records from a ParseResult.
 
@@ -67,6 +69,9 @@ def validate_records(
       (ATU + 8 digits) nor a generic EU VAT pattern (e.g. RO…, DE…).
       Foreign EU VATs are accepted silently because the BMF list
       occasionally includes cross-border shell entities.
+
+    ``columns`` may pass a prebuilt :class:`ColumnarView` of ``result``;
+    otherwise one is built here.
     """
     errors: list[ValidationError] = []
     warnings: list[ValidationError] = []
@@ -82,78 +87,54 @@ def validate_records(
             )
         )
 
-    for row_idx, rec in enumerate(result.records, start=1):
-        row_errors, row_warnings = _validate_record(row_idx, rec)
-        errors.extend(row_errors)
-        warnings.extend(row_warnings)
-
-    return ValidationResult(errors=errors, warnings=warnings)
-
-
-def _validate_record(
-    row: int, rec: ScheinfirmaRecord
-) -> tuple[list[ValidationError], list[ValidationError]]:
-    """Validate a single record. Returns (errors, warnings)."""
-    errors: list[ValidationError] = []
-    warnings: list[ValidationError] = []
+    # The checks scan one column at a time; a stable sort by row at the end
+    # restores the per-row order (fields in the order checked below).
+    view = columns if columns is not None else ColumnarView(result.records)
 
-    def err(field: str, value: str | None, msg: str) -> None:
-        errors.append(ValidationError(row=row, field=field, value=value, message=msg))
+    def err(field: str, row_idx: int, value: str | None, msg: str) -> None:
+        errors.append(ValidationError(row=row_idx + 1, field=field, value=value, message=msg))
 
-    def warn(field: str, value: str | None, msg: str) -> None:
-        warnings.append(ValidationError(row=row, field=field, value=value, message=msg))
+    def warn(field: str, row_idx: int, value: str | None, msg: str) -> None:
+        warnings.append(ValidationError(row=row_idx + 1, field=field, value=value, message=msg))
 
     # Required string fields
-    if not rec.name:
-        err("name", rec.name, "Name must not be empty")
-    if not rec.anschrift:
-        err("anschrift", rec.anschrift, "Anschrift must not be empty")
-
-    # Required date fields
-    for field_name, value in [
-        ("veroeffentlicht", rec.veroeffentlicht),
-        ("rechtskraeftig", rec.rechtskraeftig),
-    ]:
-        if not _RE_ISO_DATE.match(value):
-            err(field_name, value, f"Expected ISO date YYYY-MM-DD, got {value!r}")
-
-    # Optional date fields
-    for field_name, opt_value in [
-        ("seit", rec.seit),
-        ("geburtsdatum", rec.geburtsdatum),
-    ]:
-        if opt_value is not None and not _RE_ISO_DATE.match(opt_value):
-            err(field_name, opt_value, f"Expected ISO date YYYY-MM-DD, got {opt_value!r}")
+    for field_name, label in [("name", "Name"), ("anschrift", "Anschrift")]:
+        column = view.column(field_name)
+        for i in column.empty_rows():
+            err(field_name, i, column[i], f"{label} must not be empty")
+
+    # Date fields: required ones must be present, all must be ISO dates
+    for field_name in DATE_FIELDS:
+        required = field_name in ("veroeffentlicht", "rechtskraeftig")
+        column = view.column(field_name)
+        for i, ordinal in enumerate(view.date_ordinals(field_name)):
+            if ordinal == INVALID_DATE or (required and ordinal == NULL_DATE):
+                value = column[i]
+                err(field_name, i, value, f"Expected ISO date YYYY-MM-DD, got {value!r}")
 
     # UID-Nr format. Austrian (ATU + 8 digits) is the norm; foreign EU VAT
     # numbers (e.g. RO, DE) are accepted silently. Anything else → warning.
-    if (
-        rec.uid is not None
-        and not _RE_UID.match(rec.uid)
-        and not _RE_FOREIGN_VAT.match(rec.uid)
-    ):
-        warn(
-            "uid",
-            rec.uid,
-            "Expected Austrian UID (ATU + 8 digits) or EU VAT format",
-        )
+    for i, uid in enumerate(view.column("uid")):
+        if uid is not None and not _RE_UID.match(uid) and not _RE_FOREIGN_VAT.match(uid):
+            warn("uid", i, uid, "Expected Austrian UID (ATU + 8 digits) or EU VAT format")
 
     # Firmenbuch-Nr format — warning only. BMF occasionally publishes
     # non-standard values (e.g. foreign register IDs) that we must pass
     # through verbatim rather than abort the pipeline.
-    if rec.fbnr is not None and not _RE_FIRMENBUCH.match(rec.fbnr):
-        warn(
-            "fbnr",
-            rec.fbnr,
-            "Expected 5-6 digits followed by a letter",
-        )
+    for i, fbnr in enumerate(view.column("fbnr")):
+        if fbnr is not None and not _RE_FIRMENBUCH.match(fbnr):
+            warn("fbnr", i, fbnr, "Expected 5-6 digits followed by a letter")
 
     # Kennziffer — warning only (BMF data has known inconsistencies)
-    if rec.kennziffer is not None and not _RE_KENNZIFFER.match(rec.kennziffer):
-        warn(
-            "kennziffer",
-            rec.kennziffer,
-            "Unexpected Kennziffer format (expected R + digits + letter pattern)",
-        )
+    for i, kz in enumerate(view.column("kennziffer")):
+        if kz is not None and not _RE_KENNZIFFER.match(kz):
+            warn(
+                "kennziffer",
+                i,
+                kz,
+                "Unexpected Kennziffer format (expected R + digits + letter pattern)",
+            )
 
-    return errors, warnings
+    errors.sort(key=lambda e: e.row)
+    warnings.sort(key=lambda e: e.row)
+    return ValidationResult(errors=errors, warnings=warnings)
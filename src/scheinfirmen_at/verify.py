@@ -5,7 +5,10 @@
 
 import csv
 import json
+import sqlite3
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -16,6 +19,9 @@ def verify_outputs(
     expected_count: int,
     json_schema_path: str | Path | None = None,
     xsd_path: str | Path | None = None,
+    sqlite_path: str | Path | None = None,
+    parquet_path: str | Path | None = None,
+    feather_path: str | Path | None = None,
 ) -> list[str]:
     """Verify all output files for record counts, spot-checks, and schema compliance.
 
@@ -23,37 +29,59 @@ def verify_outputs(
     1. CSV: count data rows (skip header row)
     2. JSONL: count non-metadata lines (skip lines with _metadata key)
     3. XML: count <scheinfirma> elements
-    4. All three counts must equal expected_count
-    5. Spot-check: first and last record's name must match across all formats
-    6. If schema paths are provided, validate JSONL and XML against them.
+    4. SQLite (if sqlite_path is given): count rows in the scheinfirmen table;
+       Parquet / Feather (if given): count table rows
+    5. All counts must equal expected_count
+    6. Spot-check: first and last record's name must match across all formats
+    7. If schema paths are provided, validate JSONL and XML against them.
 
     Returns a list of error messages. An empty list means all checks passed.
     """
     errors: list[str] = []
 
-    csv_count, csv_names = _count_csv(Path(csv_path))
-    jsonl_count, jsonl_names = _count_jsonl(Path(jsonl_path))
-    xml_count, xml_names = _count_xml(Path(xml_path))
+    # Each format is streamed by its own reader; they run concurrently, so the
+    # total time is bounded by the slowest file rather than the sum.
+    counters: dict[str, Callable[[], tuple[int, list[str]]]] = {
+        "CSV": lambda: _count_csv(Path(csv_path)),
+        "JSONL": lambda: _count_jsonl(Path(jsonl_path)),
+        "XML": lambda: _count_xml(Path(xml_path)),
+    }
+    if sqlite_path is not None:
+        counters["SQLite"] = lambda: _count_sqlite(Path(sqlite_path))
+    if parquet_path is not None:
+        counters["Parquet"] = lambda: _count_arrow(Path(parquet_path), "parquet")
+    if feather_path is not None:
+        counters["Feather"] = lambda: _count_arrow(Path(feather_path), "feather")
+
+    with ThreadPoolExecutor(max_workers=len(counters) + 2) as pool:
+        schema_checks: list[Future[list[str]]] = []
+        if json_schema_path and xsd_path:
+            schema_checks = [
+                pool.submit(_verify_xml_schema, xml_path, xsd_path),
+                pool.submit(_verify_jsonl_schema, jsonl_path, json_schema_path),
+            ]
+        futures = {fmt: pool.submit(fn) for fmt, fn in counters.items()}
+        results = {fmt: future.result() for fmt, future in futures.items()}
 
     # Count checks
-    for fmt, count in [("CSV", csv_count), ("JSONL", jsonl_count), ("XML", xml_count)]:
+    for fmt, (count, _) in results.items():
         if count != expected_count:
             errors.append(f"{fmt}: expected {expected_count} records, found {count}")
 
     # Spot-check names: compare first and last across formats
-    all_names = [csv_names, jsonl_names, xml_names]
+    all_names = [fmt_names for _, fmt_names in results.values()]
     if all(n for n in all_names):
         checks = [(0, "First")]
         if all(len(n) >= 2 for n in all_names):
             checks.append((-1, "Last"))
         for idx, label in checks:
-            names = {"CSV": csv_names[idx], "JSONL": jsonl_names[idx], "XML": xml_names[idx]}
+            names = {fmt: fmt_names[idx] for fmt, (_, fmt_names) in results.items()}
             if len(set(names.values())) > 1:
                 errors.append(f"{label} record name mismatch across formats: {names}")
 
     # Schema validation
-    if json_schema_path and xsd_path:
-        errors.extend(verify_schemas(jsonl_path, xml_path, json_schema_path, xsd_path))
+    for check in schema_checks:
+        errors.extend(check.result())
 
     return errors
 
@@ -69,9 +97,13 @@ def verify_schemas(
     Requires 'jsonschema' and 'lxml' packages. If not installed, this check is skipped
     unless in a development/CI context.
     """
-    errors: list[str] = []
+    return _verify_xml_schema(xml_path, xsd_path) + _verify_jsonl_schema(
+        jsonl_path, json_schema_path
+    )
+
 
-    # XML Validation
+def _verify_xml_schema(xml_path: str | Path, xsd_path: str | Path) -> list[str]:
+    errors: list[str] = []
     try:
         from lxml import etree  # type: ignore
 
@@ -86,43 +118,61 @@ def verify_schemas(
             errors.append(f"XML Validation failed to run: {exc}")
     except ImportError:
         pass  # Optional dependency
+    return errors
+
 
-    # JSONL Validation
+def _verify_jsonl_schema(jsonl_path: str | Path, json_schema_path: str | Path) -> list[str]:
+    errors: list[str] = []
     try:
         import jsonschema  # type: ignore
 
         try:
             with open(json_schema_path, encoding="utf-8") as f:
                 schema = json.load(f)
+            # Same checks and error as jsonschema.validate(), but the schema is
+            # checked and the validator built once instead of for every line.
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema)
             with open(jsonl_path, encoding="utf-8") as f:
-                for _i, line in enumerate(f, 1):
+                for line in f:
                     obj = json.loads(line)
                     if "$schema" in obj:
                         continue
-                    jsonschema.validate(instance=obj, schema=schema)
+                    error = jsonschema.exceptions.best_match(validator.iter_errors(obj))
+                    if error is not None:
+                        raise error
         except Exception as exc:
             errors.append(f"JSONL Validation failed: {exc}")
     except ImportError:
         pass  # Optional dependency
-
     return errors
 
 
+def _boundary(names: Iterable[str]) -> tuple[int, list[str]]:
+    """Consume ``names`` and return (count, [first, last]) without keeping the rest."""
+    count = 0
+    first = last = ""
+    for name in names:
+        if not count:
+            first = name
+        last = name
+        count += 1
+    if count >= 2:
+        return count, [first, last]
+    return count, [first] if count else []
+
+
 def _count_csv(path: Path) -> tuple[int, list[str]]:
     """Return (data row count, [first_name, last_name]) from a CSV output file."""
-    names: list[str] = []
     with path.open(encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(line for line in f if not line.startswith("#"))
-        for row in reader:
-            names.append(row.get("Name", ""))
-    count = len(names)
-    return count, ([names[0], names[-1]] if len(names) >= 2 else names)
+        reader = csv.reader(line for line in f if not line.startswith("#"))
+        header = next(reader, [])
+        col = header.index("Name") if "Name" in header else len(header)
+        return _boundary(row[col] if col < len(row) else "" for row in reader if row)
 
 
-def _count_jsonl(path: Path) -> tuple[int, list[str]]:
-    """Return (data row count, [first_name, last_name]) from a JSONL output file."""
-    names: list[str] = []
-    count = 0
+def _iter_jsonl_names(path: Path) -> Iterable[str]:
     with path.open(encoding="utf-8") as f:
         for line in f:
             line = line.strip()
@@ -131,16 +181,62 @@ def _count_jsonl(path: Path) -> tuple[int, list[str]]:
             obj = json.loads(line)
             if "_metadata" in obj:
                 continue
-            count += 1
-            names.append(obj.get("name", ""))
-    return count, ([names[0], names[-1]] if len(names) >= 2 else names)
+            yield obj.get("name", "")
+
+
+def _count_jsonl(path: Path) -> tuple[int, list[str]]:
+    """Return (data row count, [first_name, last_name]) from a JSONL output file."""
+    return _boundary(_iter_jsonl_names(path))
+
+
+def _iter_xml_names(path: Path) -> Iterable[str]:
+    # Only direct children of the root count; each one is dropped as soon as
+    # its text has been read, so memory stays flat regardless of file size.
+    events = ET.iterparse(path, events=("start", "end"))
+    _, root = next(events)
+    depth = 1
+    for event, elem in events:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            if elem.tag == "scheinfirma":
+                yield elem.text or ""
+            root.clear()
 
 
 def _count_xml(path: Path) -> tuple[int, list[str]]:
     """Return (data row count, [first_name, last_name]) from an XML output file."""
-    tree = ET.parse(path)
-    root = tree.getroot()
-    entries = root.findall("scheinfirma")
-    names: list[str] = [entry.text or "" for entry in entries]
-    count = len(entries)
-    return count, ([names[0], names[-1]] if len(names) >= 2 else names)
+    return _boundary(_iter_xml_names(path))
+
+
+def _count_sqlite(path: Path) -> tuple[int, list[str]]:
+    """Return (data row count, [first_name, last_name]) from an SQLite output file."""
+    con = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        (count,) = con.execute("SELECT COUNT(*) FROM scheinfirmen").fetchone()
+        names = [
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM scheinfirmen WHERE id IN "
+                "((SELECT MIN(id) FROM scheinfirmen), (SELECT MAX(id) FROM scheinfirmen)) "
+                "ORDER BY id"
+            )
+        ]
+    finally:
+        con.close()
+    return count, names
+
+
+def _count_arrow(path: Path, fmt: str) -> tuple[int, list[str]]:
+    """Return (data row count, [first_name, last_name]) from a Parquet or Feather file."""
+    if fmt == "parquet":
+        import pyarrow.parquet as pq  # type: ignore[import-not-found,import-untyped,unused-ignore]
+
+        table = pq.read_table(path, columns=["name"])
+    else:
+        import pyarrow.feather as feather  # type: ignore[import-not-found,import-untyped,unused-ignore]
+
+        table = feather.read_table(path, columns=["name"])
+    return _boundary(table.column("name").to_pylist())
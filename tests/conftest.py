@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from scheinfirmen_at.parse import ParseResult, parse_bmf_csv
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord, parse_bmf_csv
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -19,3 +19,29 @@ def sample_raw_bytes() -> bytes:
 def sample_result(sample_raw_bytes: bytes) -> ParseResult:
     """Parsed ParseResult from sample data."""
     return parse_bmf_csv(sample_raw_bytes)
+
+
+def make_record(
+    name: str,
+    *,
+    anschrift: str = "1010 Wien, Testgasse 1",
+    veroeffentlicht: str = "2024-01-01",
+    rechtskraeftig: str = "2024-01-01",
+    seit: str | None = None,
+    geburtsdatum: str | None = None,
+    fbnr: str | None = None,
+    uid: str | None = None,
+    kennziffer: str | None = None,
+) -> ScheinfirmaRecord:
+    """Build a record with placeholder values for the fields a test doesn't set."""
+    return ScheinfirmaRecord(
+        name=name,
+        anschrift=anschrift,
+        veroeffentlicht=veroeffentlicht,
+        rechtskraeftig=rechtskraeftig,
+        seit=seit,
+        geburtsdatum=geburtsdatum,
+        fbnr=fbnr,
+        uid=uid,
+        kennziffer=kennziffer,
+    )
@@ -0,0 +1,150 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the git history backfill importer."""
+
+import shutil
+import subprocess
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scheinfirmen_at import backfill as backfill_module
+from scheinfirmen_at.backfill import backfill, iter_blobs, list_blobs
+from scheinfirmen_at.cli import main
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.history import HistoryStore
+from scheinfirmen_at.parse import ParseResult
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+STANDS = [("2026-02-10", "09:51:32"), ("2026-02-11", "09:51:32"), ("2026-02-12", "09:51:32")]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path, sample_result: ParseResult) -> Path:
+    """Git repo with three daily snapshots; the last one drops a record.
+
+    An unrelated commit and a commit that does not change the JSONL are
+    mixed in.
+    """
+    repo = tmp_path / "repo"
+    (repo / "data").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    jsonl = repo / "data" / "scheinfirmen.jsonl"
+    for i, (datum, zeit) in enumerate(STANDS):
+        records = sample_result.records[:-1] if i == 2 else sample_result.records
+        write_jsonl(replace(sample_result, records=records, stand_datum=datum, stand_zeit=zeit),
+                    jsonl)
+        (repo / "README").write_text(str(i))
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", f"update {datum}")
+    (repo / "README").write_text("unrelated")
+    _git(repo, "commit", "-q", "-am", "unrelated")
+    return repo
+
+
+def test_list_blobs_oldest_first(repo: Path) -> None:
+    shas = list_blobs(repo)
+    assert len(shas) == 3
+    first = next(iter_blobs(repo, shas[:1]))
+    assert b'"stand": "2026-02-10T09:51:32"' in first
+
+
+def test_iter_blobs_streams_all(repo: Path) -> None:
+    blobs = list(iter_blobs(repo, list_blobs(repo)))
+    assert len(blobs) == 3
+    assert all(b.endswith(b"\n") for b in blobs)
+
+
+def test_backfill(repo: Path, tmp_path: Path, sample_result: ParseResult) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl")
+    assert backfill(repo, store, workers=2) == 3
+    assert store.stands == [f"{d}T{z}" for d, z in STANDS]
+    assert store.as_of("2026-02-11").records == sample_result.records
+    assert store.as_of("2026-02-12").records == sample_result.records[:-1]
+
+
+def test_backfill_is_incremental(repo: Path, tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.jsonl")
+    backfill(repo, store, ref="HEAD~2", workers=1)
+    assert len(store.stands) == 2
+    assert backfill(repo, store, workers=1) == 1
+    assert backfill(repo, HistoryStore(store.path), workers=1) == 0
+
+
+def test_unknown_ref(repo: Path, tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="git log failed"):
+        backfill(repo, HistoryStore(tmp_path / "h.jsonl"), ref="no-such-ref")
+
+
+def test_cli_backfill(repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    history = tmp_path / "history.jsonl"
+    main(["backfill", "--repo", str(repo), "--history", str(history), "--workers", "1"])
+    assert "appended 3 snapshots" in capsys.readouterr().out
+    assert len(HistoryStore(history).stands) == 3
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"\xff\xfe not utf-8\n", b'{"_metadata": 1}\n', b"[1, 2]\n"],
+    ids=["undecodable", "bad-metadata", "not-an-object"],
+)
+def test_bad_blob_is_skipped(
+    repo: Path, tmp_path: Path, content: bytes, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A broken revision is reported and skipped; later revisions still import."""
+    jsonl = repo / "data" / "scheinfirmen.jsonl"
+    good = jsonl.read_bytes()
+    jsonl.write_bytes(content)
+    _git(repo, "commit", "-q", "-am", "broken")
+    bad_sha = list_blobs(repo)[-1]
+    jsonl.write_bytes(good.replace(b"2026-02-12T09:51:32", b"2026-02-13T09:51:32"))
+    _git(repo, "commit", "-q", "-am", "fixed")
+
+    store = HistoryStore(tmp_path / "history.jsonl")
+    assert backfill(repo, store, workers=1) == 4
+    assert store.latest_stand == "2026-02-13T09:51:32"
+    assert f"Skipping blob {bad_sha}" in caplog.text
+
+
+class _BrokenPool:
+    """Stands in for ProcessPoolExecutor after a worker died."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_BrokenPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def submit(self, fn: Any, *args: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        future.set_exception(BrokenProcessPool("a worker terminated abruptly"))
+        return future
+
+
+def test_pool_failure_is_not_skipped(
+    repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A dead worker aborts the backfill instead of dropping revisions."""
+    monkeypatch.setattr(backfill_module, "ProcessPoolExecutor", _BrokenPool)
+    history = tmp_path / "history.jsonl"
+    with pytest.raises(SystemExit, match="1"):
+        main(["backfill", "--repo", str(repo), "--history", str(history), "--workers", "1"])
+    assert "Backfill failed" in caplog.text
+    assert "Skipping blob" not in caplog.text
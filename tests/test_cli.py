@@ -3,12 +3,15 @@
 
 """Tests for the CLI entry point."""
 
+import urllib.error
+from collections.abc import Iterator
+from email.message import Message
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scheinfirmen_at.cli import main
+from scheinfirmen_at.cli import EXIT_NOT_MODIFIED, SOURCE_HASH_FILE, main
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_CSV = FIXTURES_DIR / "sample_raw.csv"
@@ -49,6 +52,12 @@ def test_cli_output_row_counts(tmp_path: Path) -> None:
     assert len(jsonl_lines) == 11
 
 
+def test_cli_sqlite(tmp_path: Path) -> None:
+    """--sqlite adds an SQLite database that passes verification."""
+    main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--sqlite", *MIN_ROWS])
+    assert (tmp_path / "scheinfirmen.sqlite").exists()
+
+
 def test_cli_creates_output_dir(tmp_path: Path) -> None:
     """CLI creates the output directory if it doesn't exist."""
     out = tmp_path / "subdir" / "output"
@@ -114,16 +123,32 @@ def test_cli_stats_nonfatal_without_git(tmp_path: Path) -> None:
     assert (tmp_path / "scheinfirmen.csv").exists()
 
 
-@patch("scheinfirmen_at.cli.download_csv")
+@patch("scheinfirmen_at.cli.stream_csv")
 def test_cli_download_path(mock_dl: MagicMock, tmp_path: Path) -> None:
     """CLI downloads from URL when --input is not provided."""
-    mock_dl.return_value = SAMPLE_CSV.read_bytes()
+    raw = SAMPLE_CSV.read_bytes()
+    mock_dl.return_value = iter([raw[:100], raw[100:]])
     main(["-o", str(tmp_path), "--skip-verify", *MIN_ROWS])
     mock_dl.assert_called_once()
     assert (tmp_path / "scheinfirmen.csv").exists()
 
 
-@patch("scheinfirmen_at.cli.download_csv")
+@patch("scheinfirmen_at.cli.stream_csv")
+def test_cli_download_interrupted_exits(mock_dl: MagicMock, tmp_path: Path) -> None:
+    """CLI exits 1 when the download fails after streaming has started."""
+    raw = SAMPLE_CSV.read_bytes()
+
+    def chunks() -> Iterator[bytes]:
+        yield raw[:100]
+        raise RuntimeError("connection reset")
+
+    mock_dl.return_value = chunks()
+    with pytest.raises(SystemExit, match="1"):
+        main(["-o", str(tmp_path), "--skip-verify", *MIN_ROWS])
+    assert not (tmp_path / "scheinfirmen.csv").exists()
+
+
+@patch("scheinfirmen_at.cli.stream_csv")
 def test_cli_download_failure_exits(mock_dl: MagicMock, tmp_path: Path) -> None:
     """CLI exits 1 when download raises RuntimeError."""
     mock_dl.side_effect = RuntimeError("connection refused")
@@ -136,3 +161,329 @@ def test_cli_verify_failure_exits(mock_verify: MagicMock, tmp_path: Path) -> Non
     """CLI exits 1 when verification detects inconsistency."""
     with pytest.raises(SystemExit, match="1"):
         main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), *MIN_ROWS])
+
+
+def test_cli_verify_failure_keeps_published_outputs(tmp_path: Path) -> None:
+    """Failed verification leaves the previous outputs byte-for-byte in place."""
+    main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), *MIN_ROWS])
+    before = {p.name: p.read_bytes() for p in tmp_path.iterdir()}
+
+    changed = tmp_path / "changed.csv"
+    raw = SAMPLE_CSV.read_bytes()
+    changed.write_bytes(raw.replace(b"10.02.2026 09:51:32", b"11.02.2026 09:51:32"))
+    with (
+        patch("scheinfirmen_at.cli.verify_outputs", return_value=["count mismatch"]),
+        pytest.raises(SystemExit, match="1"),
+    ):
+        main(["--input", str(changed), "-o", str(tmp_path), *MIN_ROWS])
+
+    changed.unlink()
+    after = {p.name: p.read_bytes() for p in tmp_path.iterdir()}
+    assert after == before  # includes: no .staging-* directory left behind
+
+
+def test_cli_verifies_staged_files(tmp_path: Path) -> None:
+    """Verification runs before anything is published to the output dir."""
+    seen: list[bool] = []
+
+    def fake_verify(csv_path: Path, *args: object, **kwargs: object) -> list[str]:
+        seen.append(csv_path.parent != tmp_path and csv_path.exists())
+        seen.append((tmp_path / "scheinfirmen.csv").exists())
+        return []
+
+    with patch("scheinfirmen_at.cli.verify_outputs", side_effect=fake_verify):
+        main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), *MIN_ROWS])
+    assert seen == [True, False]
+    assert (tmp_path / "scheinfirmen.csv").exists()
+    assert not list(tmp_path.glob(".staging-*"))
+
+
+@patch("scheinfirmen_at.download.urllib.request.urlopen")
+def test_cli_cache_not_modified_exits(
+    mock_urlopen: MagicMock, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """With --cache-dir, a 304 answer skips the pipeline with a distinct status."""
+    out = tmp_path / "out"
+    cache_dir = tmp_path / "cache"
+    headers = Message()
+    headers["ETag"] = '"v1"'
+    mock_resp = MagicMock()
+    mock_resp.read.side_effect = [SAMPLE_CSV.read_bytes(), b""]
+    mock_resp.headers = headers
+    mock_resp.__enter__ = lambda s: s
+    mock_resp.__exit__ = MagicMock(return_value=False)
+    mock_urlopen.return_value = mock_resp
+
+    # First run: full download, validators committed after success
+    main(["-o", str(out), "--cache-dir", str(cache_dir), "--skip-verify", *MIN_ROWS])
+    assert any(cache_dir.iterdir())
+    mtime = (out / "scheinfirmen.jsonl").stat().st_mtime_ns
+
+    # Second run: server answers 304
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "https://example.com", 304, "Not Modified", Message(), None
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        main(["-o", str(out), "--cache-dir", str(cache_dir), *MIN_ROWS])
+    assert excinfo.value.code == EXIT_NOT_MODIFIED
+    req = mock_urlopen.call_args[0][0]
+    assert req.get_header("If-none-match") == '"v1"'
+    assert (out / "scheinfirmen.jsonl").stat().st_mtime_ns == mtime
+    assert "UNCHANGED" in capsys.readouterr().out
+
+
+@patch("scheinfirmen_at.cli.stream_csv")
+def test_cli_cache_not_committed_on_failure(mock_dl: MagicMock, tmp_path: Path) -> None:
+    """Validators are not persisted when the pipeline aborts."""
+    cache_dir = tmp_path / "cache"
+
+    def fake_stream(url: str, cache: object) -> Iterator[bytes]:
+        headers = Message()
+        headers["ETag"] = '"v1"'
+        cache.stage(url, headers)  # type: ignore[attr-defined]
+        return iter([SAMPLE_CSV.read_bytes()])
+
+    mock_dl.side_effect = fake_stream
+    with pytest.raises(SystemExit, match="1"):
+        main(["-o", str(tmp_path), "--cache-dir", str(cache_dir), "--min-rows", "9999"])
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_cli_skip_unchanged(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """--skip-unchanged leaves outputs alone when only the Stand line differs."""
+    out = tmp_path / "out"
+    main(["--input", str(SAMPLE_CSV), "-o", str(out), "--skip-verify", *MIN_ROWS])
+    assert (out / SOURCE_HASH_FILE).exists()
+    capsys.readouterr()
+
+    later = tmp_path / "later.csv"
+    later.write_bytes(
+        SAMPLE_CSV.read_bytes().replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+    )
+    before = {p.name: p.read_bytes() for p in out.iterdir()}
+    main(["--input", str(later), "-o", str(out), "--skip-unchanged", *MIN_ROWS])
+    assert capsys.readouterr().out.startswith("UNCHANGED:")
+    assert {p.name: p.read_bytes() for p in out.iterdir()} == before
+
+    main([
+        "--input", str(later), "-o", str(out),
+        "--skip-unchanged", "--refresh-stand", *MIN_ROWS,
+    ])
+    first = (out / "scheinfirmen.jsonl").read_text(encoding="utf-8").splitlines()[0]
+    assert "2026-02-11T03:15:00" in first
+
+
+def test_cli_skip_unchanged_runs_on_changed_content(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    out = tmp_path / "out"
+    main(["--input", str(SAMPLE_CSV), "-o", str(out), "--skip-verify", *MIN_ROWS])
+    hash_before = (out / SOURCE_HASH_FILE).read_text(encoding="utf-8")
+    capsys.readouterr()
+
+    changed = tmp_path / "changed.csv"
+    changed.write_bytes(SAMPLE_CSV.read_bytes().replace(b"ATU79209223", b"ATU79209224"))
+    main(["--input", str(changed), "-o", str(out), "--skip-unchanged", *MIN_ROWS])
+    assert capsys.readouterr().out.startswith("OK:")
+    assert "ATU79209224" in (out / "scheinfirmen.jsonl").read_text(encoding="utf-8")
+    assert (out / SOURCE_HASH_FILE).read_text(encoding="utf-8") != hash_before
+
+
+def test_cli_skip_unchanged_rewrites_missing_outputs(tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    main(["--input", str(SAMPLE_CSV), "-o", str(out), "--skip-verify", *MIN_ROWS])
+    (out / "scheinfirmen.xml").unlink()
+    main(["--input", str(SAMPLE_CSV), "-o", str(out), "--skip-unchanged", *MIN_ROWS])
+    assert (out / "scheinfirmen.xml").exists()
+
+
+def test_cli_writes_changes(tmp_path: Path) -> None:
+    """changes.jsonl holds the delta against the previous snapshot in the output dir."""
+    import json
+
+    out = tmp_path / "out"
+    main(["--input", str(SAMPLE_CSV), "-o", str(out), "--skip-verify", *MIN_ROWS])
+    first = (out / "changes.jsonl").read_text(encoding="utf-8").splitlines()
+    meta = json.loads(first[0])["_metadata"]
+    assert meta["previous_stand"] is None
+    assert meta["added"] == 10
+
+    changed = tmp_path / "changed.csv"
+    changed.write_bytes(
+        SAMPLE_CSV.read_bytes()
+        .replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+        .replace(b"1020 Wien, Rembrandtstra\xdfe 15", b"1030 Wien, Neugasse 1")
+    )
+    main(["--input", str(changed), "-o", str(out), "--skip-verify", *MIN_ROWS])
+    lines = [
+        json.loads(line)
+        for line in (out / "changes.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    meta = lines[0]["_metadata"]
+    assert meta["previous_stand"] == "2026-02-10T09:51:32"
+    assert (meta["added"], meta["removed"], meta["changed"]) == (0, 0, 1)
+    assert lines[1]["op"] == "change"
+    assert lines[1]["stand"] == "2026-02-11T03:15:00"
+    assert lines[1]["record"]["anschrift"] == "1030 Wien, Neugasse 1"
+
+
+def test_cli_rerun_keeps_changes(tmp_path: Path) -> None:
+    """Rerunning on the published stand keeps the previous delta."""
+    out = tmp_path / "out"
+    args = ["-o", str(out), "--skip-verify", *MIN_ROWS]
+    main(["--input", str(SAMPLE_CSV), *args])
+    changed = tmp_path / "changed.csv"
+    changed.write_bytes(
+        SAMPLE_CSV.read_bytes()
+        .replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+        .replace(b"1020 Wien, Rembrandtstra\xdfe 15", b"1030 Wien, Neugasse 1")
+    )
+    main(["--input", str(changed), *args])
+    delta = (out / "changes.jsonl").read_bytes()
+    assert b'"changed": 1' in delta
+
+    main(["--input", str(changed), *args])
+    assert (out / "changes.jsonl").read_bytes() == delta
+
+
+def test_cli_appends_history(tmp_path: Path) -> None:
+    """--history appends each new stand; rerunning the same stand is a no-op."""
+    from scheinfirmen_at.history import HistoryStore
+
+    out = tmp_path / "out"
+    history = tmp_path / "history.jsonl"
+    args = ["-o", str(out), "--skip-verify", "--history", str(history), *MIN_ROWS]
+    main(["--input", str(SAMPLE_CSV), *args])
+    main(["--input", str(SAMPLE_CSV), *args])
+    changed = tmp_path / "changed.csv"
+    changed.write_bytes(SAMPLE_CSV.read_bytes().replace(b"10.02.2026", b"11.02.2026"))
+    main(["--input", str(changed), *args])
+
+    store = HistoryStore(history)
+    assert store.stands == ["2026-02-10T09:51:32", "2026-02-11T09:51:32"]
+    assert len(store.as_of("2026-02-11").records) == 10
+
+
+def test_cli_stats_weekly(tmp_path: Path) -> None:
+    """--stats folds each run's changes.jsonl into STATS.weekly.json."""
+    import json
+
+    out = tmp_path / "out"
+    stats = tmp_path / "STATS.md"
+    args = ["-o", str(out), "--skip-verify", "--stats", str(stats), *MIN_ROWS]
+    main(["--input", str(SAMPLE_CSV), *args])
+    changed = tmp_path / "changed.csv"
+    lines = SAMPLE_CSV.read_bytes().replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+    changed.write_bytes(
+        b"".join(ln for ln in lines.splitlines(keepends=True) if b"Mustermann" not in ln)
+    )
+    main(["--input", str(changed), *args])
+
+    state = json.loads((tmp_path / "STATS.weekly.json").read_text(encoding="utf-8"))
+    assert state["last_stand"] == "2026-02-11T03:15:00"
+    assert state["weeks"] == {"2026-W07": {"added": 0, "removed": 1}}
+    assert "## Zugänge und Abgänge pro Woche" in stats.read_text(encoding="utf-8")
+
+
+def test_cli_parquet_and_feather(tmp_path: Path) -> None:
+    """--parquet/--feather write typed files that pass cross-format verification."""
+    pytest.importorskip("pyarrow")
+    main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--parquet", "--feather", *MIN_ROWS])
+    assert (tmp_path / "scheinfirmen.parquet").exists()
+    assert (tmp_path / "scheinfirmen.feather").exists()
+
+
+def test_cli_refresh_stand_all_formats(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """--refresh-stand also updates the SQLite, Parquet and Feather metadata."""
+    pytest.importorskip("pyarrow")
+    import sqlite3
+
+    import pyarrow.feather as feather  # type: ignore[import-untyped,unused-ignore]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped,unused-ignore]
+
+    formats = ["--sqlite", "--parquet", "--feather"]
+    main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--skip-verify", *formats, *MIN_ROWS])
+    later = tmp_path / "later.csv"
+    later.write_bytes(
+        SAMPLE_CSV.read_bytes().replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+    )
+    main([
+        "--input", str(later), "-o", str(tmp_path),
+        "--skip-unchanged", "--refresh-stand", *formats, *MIN_ROWS,
+    ])
+    assert "UNCHANGED:" in capsys.readouterr().out
+
+    con = sqlite3.connect(tmp_path / "scheinfirmen.sqlite")
+    (stand,) = con.execute("SELECT value FROM metadata WHERE key = 'stand'").fetchone()
+    con.close()
+    assert stand == "2026-02-11T03:15:00"
+    for table in (
+        pq.read_table(tmp_path / "scheinfirmen.parquet"),
+        feather.read_table(tmp_path / "scheinfirmen.feather"),
+    ):
+        assert table.schema.metadata[b"stand"] == b"2026-02-11T03:15:00"
+
+
+def test_cli_builds_column_view_once(tmp_path: Path) -> None:
+    """Validation, Parquet, Feather and stats share one ColumnarView."""
+    pytest.importorskip("pyarrow")
+    from scheinfirmen_at.columnar import ColumnarView
+
+    init = ColumnarView.__init__
+    with patch.object(ColumnarView, "__init__", autospec=True, side_effect=init) as spy:
+        main([
+            "--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--parquet", "--feather",
+            "--stats", str(tmp_path / "STATS.md"), *MIN_ROWS,
+        ])
+    assert spy.call_count == 1
+    assert (tmp_path / "STATS.md").exists()
+
+
+def test_cli_parquet_without_pyarrow(tmp_path: Path) -> None:
+    """A missing optional dependency fails before any output is written."""
+    with (
+        patch("scheinfirmen_at.cli.import_pyarrow", side_effect=ImportError("no pyarrow")),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--parquet", *MIN_ROWS])
+    assert exc_info.value.code == 1
+    assert not (tmp_path / "scheinfirmen.csv").exists()
+
+
+def test_cli_metrics(tmp_path: Path) -> None:
+    """--metrics / --metrics-prometheus record every pipeline stage."""
+    import json
+
+    metrics_path = tmp_path / "metrics.json"
+    prom_path = tmp_path / "metrics.prom"
+    main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path / "out"), "--sqlite",
+          "--metrics", str(metrics_path), "--metrics-prometheus", str(prom_path), *MIN_ROWS])
+
+    data = json.loads(metrics_path.read_text(encoding="utf-8"))
+    assert data["exit_code"] == 0
+    stages = {s["stage"]: s for s in data["stages"]}
+    assert list(stages) == [
+        "parse", "normalize", "validate", "diff", "write_csv_jsonl_xml", "write_sqlite",
+        "write_changes", "write_schemas", "verify", "publish",
+    ]
+    assert stages["parse"]["records"] == 10
+    assert stages["parse"]["payload_bytes"] == SAMPLE_CSV.stat().st_size
+    assert stages["write_changes"]["records"] == 10  # all added
+    assert 'scheinfirmen_stage_records{stage="verify"} 10' in prom_path.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_cli_metrics_on_failure(tmp_path: Path) -> None:
+    """Failed runs still write metrics, with the exit status."""
+    import json
+
+    metrics_path = tmp_path / "metrics.json"
+    with pytest.raises(SystemExit, match="1"):
+        main(["--input", str(SAMPLE_CSV), "-o", str(tmp_path), "--min-rows", "100",
+              "--metrics", str(metrics_path)])
+    data = json.loads(metrics_path.read_text(encoding="utf-8"))
+    assert data["exit_code"] == 1
+    assert [s["stage"] for s in data["stages"]] == ["parse", "normalize", "validate"]
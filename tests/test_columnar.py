@@ -0,0 +1,103 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the columnar record view."""
+
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.columnar import INVALID_DATE, NULL_DATE, ColumnarView, StringColumn
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.parse import ParseResult
+from scheinfirmen_at.stats import compute_monthly_stats, parse_jsonl_records
+from scheinfirmen_at.validate import validate_records
+
+
+class TestStringColumn:
+    def test_values_roundtrip(self) -> None:
+        values = ["abc", None, "", "Ölhändler", None]
+        column = StringColumn(values)
+        assert len(column) == 5
+        assert list(column) == values
+        assert [column[i] for i in range(5)] == values
+
+    def test_negative_index_and_slice(self) -> None:
+        column = StringColumn(["ab", "cd", None, "ef"])
+        assert column[-1] == "ef"
+        assert column[-2] is None
+        assert column[-4] == "ab"
+        assert column[1:3] == ["cd", None]
+        assert column[::-1] == ["ef", None, "cd", "ab"]
+        with pytest.raises(IndexError):
+            column[4]
+        with pytest.raises(IndexError):
+            column[-5]
+
+    def test_null_vs_empty(self) -> None:
+        column = StringColumn([None, "", "x"])
+        assert column.is_null(0)
+        assert not column.is_null(1)
+        assert list(column.empty_rows()) == [0, 1]
+
+    def test_empty(self) -> None:
+        column = StringColumn([])
+        assert len(column) == 0
+        assert list(column) == []
+
+
+class TestColumnarView:
+    def test_records_roundtrip(self, sample_result: ParseResult) -> None:
+        view = ColumnarView.from_result(sample_result)
+        assert len(view) == len(sample_result.records)
+        assert [view.record(i) for i in range(len(view))] == sample_result.records
+        assert view.record(-1) == sample_result.records[-1]
+
+    def test_date_ordinals(self, sample_result: ParseResult) -> None:
+        view = ColumnarView.from_result(sample_result)
+        ordinals = view.date_ordinals("veroeffentlicht")
+        assert ordinals.typecode == "i"
+        for rec, ordinal in zip(sample_result.records, ordinals, strict=True):
+            assert date.fromordinal(ordinal).isoformat() == rec.veroeffentlicht
+
+    def test_null_and_invalid_dates(self, sample_result: ParseResult) -> None:
+        rec = sample_result.records[0]
+        records = [
+            replace(rec, seit=None),
+            replace(rec, seit="01.02.2024"),
+            replace(rec, seit="2024-02-30"),
+            replace(rec, seit=""),
+        ]
+        ordinals = ColumnarView(records).date_ordinals("seit")
+        assert list(ordinals) == [NULL_DATE, INVALID_DATE, INVALID_DATE, INVALID_DATE]
+
+
+class TestConsumers:
+    def test_validate_with_view(self, sample_result: ParseResult) -> None:
+        records = list(sample_result.records)
+        records[1] = replace(records[1], name="", uid="XX", veroeffentlicht="2024-13-01")
+        result = replace(sample_result, records=records)
+        view = ColumnarView.from_result(result)
+        assert validate_records(result, min_rows=1, columns=view) == validate_records(
+            result, min_rows=1
+        )
+
+    def test_validate_errors_in_row_order(self, sample_result: ParseResult) -> None:
+        records = list(sample_result.records)
+        records[3] = replace(records[3], name="")
+        records[1] = replace(records[1], rechtskraeftig="x", anschrift="")
+        validation = validate_records(replace(sample_result, records=records), min_rows=1)
+        assert [(e.row, e.field) for e in validation.errors] == [
+            (2, "anschrift"),
+            (2, "rechtskraeftig"),
+            (4, "name"),
+        ]
+
+    def test_monthly_stats_from_view(self, sample_result: ParseResult, tmp_path: Path) -> None:
+        jsonl = tmp_path / "s.jsonl"
+        write_jsonl(sample_result, jsonl)
+        records, _, _ = parse_jsonl_records(jsonl)
+        view = ColumnarView.from_result(sample_result)
+        assert compute_monthly_stats(view) == compute_monthly_stats(records)
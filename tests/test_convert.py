@@ -2,10 +2,30 @@
 
 import csv
 import json
+import sqlite3
 import xml.etree.ElementTree as ET
+from dataclasses import replace
 from pathlib import Path
-
-from scheinfirmen_at.convert import write_csv, write_jsonl, write_xml
+from typing import Any
+
+import pytest
+
+from scheinfirmen_at.convert import (
+    CsvSink,
+    JsonlSink,
+    OutputMeta,
+    XmlSink,
+    read_jsonl,
+    refresh_stand,
+    split_anschrift,
+    write_csv,
+    write_feather,
+    write_jsonl,
+    write_parquet,
+    write_records,
+    write_sqlite,
+    write_xml,
+)
 from scheinfirmen_at.parse import ParseResult
 
 
@@ -183,3 +203,267 @@ def test_write_csv_creates_parent_dir(sample_result: ParseResult, tmp_path: Path
     path = tmp_path / "subdir" / "out.csv"
     write_csv(sample_result, path)
     assert path.exists()
+
+
+def test_refresh_stand_updates_only_timestamp(
+    sample_result: ParseResult, tmp_path: Path
+) -> None:
+    jsonl_path = tmp_path / "out.jsonl"
+    xml_path = tmp_path / "out.xml"
+    write_jsonl(sample_result, jsonl_path)
+    write_xml(sample_result, xml_path)
+    jsonl_records = jsonl_path.read_text(encoding="utf-8").splitlines()[1:]
+
+    refresh_stand(jsonl_path, xml_path, "2026-03-01", "03:15:00")
+
+    lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["_metadata"]["stand"] == "2026-03-01T03:15:00"
+    assert lines[1:] == jsonl_records
+
+    root = ET.parse(xml_path).getroot()
+    assert root.get("stand") == "2026-03-01"
+    assert root.get("zeit") == "03:15:00"
+    assert root.get("anzahl") == str(sample_result.raw_row_count)
+    assert len(root.findall("scheinfirma")) == sample_result.raw_row_count
+
+
+def test_refresh_stand_updates_sqlite_and_arrow(
+    sample_result: ParseResult, tmp_path: Path
+) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.feather as feather  # type: ignore[import-untyped,unused-ignore]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped,unused-ignore]
+
+    paths = {ext: tmp_path / f"out.{ext}" for ext in ("jsonl", "xml", "sqlite", "parquet", "arrow")}
+    write_jsonl(sample_result, paths["jsonl"])
+    write_xml(sample_result, paths["xml"])
+    write_sqlite(sample_result, paths["sqlite"])
+    write_parquet(sample_result, paths["parquet"])
+    write_feather(sample_result, paths["arrow"])
+    tables = [pq.read_table(paths["parquet"]), feather.read_table(paths["arrow"])]
+
+    refresh_stand(
+        paths["jsonl"],
+        paths["xml"],
+        "2026-03-01",
+        "03:15:00",
+        sqlite_path=paths["sqlite"],
+        parquet_path=paths["parquet"],
+        feather_path=paths["arrow"],
+    )
+
+    con = sqlite3.connect(paths["sqlite"])
+    metadata = dict(con.execute("SELECT key, value FROM metadata"))
+    (count,) = con.execute("SELECT COUNT(*) FROM scheinfirmen").fetchone()
+    con.close()
+    assert metadata["stand"] == "2026-03-01T03:15:00"
+    assert count == sample_result.raw_row_count
+
+    refreshed = [pq.read_table(paths["parquet"]), feather.read_table(paths["arrow"])]
+    for before, after in zip(tables, refreshed, strict=True):
+        assert after.schema.metadata[b"stand"] == b"2026-03-01T03:15:00"
+        assert after.schema.metadata[b"count"] == b"10"
+        assert after.equals(before)
+
+
+def test_write_sqlite_row_count(sample_result: ParseResult, tmp_path: Path) -> None:
+    path = tmp_path / "out.sqlite"
+    n = write_sqlite(sample_result, path)
+    assert n == sample_result.raw_row_count
+    con = sqlite3.connect(path)
+    (count,) = con.execute("SELECT COUNT(*) FROM scheinfirmen").fetchone()
+    con.close()
+    assert count == sample_result.raw_row_count
+
+
+def test_write_sqlite_metadata(sample_result: ParseResult, tmp_path: Path) -> None:
+    path = tmp_path / "out.sqlite"
+    write_sqlite(sample_result, path)
+    con = sqlite3.connect(path)
+    meta = dict(con.execute("SELECT key, value FROM metadata"))
+    con.close()
+    assert meta["stand"] == f"{sample_result.stand_datum}T{sample_result.stand_zeit}"
+    assert meta["count"] == str(sample_result.raw_row_count)
+    assert meta["source"].startswith("https://")
+
+
+def test_write_sqlite_null_for_none_fields(sample_result: ParseResult, tmp_path: Path) -> None:
+    path = tmp_path / "out.sqlite"
+    write_sqlite(sample_result, path)
+    con = sqlite3.connect(path)
+    row = con.execute(
+        "SELECT seit, geburtsdatum, fbnr, uid FROM scheinfirmen ORDER BY id LIMIT 1"
+    ).fetchone()
+    con.close()
+    assert row == (None, None, "597821z", "ATU79209223")
+
+
+def test_write_sqlite_uid_lookup_uses_index(
+    sample_result: ParseResult, tmp_path: Path
+) -> None:
+    path = tmp_path / "out.sqlite"
+    write_sqlite(sample_result, path)
+    con = sqlite3.connect(path)
+    indexes = {
+        row[0]
+        for row in con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    plan = " ".join(
+        str(row[-1])
+        for row in con.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM scheinfirmen WHERE uid = ?",
+            ("ATU79209223",),
+        )
+    )
+    con.close()
+    assert {
+        "idx_scheinfirmen_uid",
+        "idx_scheinfirmen_fbnr",
+        "idx_scheinfirmen_kennziffer",
+        "idx_scheinfirmen_name",
+        "idx_scheinfirmen_veroeffentlicht",
+    } <= indexes
+    assert "idx_scheinfirmen_uid" in plan
+
+
+def test_write_sqlite_replaces_existing_file(
+    sample_result: ParseResult, tmp_path: Path
+) -> None:
+    path = tmp_path / "out.sqlite"
+    write_sqlite(sample_result, path)
+    write_sqlite(sample_result, path)
+    con = sqlite3.connect(path)
+    (count,) = con.execute("SELECT COUNT(*) FROM scheinfirmen").fetchone()
+    con.close()
+    assert count == sample_result.raw_row_count
+
+
+def test_read_jsonl_round_trip(sample_result: ParseResult, tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    write_jsonl(sample_result, path)
+    assert read_jsonl(path) == sample_result
+
+
+def test_read_jsonl_missing_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"name": "X"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="_metadata"):
+        read_jsonl(path)
+
+
+@pytest.mark.parametrize(
+    ("anschrift", "expected"),
+    [
+        ("1100 Wien, Quellenstraße 145", ("1100", "Wien")),
+        ("4020 Linz , Münzbergstraße 3", ("4020", "Linz")),
+        ("83103 Bratislava, Skultetyho 18", ("83103", "Bratislava")),
+        ("Wien 1100, Puchsbaumgasse 37/14", (None, None)),
+        ("", (None, None)),
+    ],
+)
+def test_split_anschrift(anschrift: str, expected: tuple[str | None, str | None]) -> None:
+    assert split_anschrift(anschrift) == expected
+
+
+@pytest.mark.parametrize("writer", [write_parquet, write_feather])
+def test_write_arrow_typed_columns(
+    writer: Any, sample_result: ParseResult, tmp_path: Path
+) -> None:
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather as feather  # type: ignore[import-untyped,unused-ignore]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped,unused-ignore]
+
+    path = tmp_path / "out.arrow"
+    assert writer(sample_result, path) == sample_result.raw_row_count
+    table = pq.read_table(path) if writer is write_parquet else feather.read_table(path)
+
+    assert table.num_rows == sample_result.raw_row_count
+    assert table.schema.field("veroeffentlicht").type == pa.date32()
+    assert table.schema.field("geburtsdatum").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("plz").type)
+    assert pa.types.is_dictionary(table.schema.field("ort").type)
+    assert table.schema.metadata[b"stand"] == b"2026-02-10T09:51:32"
+    assert table.schema.metadata[b"count"] == b"10"
+
+    rows = table.to_pylist()
+    for rec, row in zip(sample_result.records, rows, strict=True):
+        assert row["name"] == rec.name
+        assert row["uid"] == rec.uid
+        assert row["veroeffentlicht"].isoformat() == rec.veroeffentlicht
+        assert (row["seit"] and row["seit"].isoformat()) == rec.seit
+    assert rows[0]["plz"] == "1100"
+    assert rows[0]["ort"] == "Wien"
+
+
+def test_write_parquet_rejects_invalid_date(sample_result: ParseResult, tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    records = list(sample_result.records)
+    records[2] = replace(records[2], seit="15.01.2024")
+    with pytest.raises(ValueError, match=r"Row 3 \[seit\]"):
+        write_parquet(replace(sample_result, records=records), tmp_path / "out.parquet")
+
+
+class _ListSink:
+    """Minimal custom sink: collects rows in memory."""
+
+    def __init__(self) -> None:
+        self.meta: OutputMeta | None = None
+        self.rows: list[dict[str, str | None]] = []
+        self.closed = False
+
+    def open(self, meta: OutputMeta) -> None:
+        self.meta = meta
+
+    def write(self, row: dict[str, str | None]) -> None:
+        self.rows.append(row)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_write_records_matches_single_writers(sample_result: ParseResult, tmp_path: Path) -> None:
+    """One pass over all sinks yields byte-identical files to the single writers."""
+    write_csv(sample_result, tmp_path / "a.csv")
+    write_jsonl(sample_result, tmp_path / "a.jsonl")
+    write_xml(sample_result, tmp_path / "a.xml")
+    n = write_records(
+        sample_result.records,
+        OutputMeta.from_result(sample_result),
+        [CsvSink(tmp_path / "b.csv"), JsonlSink(tmp_path / "b.jsonl"), XmlSink(tmp_path / "b.xml")],
+    )
+    assert n == sample_result.raw_row_count
+    for ext in ("csv", "jsonl", "xml"):
+        assert (tmp_path / f"a.{ext}").read_bytes() == (tmp_path / f"b.{ext}").read_bytes()
+
+
+def test_write_records_from_iterator(sample_result: ParseResult, tmp_path: Path) -> None:
+    """Records can come from a generator; each is converted once for all sinks."""
+    consumed = 0
+
+    def gen() -> Any:
+        nonlocal consumed
+        for rec in sample_result.records:
+            consumed += 1
+            yield rec
+
+    sink = _ListSink()
+    meta = OutputMeta("2026-02-10", "09:51:32", 10)
+    n = write_records(gen(), meta, [sink, JsonlSink(tmp_path / "out.jsonl")])
+    assert n == consumed == 10
+    assert sink.meta == meta
+    assert sink.closed
+    assert sink.rows[0]["name"] == sample_result.records[0].name
+    assert list(sink.rows[0]) == list(json.loads(
+        (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()[1]
+    ))
+
+
+def test_write_records_closes_sinks_on_error(tmp_path: Path) -> None:
+    def failing() -> Any:
+        raise ValueError("boom")
+        yield
+
+    sink = _ListSink()
+    with pytest.raises(ValueError, match="boom"):
+        write_records(failing(), OutputMeta("2026-02-10", "09:51:32", 0), [sink])
+    assert sink.closed
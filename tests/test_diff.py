@@ -0,0 +1,145 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the snapshot diff module."""
+
+import copy
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.diff import (
+    diff_jsonl,
+    diff_records,
+    diff_results,
+    keyed_records,
+    record_key,
+    write_changes,
+)
+from scheinfirmen_at.parse import ParseResult
+from tests.conftest import make_record
+
+
+class TestRecordKey:
+    def test_uid_preferred(self) -> None:
+        assert record_key(make_record("A", uid="atu12345678", fbnr="123456a")) == "uid:ATU12345678"
+
+    def test_fbnr_fallback(self) -> None:
+        assert record_key(make_record("A", fbnr="123456A")) == "fbnr:123456a"
+
+    def test_name_and_birth_date_fallback(self) -> None:
+        key = record_key(make_record("Mustermann,  Max", geburtsdatum="1975-05-15"))
+        assert key == "name:mustermann, max|1975-05-15"
+
+    def test_duplicate_keys_get_suffix(self) -> None:
+        keyed = keyed_records([make_record("A", uid="ATU1"), make_record("B", uid="ATU1")])
+        assert list(keyed) == ["uid:ATU1", "uid:ATU1#2"]
+
+
+class TestDiff:
+    def test_identical(self, sample_result: ParseResult) -> None:
+        diff = diff_results(sample_result, copy.deepcopy(sample_result))
+        assert diff.empty
+        assert str(diff) == "+0 added, -0 removed, ~0 modified"
+
+    def test_added_and_removed(self) -> None:
+        a = make_record("A", uid="ATU1")
+        b = make_record("B", uid="ATU2")
+        c = make_record("C", uid="ATU3")
+        diff = diff_records([a, b], [b, c])
+        assert diff.added == {"uid:ATU3": c}
+        assert diff.removed == {"uid:ATU1": a}
+        assert diff.modified == []
+
+    def test_modified_fields(self) -> None:
+        old = make_record("A", uid="ATU1")
+        new = replace(old, anschrift="1020 Wien, Neugasse 2", name="A neu")
+        diff = diff_records([old], [new])
+        assert diff.added == {} and diff.removed == {}
+        assert len(diff.modified) == 1
+        change = diff.modified[0]
+        assert change.key == "uid:ATU1"
+        assert change.old is old and change.new is new
+        assert change.fields == ["name", "anschrift"]
+
+    def test_natural_person_matched_by_name_and_birth_date(self) -> None:
+        old = make_record("Muster, Max", geburtsdatum="1975-05-15")
+        new = replace(old, anschrift="8010 Graz, Platz 1")
+        diff = diff_records([old], [new])
+        assert [c.fields for c in diff.modified] == [["anschrift"]]
+
+    def test_uid_added_changes_identity(self) -> None:
+        # A UID appearing for a row that had none is a remove + add, because
+        # the identity key is derived from the UID first.
+        old = make_record("A", fbnr="123456a")
+        new = replace(old, uid="ATU1")
+        diff = diff_records([old], [new])
+        assert diff.added == {"uid:ATU1": new}
+        assert diff.removed == {"fbnr:123456a": old}
+
+    def test_diff_jsonl(self, sample_result: ParseResult, tmp_path: Path) -> None:
+        old_path, new_path = tmp_path / "old.jsonl", tmp_path / "new.jsonl"
+        write_jsonl(sample_result, old_path)
+        newer = copy.deepcopy(sample_result)
+        removed = newer.records.pop(0)
+        newer.records[0].anschrift = "9999 Anderswo, Weg 1"
+        newer.raw_row_count = len(newer.records)
+        write_jsonl(newer, new_path)
+
+        diff = diff_jsonl(old_path, new_path)
+        assert list(diff.removed.values()) == [removed]
+        assert diff.added == {}
+        assert [c.fields for c in diff.modified] == [["anschrift"]]
+
+
+def test_write_changes(tmp_path: Path) -> None:
+    a = make_record("A", uid="ATU1")
+    b = make_record("B", uid="ATU2")
+    c = make_record("C", uid="ATU3")
+    b2 = replace(b, anschrift="8010 Graz, Platz 1")
+    diff = diff_records([a, b], [b2, c])
+    path = tmp_path / "changes.jsonl"
+    n = write_changes(diff, path, "2026-02-11T03:15:00", "2026-02-10T09:51:32")
+    assert n == 3
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    meta = lines[0]["_metadata"]
+    assert meta["stand"] == "2026-02-11T03:15:00"
+    assert meta["previous_stand"] == "2026-02-10T09:51:32"
+    assert (meta["added"], meta["removed"], meta["changed"]) == (1, 1, 1)
+
+    entries = lines[1:]
+    assert [e["op"] for e in entries] == ["remove", "change", "add"]
+    assert all(e["stand"] == "2026-02-11T03:15:00" for e in entries)
+    assert entries[0]["key"] == "uid:ATU1"
+    assert entries[1]["fields"] == ["anschrift"]
+    assert entries[1]["record"]["anschrift"] == "8010 Graz, Platz 1"
+    assert entries[2]["record"]["name"] == "C"
+
+
+def test_write_changes_duplicate_keys(tmp_path: Path) -> None:
+    """Repeated identities are addressed by their #n key in every operation."""
+    first = make_record("BARATH Peter", uid="ATU1")
+    second = make_record("BARATH Peter 2", uid="ATU1")
+    other = make_record("B", uid="ATU2")
+    path = tmp_path / "changes.jsonl"
+
+    # Second occurrence removed: the row that stays keeps "uid:ATU1"
+    write_changes(diff_records([first, second, other], [first, other]), path, "2026-02-11T03:15:00")
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()[1:]]
+    assert [(e["op"], e["key"]) for e in entries] == [("remove", "uid:ATU1#2")]
+
+    # Added again later: it must not collide with the existing "uid:ATU1"
+    write_changes(diff_records([first, other], [first, second, other]), path, "2026-02-12T03:15:00")
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()[1:]]
+    assert [(e["op"], e["key"]) for e in entries] == [("add", "uid:ATU1#2")]
+    assert entries[0]["record"]["name"] == "BARATH Peter 2"
+
+
+def test_write_changes_empty(tmp_path: Path) -> None:
+    path = tmp_path / "changes.jsonl"
+    assert write_changes(diff_records([], []), path, "2026-02-11T03:15:00") == 0
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["_metadata"]["previous_stand"] is None
@@ -4,12 +4,20 @@
 """Tests for the download module."""
 
 import urllib.error
+from email.message import Message
 from importlib.metadata import PackageNotFoundError
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scheinfirmen_at.download import _get_user_agent, download_csv
+from scheinfirmen_at.download import (
+    HttpCache,
+    NotModifiedError,
+    _get_user_agent,
+    download_csv,
+    stream_csv,
+)
 
 
 class TestGetUserAgent:
@@ -101,3 +109,170 @@ class TestDownloadCsv:
         assert mock_sleep.call_count == 2
         mock_sleep.assert_any_call(2.0)
         mock_sleep.assert_any_call(4.0)
+
+
+def _streaming_resp(chunks: list[bytes]) -> MagicMock:
+    mock_resp = MagicMock()
+    mock_resp.read.side_effect = [*chunks, b""]
+    mock_resp.__enter__ = lambda s: s
+    mock_resp.__exit__ = MagicMock(return_value=False)
+    return mock_resp
+
+
+class TestStreamCsv:
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_yields_chunks(self, mock_urlopen: MagicMock) -> None:
+        mock_urlopen.return_value = _streaming_resp([b"Name~", b"Anschrift\r\n"])
+        chunks = list(stream_csv(url="https://example.com/test.csv", chunk_size=5))
+        assert chunks == [b"Name~", b"Anschrift\r\n"]
+        mock_urlopen.return_value.read.assert_called_with(5)
+
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_connects_eagerly(self, mock_urlopen: MagicMock) -> None:
+        mock_urlopen.return_value = _streaming_resp([b"data"])
+        stream_csv(url="https://example.com/test.csv")
+        mock_urlopen.assert_called_once()
+
+    @patch("scheinfirmen_at.download.time.sleep")
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_retry_on_connect_error(
+        self, mock_urlopen: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        mock_urlopen.side_effect = [
+            urllib.error.URLError("timeout"),
+            _streaming_resp([b"ok"]),
+        ]
+        chunks = list(stream_csv(url="https://example.com/test.csv", delay=0.0))
+        assert chunks == [b"ok"]
+        assert mock_urlopen.call_count == 2
+
+    @patch("scheinfirmen_at.download.time.sleep")
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_raises_after_all_retries_exhausted(
+        self, mock_urlopen: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        mock_urlopen.side_effect = OSError("network error")
+        with pytest.raises(RuntimeError, match="after 2 attempt"):
+            stream_csv(url="https://example.com/test.csv", retries=2, delay=0.0)
+
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_mid_stream_error_raises_runtime_error(self, mock_urlopen: MagicMock) -> None:
+        mock_resp = _streaming_resp([])
+        mock_resp.read.side_effect = [b"first", OSError("connection reset")]
+        mock_urlopen.return_value = mock_resp
+
+        it = stream_csv(url="https://example.com/test.csv")
+        assert next(it) == b"first"
+        with pytest.raises(RuntimeError, match="interrupted"):
+            next(it)
+        mock_resp.close.assert_called_once()
+
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_close_without_iterating_releases_connection(
+        self, mock_urlopen: MagicMock
+    ) -> None:
+        mock_urlopen.return_value = _streaming_resp([b"data"])
+        with stream_csv(url="https://example.com/test.csv"):
+            pass
+        mock_urlopen.return_value.close.assert_called_once()
+        mock_urlopen.return_value.read.assert_not_called()
+
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_closes_when_exhausted(self, mock_urlopen: MagicMock) -> None:
+        mock_urlopen.return_value = _streaming_resp([b"data"])
+        it = stream_csv(url="https://example.com/test.csv")
+        assert list(it) == [b"data"]
+        mock_urlopen.return_value.close.assert_called_once()
+        assert list(it) == []
+        it.close()
+        mock_urlopen.return_value.close.assert_called_once()
+
+
+def _headers(**items: str) -> Message:
+    msg = Message()
+    for key, value in items.items():
+        msg[key.replace("_", "-")] = value
+    return msg
+
+
+def _http_304(url: str) -> urllib.error.HTTPError:
+    return urllib.error.HTTPError(url, 304, "Not Modified", _headers(), None)
+
+
+class TestHttpCache:
+    def test_empty_cache(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path)
+        assert cache.get("https://example.com/a") is None
+        assert cache.conditional_headers("https://example.com/a") == {}
+
+    def test_stage_is_not_persisted_until_commit(self, tmp_path: Path) -> None:
+        url = "https://example.com/a"
+        cache = HttpCache(tmp_path / "cache")
+        cache.stage(url, _headers(ETag='"abc"', Last_Modified="Tue, 10 Feb 2026 09:51:32 GMT"))
+        assert HttpCache(tmp_path / "cache").get(url) is None
+
+        cache.commit()
+        entry = HttpCache(tmp_path / "cache").get(url)
+        assert entry is not None
+        assert entry.etag == '"abc"'
+        assert cache.conditional_headers(url) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 10 Feb 2026 09:51:32 GMT",
+        }
+
+    def test_keyed_by_url(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path)
+        cache.stage("https://example.com/a", _headers(ETag='"a"'))
+        cache.commit()
+        assert cache.get("https://example.com/b") is None
+
+    def test_discard(self, tmp_path: Path) -> None:
+        url = "https://example.com/a"
+        cache = HttpCache(tmp_path)
+        cache.stage(url, _headers(ETag='"a"'))
+        cache.commit()
+        cache.discard(url)
+        assert cache.get(url) is None
+
+    def test_response_without_validators_not_staged(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path)
+        cache.stage("https://example.com/a", _headers())
+        cache.commit()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestConditionalDownload:
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_sends_conditional_headers(self, mock_urlopen: MagicMock, tmp_path: Path) -> None:
+        url = "https://example.com/test.csv"
+        cache = HttpCache(tmp_path)
+        cache.stage(url, _headers(ETag='"v1"'))
+        cache.commit()
+
+        mock_resp = _streaming_resp([b"data"])
+        mock_resp.headers = _headers(ETag='"v2"')
+        mock_urlopen.return_value = mock_resp
+
+        assert list(stream_csv(url=url, cache=cache)) == [b"data"]
+        req = mock_urlopen.call_args[0][0]
+        assert req.get_header("If-none-match") == '"v1"'
+        # New validator is staged, not yet written
+        entry = cache.get(url)
+        assert entry is not None and entry.etag == '"v1"'
+        cache.commit()
+        entry = cache.get(url)
+        assert entry is not None and entry.etag == '"v2"'
+
+    @patch("scheinfirmen_at.download.time.sleep")
+    @patch("scheinfirmen_at.download.urllib.request.urlopen")
+    def test_304_raises_not_modified_without_retry(
+        self, mock_urlopen: MagicMock, mock_sleep: MagicMock, tmp_path: Path
+    ) -> None:
+        url = "https://example.com/test.csv"
+        mock_urlopen.side_effect = _http_304(url)
+        with pytest.raises(NotModifiedError):
+            stream_csv(url=url, cache=HttpCache(tmp_path))
+        with pytest.raises(NotModifiedError):
+            download_csv(url=url, cache=HttpCache(tmp_path))
+        assert mock_urlopen.call_count == 2
+        mock_sleep.assert_not_called()
@@ -0,0 +1,157 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the append-only history store."""
+
+from dataclasses import replace
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scheinfirmen_at.history import CHECKPOINT_INTERVAL, HistoryStore, _Delta
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
+from tests.conftest import make_record
+
+
+def _snapshot(stand: str, records: list[ScheinfirmaRecord]) -> ParseResult:
+    stand_datum, _, stand_zeit = stand.partition("T")
+    return ParseResult(
+        records=records,
+        stand_datum=stand_datum,
+        stand_zeit=stand_zeit,
+        raw_row_count=len(records),
+    )
+
+
+A = make_record("A GmbH", uid="ATU11111111")
+B = make_record("B GmbH", uid="ATU22222222")
+C = make_record("C GmbH", uid="ATU33333333")
+B2 = replace(B, anschrift="1020 Wien, Neugasse 2")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> HistoryStore:
+    """Three snapshots: {A, B} → {A, B', C} → {B', C}."""
+    s = HistoryStore(tmp_path / "history.jsonl")
+    s.append(_snapshot("2026-01-05T08:00:00", [A, B]))
+    s.append(_snapshot("2026-01-12T08:00:00", [A, B2, C]))
+    s.append(_snapshot("2026-01-19T08:00:00", [B2, C]))
+    return s
+
+
+def _names(result: ParseResult) -> list[str]:
+    return sorted(r.name for r in result.records)
+
+
+class TestAsOf:
+    def test_each_stand(self, store: HistoryStore) -> None:
+        assert _names(store.as_of("2026-01-05T08:00:00")) == ["A GmbH", "B GmbH"]
+        assert _names(store.as_of("2026-01-12T08:00:00")) == ["A GmbH", "B GmbH", "C GmbH"]
+        assert _names(store.as_of("2026-01-19T08:00:00")) == ["B GmbH", "C GmbH"]
+
+    def test_between_stands_uses_latest_before(self, store: HistoryStore) -> None:
+        result = store.as_of(datetime(2026, 1, 15, 12, 0))
+        assert (result.stand_datum, result.stand_zeit) == ("2026-01-12", "08:00:00")
+        assert B2 in result.records and B not in result.records
+
+    def test_date_means_end_of_day(self, store: HistoryStore) -> None:
+        assert store.as_of(date(2026, 1, 5)).stand_datum == "2026-01-05"
+        assert store.as_of("2026-01-12").stand_datum == "2026-01-12"
+
+    def test_before_first_snapshot(self, store: HistoryStore) -> None:
+        with pytest.raises(ValueError, match="No snapshot"):
+            store.as_of("2025-12-31")
+
+    def test_matches_original_snapshot(
+        self, tmp_path: Path, sample_result: ParseResult
+    ) -> None:
+        s = HistoryStore(tmp_path / "h.jsonl")
+        s.append(sample_result)
+        assert s.as_of(f"{sample_result.stand_datum}").records == sample_result.records
+
+
+class TestRowOrder:
+    def test_insert_in_the_middle(self, tmp_path: Path) -> None:
+        s = HistoryStore(tmp_path / "h.jsonl")
+        s.append(_snapshot("2026-01-05T08:00:00", [A, C]))
+        s.append(_snapshot("2026-01-12T08:00:00", [A, B2, C]))
+        s.append(_snapshot("2026-01-19T08:00:00", [B2, C, A]))  # reordered
+        for reloaded in (s, HistoryStore(s.path)):
+            assert reloaded.as_of("2026-01-05").records == [A, C]
+            assert reloaded.as_of("2026-01-12").records == [A, B2, C]
+            assert reloaded.as_of("2026-01-19").records == [B2, C, A]
+
+    def test_order_only_stored_when_reordered(self, store: HistoryStore) -> None:
+        assert '"order"' not in store.path.read_text(encoding="utf-8")
+        store.append(_snapshot("2026-01-26T08:00:00", [C, B2]))
+        marker = store.path.read_text(encoding="utf-8").splitlines()[-1]
+        assert '"order": ["uid:ATU33333333", "uid:ATU22222222"]' in marker
+
+    def test_checkpoints(self, tmp_path: Path) -> None:
+        """Every stand is rebuilt exactly, replaying only since the last checkpoint."""
+        s = HistoryStore(tmp_path / "h.jsonl")
+        snapshots = []
+        records = [make_record(f"F{i}", uid=f"ATU{i:08d}") for i in range(5)]
+        for day in range(1, 2 * CHECKPOINT_INTERVAL + 4):
+            # Rotate one record out and a new one in, somewhere in the middle
+            records = records[1:3] + [make_record(f"N{day}", uid=f"ATU9{day:07d}")] + records[3:]
+            records[0] = replace(records[0], anschrift=f"{day} Wien")
+            snapshots.append(_snapshot(f"2026-03-{day:02d}T08:00:00", records))
+            s.append(snapshots[-1])
+
+        calls = 0
+        reorder = _Delta.reorder
+
+        def counting_reorder(self: _Delta, keys: list[str]) -> list[str]:
+            nonlocal calls
+            calls += 1
+            return reorder(self, keys)
+
+        reloaded = HistoryStore(s.path)
+        with patch.object(_Delta, "reorder", counting_reorder):
+            for snap in snapshots:
+                for store in (s, reloaded):
+                    calls = 0
+                    assert store.as_of(f"{snap.stand_datum}T{snap.stand_zeit}").records == (
+                        snap.records
+                    )
+                    assert calls < CHECKPOINT_INTERVAL
+
+
+class TestPersistence:
+    def test_reload_equals_in_memory(self, store: HistoryStore) -> None:
+        reloaded = HistoryStore(store.path)
+        assert reloaded.stands == store.stands
+        for stand in store.stands:
+            assert reloaded.as_of(stand).records == store.as_of(stand).records
+
+    def test_only_changes_are_stored(self, store: HistoryStore) -> None:
+        lines = store.path.read_text(encoding="utf-8").splitlines()
+        # 3 markers + (2 adds) + (1 change, 1 add) + (1 remove)
+        assert len(lines) == 3 + 2 + 2 + 1
+
+    def test_unchanged_snapshot_adds_only_marker(self, store: HistoryStore) -> None:
+        assert store.append(_snapshot("2026-01-26T08:00:00", [B2, C])) == 0
+        assert store.latest_stand == "2026-01-26T08:00:00"
+        assert _names(store.as_of("2026-01-26")) == ["B GmbH", "C GmbH"]
+
+    def test_rejects_older_stand(self, store: HistoryStore) -> None:
+        with pytest.raises(ValueError, match="not newer"):
+            store.append(_snapshot("2026-01-12T08:00:00", [A]))
+
+
+class TestRecordHistory:
+    def test_versions_of(self, store: HistoryStore) -> None:
+        versions = store.versions_of("uid:ATU22222222")
+        assert [(v.valid_from, v.valid_to) for v in versions] == [
+            ("2026-01-05T08:00:00", "2026-01-12T08:00:00"),
+            ("2026-01-12T08:00:00", None),
+        ]
+
+    def test_was_listed(self, store: HistoryStore) -> None:
+        assert store.was_listed("atu11111111", "2026-01-12")
+        assert not store.was_listed("ATU11111111", "2026-01-19")
+        assert not store.was_listed("ATU33333333", "2026-01-05")
+        assert not store.was_listed("ATU11111111", "2025-01-01")
@@ -0,0 +1,81 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the lookup index module."""
+
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.index import (
+    ScheinfirmenIndex,
+    normalize_fbnr,
+    normalize_kennziffer,
+    normalize_uid,
+)
+from scheinfirmen_at.parse import ParseResult
+from tests.conftest import make_record
+
+
+class TestNormalizers:
+    def test_uid(self) -> None:
+        assert normalize_uid(" atu 7920 9223\t") == "ATU79209223"
+
+    def test_fbnr(self) -> None:
+        assert normalize_fbnr("FN 597821 Z") == "597821z"
+        assert normalize_fbnr("597821z") == "597821z"
+
+    def test_kennziffer(self) -> None:
+        assert normalize_kennziffer(" r133r5574 ") == "R133R5574"
+
+
+class TestScheinfirmenIndex:
+    def test_by_uid(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        matches = index.by_uid("atu79209223")
+        assert [r.name for r in matches] == ["A & HK Bau und Handels GmbH"]
+
+    def test_by_uid_miss(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        assert index.by_uid("ATU00000000") == ()
+
+    def test_by_fbnr(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        assert index.by_fbnr("FN 575302h")[0].uid == "ATU78016816"
+
+    def test_by_kennziffer(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        assert index.by_kennziffer("R133R5574")[0].fbnr == "575302h"
+
+    def test_duplicate_identifier(self) -> None:
+        index = ScheinfirmenIndex([make_record("A", uid="ATU1"), make_record("B", uid="ATU1")])
+        assert [r.name for r in index.by_uid("ATU1")] == ["A", "B"]
+
+    def test_lookup_many(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        hits = index.lookup_many(["ATU78016816", "ATU00000000", "atu79209223"])
+        assert list(hits) == ["ATU78016816", "ATU00000000", "atu79209223"]
+        assert len(hits["ATU78016816"]) == 1
+        assert hits["ATU00000000"] == ()
+        assert len(hits["atu79209223"]) == 1
+
+    def test_lookup_many_fbnr(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        hits = index.lookup_many(["597821Z"], kind="fbnr")
+        assert hits["597821Z"][0].uid == "ATU79209223"
+
+    def test_lookup_many_unknown_kind(self, sample_result: ParseResult) -> None:
+        index = ScheinfirmenIndex.from_result(sample_result)
+        with pytest.raises(ValueError, match="Unknown lookup kind"):
+            index.lookup_many(["x"], kind="name")
+
+    def test_from_jsonl(self, sample_result: ParseResult, tmp_path: Path) -> None:
+        path = tmp_path / "out.jsonl"
+        write_jsonl(sample_result, path)
+        index = ScheinfirmenIndex.from_jsonl(path)
+        assert len(index) == sample_result.raw_row_count
+        assert index.stand_datum == sample_result.stand_datum
+        assert index.stand_zeit == sample_result.stand_zeit
+        assert index.by_uid("ATU79209223")
+
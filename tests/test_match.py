@@ -0,0 +1,114 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the fuzzy name/address matching module."""
+
+from pathlib import Path
+
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.match import (
+    NameMatcher,
+    normalize_address,
+    normalize_name,
+    trigrams,
+)
+from scheinfirmen_at.parse import ParseResult
+
+
+class TestNormalizeName:
+    def test_case_and_umlaut_folding(self) -> None:
+        assert normalize_name("ÖHLINGER Bäckerei") == "oehlinger baeckerei"
+
+    def test_accents_removed(self) -> None:
+        assert normalize_name("Dvořák Stavby") == "dvorak stavby"
+
+    def test_legal_forms_removed(self) -> None:
+        assert normalize_name("Muster Bau GmbH") == "muster bau"
+        assert normalize_name("Muster Bau Ges.m.b.H.") == "muster bau"
+        assert normalize_name("Muster Bau GmbH & Co KG") == "muster bau"
+        assert normalize_name("Max Muster e.U.") == "max muster"
+        assert normalize_name("Jovanluka SRL") == "jovanluka"
+
+    def test_legal_form_only_name_kept(self) -> None:
+        assert normalize_name("KG") == "kg"
+
+    def test_punctuation_separates_tokens(self) -> None:
+        assert normalize_name("Mustermann, Max") == "mustermann max"
+
+
+class TestNormalizeAddress:
+    def test_street_abbreviation(self) -> None:
+        assert normalize_address("1100 Wien, Quellenstr. 145") == normalize_address(
+            "1100 Wien, Quellenstraße 145"
+        )
+
+
+class TestTrigrams:
+    def test_empty(self) -> None:
+        assert trigrams("") == frozenset()
+
+    def test_padding(self) -> None:
+        assert trigrams("ab") == frozenset({"  a", " ab", "ab "})
+
+
+class TestNameMatcher:
+    def test_exact_name_scores_one(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        hits = matcher.search("A & U Teambau GmbH")
+        assert hits[0].record.name == "A & U Teambau GmbH"
+        assert hits[0].score == 1.0
+        assert hits[0].address_score is None
+
+    def test_legal_form_and_case_variants(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        hits = matcher.search("a & u TEAMBAU Ges.m.b.H.")
+        assert hits[0].record.name == "A & U Teambau GmbH"
+        assert hits[0].score == 1.0
+
+    def test_typo_still_matches(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        hits = matcher.search("Ohlinger und Sohne", min_score=0.3)
+        assert hits
+        assert "Öhlinger" in hits[0].record.name
+
+    def test_ranked_best_first(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        hits = matcher.search("A & HK Bau", min_score=0.0)
+        scores = [h.score for h in hits]
+        assert scores == sorted(scores, reverse=True)
+        assert hits[0].record.name == "A & HK Bau und Handels GmbH"
+
+    def test_no_match(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        assert matcher.search("Völlig Unbekannt Xyzzy") == []
+        assert matcher.search("") == []
+
+    def test_limit(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        assert len(matcher.search("GmbH Bau", limit=2, min_score=0.0)) <= 2
+
+    def test_address_contributes_to_score(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        rec = sample_result.records[0]
+        right = matcher.search(rec.name, rec.anschrift)[0]
+        wrong = matcher.search(rec.name, "9999 Nirgendwo, Irgendweg 0", min_score=0.0)[0]
+        assert right.score == 1.0
+        assert right.address_score == 1.0
+        assert wrong.record is rec
+        assert wrong.score < right.score
+
+    def test_match_many(self, sample_result: ParseResult) -> None:
+        matcher = NameMatcher.from_result(sample_result)
+        results = matcher.match_many(
+            [("A & U Teambau GmbH", None), ("Xyzzy", None), ("Mustermann Max", None)]
+        )
+        assert len(results) == 3
+        assert results[0][0].record.name == "A & U Teambau GmbH"
+        assert results[1] == []
+        assert results[2][0].record.name == "Mustermann, Max"
+
+    def test_from_jsonl(self, sample_result: ParseResult, tmp_path: Path) -> None:
+        path = tmp_path / "out.jsonl"
+        write_jsonl(sample_result, path)
+        matcher = NameMatcher.from_jsonl(path)
+        assert len(matcher.records) == sample_result.raw_row_count
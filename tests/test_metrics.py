@@ -0,0 +1,91 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the pipeline metrics."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.metrics import PipelineMetrics, StageMetrics, peak_rss_bytes
+
+
+def test_stage_records_timings() -> None:
+    metrics = PipelineMetrics()
+    with metrics.stage("parse") as m:
+        sum(range(10_000))
+        m.records = 100
+        m.payload_bytes = 2048
+    [stage] = metrics.stages
+    assert stage.name == "parse"
+    assert stage.wall_s > 0
+    assert stage.cpu_s >= 0
+    assert stage.records == 100
+    assert stage.records_per_s == pytest.approx(100 / stage.wall_s)
+    if sys.platform != "win32":
+        assert stage.peak_rss_delta_bytes is not None
+        assert stage.peak_rss_delta_bytes >= 0
+
+
+def test_stage_recorded_on_exit() -> None:
+    metrics = PipelineMetrics()
+    with pytest.raises(SystemExit), metrics.stage("validate", records=5):
+        sys.exit(1)
+    assert [s.name for s in metrics.stages] == ["validate"]
+    assert metrics.stages[0].records == 5
+
+
+def test_records_per_s_without_records() -> None:
+    assert StageMetrics("publish", wall_s=1.0).records_per_s is None
+    assert StageMetrics("publish", wall_s=0.0, records=5).records_per_s is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no resource module")
+def test_peak_rss_bytes() -> None:
+    rss = peak_rss_bytes()
+    assert rss is not None
+    assert rss > 1024 * 1024
+
+
+def test_write_json(tmp_path: Path) -> None:
+    metrics = PipelineMetrics()
+    with metrics.stage("parse", records=10):
+        pass
+    metrics.exit_code = 0
+    path = tmp_path / "metrics.json"
+    metrics.write_json(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["exit_code"] == 0
+    assert data["wall_s"] >= data["stages"][0]["wall_s"]
+    assert data["stages"][0]["stage"] == "parse"
+    assert data["stages"][0]["records"] == 10
+    assert data["stages"][0]["payload_bytes"] is None
+
+
+def test_to_prometheus() -> None:
+    metrics = PipelineMetrics()
+    with metrics.stage("parse", records=10) as m:
+        m.payload_bytes = 123
+    with metrics.stage("publish"):
+        pass
+    metrics.exit_code = 1
+    text = metrics.to_prometheus()
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE scheinfirmen_stage_wall_seconds gauge" in lines
+    assert "scheinfirmen_run_exit_code 1" in lines
+    assert 'scheinfirmen_stage_payload_bytes{stage="parse"} 123' in lines
+    assert 'scheinfirmen_stage_records{stage="parse"} 10' in lines
+    # Stages without a record count don't get a sample
+    publish = [line for line in lines if '{stage="publish"}' in line]
+    assert [line.split("{")[0] for line in publish] == [
+        "scheinfirmen_stage_wall_seconds",
+        "scheinfirmen_stage_cpu_seconds",
+        *(["scheinfirmen_stage_peak_rss_delta_bytes"] if sys.platform != "win32" else []),
+    ]
+    # Every sample belongs to a declared metric
+    declared = {line.split()[2] for line in lines if line.startswith("# TYPE")}
+    samples = {line.split("{")[0].split()[0] for line in lines if not line.startswith("#")}
+    assert samples <= declared
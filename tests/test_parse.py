@@ -1,12 +1,22 @@
 """Tests for the parse module."""
 
+import io
+from dataclasses import replace
+from datetime import date, timedelta
+
 import pytest
 
 from scheinfirmen_at.parse import (
+    COLUMNS,
     EXPECTED_HEADERS,
     ParseResult,
+    RowParser,
+    ScheinfirmaRecord,
     _convert_date,
+    _convert_date_strptime,
+    _slice_date,
     parse_bmf_csv,
+    parse_bmf_csv_iter,
 )
 
 
@@ -139,8 +149,225 @@ def test_convert_date_invalid() -> None:
         _convert_date("not-a-date")
 
 
+def test_convert_date_matches_strptime() -> None:
+    """The slicing fast path gives the same result as strptime for every day."""
+    day = date(1899, 1, 1)
+    while day <= date(2101, 12, 31):
+        text = day.strftime("%d.%m.%Y")
+        assert _slice_date(text) == _convert_date_strptime(text) == day.isoformat()
+        day += timedelta(days=1)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "29.02.2023",  # no leap year
+        "29.02.1900",  # century, no leap year
+        "31.04.2024",
+        "00.01.2024",
+        "01.13.2024",
+        "01.00.2024",
+        "2024-01-01",
+        "01-01-2024",
+        "",
+        "not-a-date",
+        "01.01.0999",
+        "1.1.2024",  # lenient strptime: accepted via the fallback
+        "٠١.٠١.٢٠٢٤",  # non-ASCII digits: strptime accepts them too
+        " 29.02.2024 ",
+    ],
+)
+def test_convert_date_same_as_strptime(text: str) -> None:
+    """Results and error messages are identical to the strptime conversion."""
+    try:
+        expected = _convert_date_strptime(text)
+    except ValueError as exc:
+        with pytest.raises(ValueError) as info:
+            _convert_date(text)
+        assert str(info.value) == str(exc)
+    else:
+        assert _convert_date(text) == expected
+        assert _convert_date(text) == expected  # from the cache
+
+
+def test_convert_date_invalid_not_cached() -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError, match="31.02.2024"):
+            _convert_date("31.02.2024")
+
+
 def test_parse_firmenbuch_5digit(sample_raw_bytes: bytes) -> None:
     result = parse_bmf_csv(sample_raw_bytes)
     # Row index 4: Firmenbuch-Nr 12345c (5 digits)
     rec = result.records[4]
     assert rec.fbnr == "12345c"
+
+
+def _chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_parse_iter_matches_parse(sample_raw_bytes: bytes, chunk_size: int) -> None:
+    # Small chunk sizes split CRLF pairs and multi-field lines across chunks
+    expected = parse_bmf_csv(sample_raw_bytes)
+    stream = parse_bmf_csv_iter(_chunked(sample_raw_bytes, chunk_size))
+    records = list(stream)
+    assert records == expected.records
+    assert stream.stand == (expected.stand_datum, expected.stand_zeit)
+    assert stream.row_count == expected.raw_row_count
+    assert stream.bytes_read == len(sample_raw_bytes)
+
+
+def test_parse_iter_from_file_object(sample_raw_bytes: bytes) -> None:
+    stream = parse_bmf_csv_iter(io.BytesIO(sample_raw_bytes))
+    assert len(list(stream)) == 10
+    assert stream.stand == ("2026-02-10", "09:51:32")
+
+
+def test_parse_iter_is_lazy(sample_raw_bytes: bytes) -> None:
+    stream = parse_bmf_csv_iter(_chunked(sample_raw_bytes, 16))
+    first = next(stream)
+    assert first.name == "A & HK Bau und Handels GmbH"
+    # The footer has not been reached yet
+    with pytest.raises(ValueError, match="not available"):
+        _ = stream.stand
+
+
+def test_parse_iter_lone_cr_line_endings(sample_raw_bytes: bytes) -> None:
+    mac = sample_raw_bytes.replace(b"\r\n", b"\r")
+    stream = parse_bmf_csv_iter(_chunked(mac, 5))
+    assert len(list(stream)) == 10
+
+
+def test_parse_iter_missing_stand_raises_at_end() -> None:
+    header = "~".join(EXPECTED_HEADERS).encode("iso-8859-1") + b"\r\n"
+    row = b"Name~Addr~01.01.2024~01.01.2024~~~~~\r\n"
+    stream = parse_bmf_csv_iter([header, row])
+    assert next(stream).name == "Name"
+    with pytest.raises(ValueError, match="Stand:.*not found"):
+        next(stream)
+
+
+def test_parse_iter_empty_input_raises() -> None:
+    with pytest.raises(ValueError, match="Unexpected CSV headers"):
+        list(parse_bmf_csv_iter([]))
+
+
+def test_content_hash_ignores_stand_line(sample_raw_bytes: bytes) -> None:
+    stream_a = parse_bmf_csv_iter(sample_raw_bytes)
+    list(stream_a)
+    later = sample_raw_bytes.replace(b"10.02.2026 09:51:32", b"11.02.2026 03:15:00")
+    stream_b = parse_bmf_csv_iter(later)
+    list(stream_b)
+    assert stream_b.stand == ("2026-02-11", "03:15:00")
+    assert stream_a.content_hash == stream_b.content_hash
+
+
+def test_content_hash_changes_with_content(sample_raw_bytes: bytes) -> None:
+    stream_a = parse_bmf_csv_iter(sample_raw_bytes)
+    list(stream_a)
+    stream_b = parse_bmf_csv_iter(sample_raw_bytes.replace(b"ATU79209223", b"ATU79209224"))
+    list(stream_b)
+    assert stream_a.content_hash != stream_b.content_hash
+
+
+def test_content_hash_ignores_line_endings(sample_raw_bytes: bytes) -> None:
+    stream_a = parse_bmf_csv_iter(sample_raw_bytes)
+    list(stream_a)
+    stream_b = parse_bmf_csv_iter(sample_raw_bytes.replace(b"\r\n", b"\n"))
+    list(stream_b)
+    assert stream_a.content_hash == stream_b.content_hash
+
+
+def test_record_is_slotted(sample_result: ParseResult) -> None:
+    rec = sample_result.records[0]
+    assert not hasattr(rec, "__dict__")
+    with pytest.raises(AttributeError):
+        rec.extra = 1  # type: ignore[attr-defined]
+
+
+def test_record_dates_interned(sample_raw_bytes: bytes) -> None:
+    a = parse_bmf_csv(sample_raw_bytes).records
+    b = parse_bmf_csv(sample_raw_bytes).records
+    assert a[0].veroeffentlicht is b[0].veroeffentlicht
+    assert a[2].geburtsdatum is b[2].geburtsdatum
+
+
+def test_record_pickle_and_replace(sample_result: ParseResult) -> None:
+    """Slotted records still pickle (process pools) and work with replace()."""
+    import pickle
+    from dataclasses import asdict, replace
+
+    rec = sample_result.records[2]
+    assert pickle.loads(pickle.dumps(rec)) == rec
+    assert replace(rec, uid=None).uid is None
+    assert asdict(rec)["name"] == rec.name
+
+
+def test_columns_match_expected_headers() -> None:
+    assert [c.header for c in COLUMNS] == EXPECTED_HEADERS
+    assert RowParser().headers == EXPECTED_HEADERS
+
+
+def test_parse_custom_columns() -> None:
+    """A changed BMF layout is handled by passing another column table."""
+    by_field = {c.field: c for c in COLUMNS}
+    # Hypothetical format change: UID first, new header text, upper-case FN
+    columns = [
+        replace(by_field["uid"], header="UID"),
+        *(by_field[f] for f in ("name", "anschrift", "veroeffentlicht", "rechtskraeftig",
+                                "seit", "geburtsdatum")),
+        replace(by_field["fbnr"], convert=lambda v: v.upper() or None),
+        by_field["kennziffer"],
+    ]
+    header = "~".join(c.header for c in columns).encode("iso-8859-1") + b"\r\n"
+    row = "ATU12345678~A &amp; B GmbH~1010 Wien~01.02.2024~01.01.2024~ ~~123456a~&quot;R1&quot;"
+    footer = b"Stand:  10.02.2026 09:51:32\r\n"
+    data = header + row.encode("iso-8859-1") + b"\r\n" + footer
+
+    [rec] = parse_bmf_csv(data, columns=columns).records
+    assert rec == ScheinfirmaRecord(
+        name="A & B GmbH",
+        anschrift="1010 Wien",
+        veroeffentlicht="2024-02-01",
+        rechtskraeftig="2024-01-01",
+        seit=None,
+        geburtsdatum=None,
+        fbnr="123456A",
+        uid="ATU12345678",
+        kennziffer="R1",
+    )
+    # The default table rejects the changed header
+    with pytest.raises(ValueError, match="Unexpected CSV headers"):
+        parse_bmf_csv(data)
+
+
+def test_parse_custom_columns_field_count() -> None:
+    columns = [*COLUMNS[:8], replace(COLUMNS[8], convert=lambda v: v or None)]
+    parser = RowParser(columns)
+    assert parser.parse(2, "N~A~01.01.2024~01.01.2024~~~~~&quot;X&quot;").kennziffer == '"X"'
+    with pytest.raises(ValueError, match="Line 2: expected 9 fields, got 3"):
+        parser.parse(2, "a~b~c")
+
+
+def test_row_parser_rejects_incomplete_columns() -> None:
+    with pytest.raises(ValueError, match="each ScheinfirmaRecord field once"):
+        RowParser(COLUMNS[:8])
+    with pytest.raises(ValueError, match="each ScheinfirmaRecord field once"):
+        RowParser([*COLUMNS, COLUMNS[0]])
+
+
+def test_unrolled_builder_matches_column_table(sample_raw_bytes: bytes) -> None:
+    """The hand-written builder for COLUMNS and the generic loop agree."""
+    lines = [ln for ln in sample_raw_bytes.decode("iso-8859-1").splitlines()[1:] if "~" in ln]
+    lines += [
+        "A &amp; B~W~01.02.2024~01.01.2024~ ~~123456a~ATU12345678~&quot;R1&quot;",
+        "Muster, Max~Graz~29.02.2024~01.03.2024~15.03.2024~05.05.1975~~~~",
+        "Tilde &#126; GmbH~Linz~01.02.2024~01.01.2024~~~~~",
+    ]
+    table = RowParser(COLUMNS)
+    loop = RowParser(COLUMNS)
+    loop._build = loop._build_record
+    for i, line in enumerate(lines, start=2):
+        assert loop.parse(i, line) == table.parse(i, line)
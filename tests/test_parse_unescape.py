@@ -0,0 +1,115 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Row-level HTML unescaping gives the same records as per-field unescaping."""
+
+import html
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.convert import read_jsonl
+from scheinfirmen_at.parse import ScheinfirmaRecord, _convert_date, _parse_row
+
+DATA_JSONL = Path(__file__).parent.parent / "data" / "scheinfirmen.jsonl"
+
+
+def _parse_row_reference(line_no: int, line: str) -> ScheinfirmaRecord:
+    """The previous implementation: html.unescape on every field."""
+    fields = line.split("~")
+    if len(fields) == 10 and fields[-1] == "":
+        fields = fields[:9]
+    if len(fields) != 9:
+        raise ValueError(f"Line {line_no}: expected 9 fields, got {len(fields)}: {line!r}")
+
+    def clean(v: str) -> str:
+        return html.unescape(v).strip()
+
+    def opt(v: str) -> str | None:
+        return clean(v) or None
+
+    def opt_date(v: str) -> str | None:
+        cleaned = clean(v)
+        return _convert_date(cleaned) if cleaned else None
+
+    kennziffer = clean(fields[8]).strip('"').strip()
+    return ScheinfirmaRecord(
+        name=clean(fields[0]),
+        anschrift=clean(fields[1]),
+        veroeffentlicht=_convert_date(clean(fields[2])),
+        rechtskraeftig=_convert_date(clean(fields[3])),
+        seit=opt_date(fields[4]),
+        geburtsdatum=opt_date(fields[5]),
+        fbnr=opt(fields[6]),
+        uid=opt(fields[7]),
+        kennziffer=kennziffer or None,
+    )
+
+
+def _raw_line(rec: ScheinfirmaRecord, quote: bool) -> str:
+    """Rebuild a BMF row, escaping text fields the way the BMF export may."""
+
+    def date(iso: str | None) -> str:
+        return "" if iso is None else ".".join(reversed(iso.split("-")))
+
+    return "~".join(
+        [
+            html.escape(rec.name, quote=quote),
+            html.escape(rec.anschrift, quote=quote),
+            date(rec.veroeffentlicht),
+            date(rec.rechtskraeftig),
+            date(rec.seit) or " ",
+            date(rec.geburtsdatum),
+            rec.fbnr or "",
+            rec.uid or "",
+            f"&quot;{rec.kennziffer}&quot;" if rec.kennziffer else "",
+        ]
+    )
+
+
+@pytest.mark.skipif(not DATA_JSONL.exists(), reason="data/scheinfirmen.jsonl not present")
+@pytest.mark.parametrize("quote", [False, True])  # quote=True adds numeric &#x27;
+def test_same_records_on_real_data(quote: bool) -> None:
+    records = read_jsonl(DATA_JSONL).records
+    lines = [_raw_line(rec, quote) for rec in records]
+    assert any("&amp;" in line for line in lines)
+    for i, line in enumerate(lines, start=2):
+        assert _parse_row(i, line) == _parse_row_reference(i, line)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Plain GmbH",
+        "A &amp; B GmbH",
+        "A &amp;amp; B",  # unescaped once only
+        "&quot;Quoted&quot; KG",
+        "Caf&eacute; &#233; &#xE9;",
+        "Tilde &#126; GmbH",  # numeric reference to the delimiter
+        "Tilde &#x7e; GmbH",
+        "Legacy &amp without semicolon",
+        "Ends with &amp",
+        "&not",
+        "Line&NewLine;break",
+        "& alone",
+        "&unknown; entity",
+    ],
+)
+def test_same_record_for_entities(name: str) -> None:
+    for tail in ("~R123A4567", "~&quot;R123A4567&quot;", "~", "~~", "~&not"):
+        line = f"{name}~1010 Wien &amp; Umgebung~01.02.2024~01.01.2024~ ~~123456a~ATU12345678{tail}"
+        try:
+            expected = _parse_row_reference(2, line)
+        except ValueError as exc:
+            with pytest.raises(ValueError) as info:
+                _parse_row(2, line)
+            assert str(info.value) == str(exc)
+        else:
+            assert _parse_row(2, line) == expected
+
+
+def test_entity_next_to_delimiter() -> None:
+    """A name candidate running into the next field matches as per field."""
+    line = "A &not~in;~01.02.2024~01.01.2024~~~~~"
+    assert _parse_row(2, line) == _parse_row_reference(2, line)
+    assert _parse_row(2, line).name == "A ¬"
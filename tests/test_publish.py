@@ -0,0 +1,103 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for crash-safe output publishing."""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.publish import StagingDir, atomic_write_bytes, atomic_write_text
+
+
+def test_atomic_write_replaces_file(tmp_path: Path) -> None:
+    target = tmp_path / "out.txt"
+    target.write_text("old", encoding="utf-8")
+    atomic_write_text(target, "neu\nzeile\n")
+    assert target.read_bytes() == b"neu\nzeile\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_atomic_write_creates_parent(tmp_path: Path) -> None:
+    target = tmp_path / "sub" / "out.bin"
+    atomic_write_bytes(target, b"\x00\x01")
+    assert target.read_bytes() == b"\x00\x01"
+
+
+def test_atomic_write_keeps_old_file_on_error(tmp_path: Path) -> None:
+    target = tmp_path / "out.txt"
+    target.write_text("old", encoding="utf-8")
+    with pytest.raises(UnicodeEncodeError):
+        atomic_write_text(target, "\udc80")
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_atomic_write_keeps_permissions(tmp_path: Path) -> None:
+    target = tmp_path / "STATS.md"
+    target.write_text("old", encoding="utf-8")
+    target.chmod(0o640)
+    atomic_write_text(target, "new")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_atomic_write_new_file_honours_umask(tmp_path: Path) -> None:
+    old_umask = os.umask(0o022)
+    try:
+        atomic_write_text(tmp_path / "metrics.prom", "x 1\n")
+    finally:
+        os.umask(old_umask)
+    # Readable by others (e.g. node_exporter), not 0600 as mkstemp creates it
+    assert stat.S_IMODE((tmp_path / "metrics.prom").stat().st_mode) == 0o644
+
+
+def test_atomic_write_leaves_umask_alone(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The umask is process-wide: changing it, even briefly, races other threads."""
+
+    def fail(mask: int) -> int:
+        raise AssertionError("os.umask called")
+
+    monkeypatch.setattr(os, "umask", fail)
+    atomic_write_text(tmp_path / "new.txt", "x")
+    assert (tmp_path / "new.txt").read_text(encoding="utf-8") == "x"
+    assert [p.name for p in tmp_path.iterdir()] == ["new.txt"]
+
+
+def test_staging_publish(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("old", encoding="utf-8")
+    with StagingDir(tmp_path) as staging:
+        assert staging.path.parent == tmp_path
+        (staging.path / "a.txt").write_text("new a", encoding="utf-8")
+        (staging.path / "b.txt").write_text("new b", encoding="utf-8")
+        (staging.path / "scratch.tmp").write_text("x", encoding="utf-8")
+        assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "old"
+        published = staging.publish(["a.txt", "b.txt"])
+    assert published == [tmp_path / "a.txt", tmp_path / "b.txt"]
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "new a"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt", "b.txt"]
+
+
+def test_staging_cleanup_on_error(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError), StagingDir(tmp_path) as staging:
+        (staging.path / "a.txt").write_text("new", encoding="utf-8")
+        raise RuntimeError("verification failed")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_staging_publish_missing_file(tmp_path: Path) -> None:
+    """Nothing is moved if any of the requested files was not staged."""
+    with StagingDir(tmp_path) as staging:
+        (staging.path / "a.txt").write_text("new", encoding="utf-8")
+        with pytest.raises(FileNotFoundError, match="b.txt"):
+            staging.publish(["a.txt", "b.txt"])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_staging_path_requires_context(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="not active"):
+        _ = StagingDir(tmp_path).path
@@ -0,0 +1,191 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the HTTP lookup service."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scheinfirmen_at.cli import main
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.parse import ParseResult
+from scheinfirmen_at.serve import LookupServer
+
+
+@pytest.fixture
+def data_path(sample_result: ParseResult, tmp_path: Path) -> Path:
+    path = tmp_path / "scheinfirmen.jsonl"
+    write_jsonl(sample_result, path)
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestDispatch:
+    def test_uid_listed(self, data_path: Path) -> None:
+        status, payload = LookupServer(data_path).dispatch("GET", "/uid/atu79209223", b"")
+        assert status == 200
+        assert isinstance(payload, dict)
+        assert payload["listed"] is True
+        assert payload["records"][0]["name"] == "A & HK Bau und Handels GmbH"
+
+    def test_uid_not_listed(self, data_path: Path) -> None:
+        status, payload = LookupServer(data_path).dispatch("GET", "/uid/ATU00000000", b"")
+        assert status == 200
+        assert payload == {"query": "ATU00000000", "listed": False, "records": []}
+
+    def test_fbnr_url_encoded(self, data_path: Path) -> None:
+        _, payload = LookupServer(data_path).dispatch("GET", "/fbnr/FN%20597821z", b"")
+        assert isinstance(payload, dict)
+        assert payload["listed"] is True
+
+    def test_meta(self, data_path: Path, sample_result: ParseResult) -> None:
+        status, payload = LookupServer(data_path).dispatch("GET", "/meta", b"")
+        assert status == 200
+        assert isinstance(payload, dict)
+        assert payload["stand"] == f"{sample_result.stand_datum}T{sample_result.stand_zeit}"
+        assert payload["count"] == sample_result.raw_row_count
+
+    def test_batch_lookup(self, data_path: Path) -> None:
+        body = json.dumps({"uid": ["ATU79209223", "ATU00000000"], "fbnr": ["575302h"]})
+        status, payload = LookupServer(data_path).dispatch("POST", "/lookup", body.encode())
+        assert status == 200
+        assert isinstance(payload, dict)
+        assert len(payload["uid"]["ATU79209223"]) == 1
+        assert payload["uid"]["ATU00000000"] == []
+        assert payload["fbnr"]["575302h"][0]["uid"] == "ATU78016816"
+
+    @pytest.mark.parametrize(
+        "body", [b"not json", b"[]", b'{"name": ["x"]}', b'{"uid": "ATU1"}']
+    )
+    def test_batch_lookup_bad_request(self, data_path: Path, body: bytes) -> None:
+        status, _ = LookupServer(data_path).dispatch("POST", "/lookup", body)
+        assert status == 400
+
+    def test_unknown_route(self, data_path: Path) -> None:
+        status, _ = LookupServer(data_path).dispatch("GET", "/nope", b"")
+        assert status == 404
+
+    def test_wrong_method(self, data_path: Path) -> None:
+        server = LookupServer(data_path)
+        assert server.dispatch("POST", "/uid/ATU1", b"")[0] == 405
+        assert server.dispatch("GET", "/lookup", b"")[0] == 405
+
+
+class TestReload:
+    def test_reload_on_change(self, data_path: Path, sample_result: ParseResult) -> None:
+        server = LookupServer(data_path)
+        old_index = server.index
+        assert not server.reload_if_changed()
+
+        shrunk = ParseResult(
+            records=sample_result.records[:3],
+            stand_datum="2026-03-01",
+            stand_zeit="03:15:00",
+            raw_row_count=3,
+        )
+        write_jsonl(shrunk, data_path)
+        _bump_mtime(data_path)
+        assert server.reload_if_changed()
+        assert server.index is not old_index
+        assert len(server.index) == 3
+        assert server.index.stand_datum == "2026-03-01"
+
+    def test_broken_file_keeps_old_index(self, data_path: Path) -> None:
+        server = LookupServer(data_path)
+        old_index = server.index
+        data_path.write_text("{broken\n", encoding="utf-8")
+        _bump_mtime(data_path)
+        assert not server.reload_if_changed()
+        assert server.index is old_index
+
+    def test_watch_survives_unexpected_errors(
+        self, data_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        server = LookupServer(data_path, reload_interval=0)
+        old_index = server.index
+        calls = 0
+
+        def reload() -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise KeyError("name")
+            return False
+
+        async def scenario() -> None:
+            watcher = asyncio.create_task(server.watch())
+            while calls < 2:
+                await asyncio.sleep(0.01)
+            watcher.cancel()
+
+        with patch.object(server, "reload_if_changed", reload):
+            asyncio.run(asyncio.wait_for(scenario(), 5))
+        assert calls >= 2
+        assert server.index is old_index
+        assert "Reload of" in caplog.text
+
+
+def test_http_roundtrip(data_path: Path) -> None:
+    """Requests over a real socket get JSON answers."""
+
+    async def request(port: int, raw: bytes) -> tuple[str, dict[str, object]]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return head.decode().split("\r\n")[0], json.loads(body)
+
+    async def scenario() -> None:
+        lookup = LookupServer(data_path)
+        server = await lookup.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            status, payload = await request(
+                port, b"GET /uid/ATU79209223 HTTP/1.1\r\nHost: x\r\n\r\n"
+            )
+            assert status == "HTTP/1.1 200 OK"
+            assert payload["listed"] is True
+
+            body = b'{"uid": ["ATU78016816"]}'
+            status, payload = await request(
+                port,
+                b"POST /lookup HTTP/1.1\r\nHost: x\r\nContent-Length: "
+                + str(len(body)).encode()
+                + b"\r\n\r\n"
+                + body,
+            )
+            assert status == "HTTP/1.1 200 OK"
+            assert payload["uid"]
+
+            status, _ = await request(port, b"garbage\r\n\r\n")
+            assert status == "HTTP/1.1 400 Bad Request"
+
+            status, payload = await request(
+                port, b"GET /uid/" + b"A" * 70_000 + b" HTTP/1.1\r\n\r\n"
+            )
+            assert status == "HTTP/1.1 400 Bad Request"
+            assert payload == {"error": "request line too long"}
+
+    asyncio.run(scenario())
+
+
+@patch("scheinfirmen_at.cli.serve")
+def test_cli_serve_subcommand(mock_serve: MagicMock, data_path: Path) -> None:
+    main(["serve", "--data", str(data_path), "--port", "9999"])
+    mock_serve.assert_called_once_with(data_path, "127.0.0.1", 9999, 5.0)
+
+
+def test_cli_serve_missing_data(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit, match="1"):
+        main(["serve", "--data", str(tmp_path / "missing.jsonl")])
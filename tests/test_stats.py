@@ -7,12 +7,19 @@ import json
 from datetime import date
 from pathlib import Path
 
+from scheinfirmen_at.columnar import ColumnarView
+from scheinfirmen_at.convert import write_jsonl
+from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
 from scheinfirmen_at.stats import (
     MonthRow,
     RecordInfo,
+    WeekRow,
     compute_monthly_stats,
+    compute_weekly_stats,
     find_recent_additions,
+    fold_changes,
     generate_stats,
+    load_weekly_state,
     parse_jsonl_records,
     render_stats_md,
 )
@@ -171,6 +178,25 @@ class TestFindRecentAdditions:
         result = find_recent_additions(records, days=30)
         assert isinstance(result, list)
 
+    def test_columnar_view(self) -> None:
+        def rec(name: str, veroeffentlicht: str, uid: str | None = None) -> ScheinfirmaRecord:
+            return ScheinfirmaRecord(
+                name=name, anschrift="1010 Wien", veroeffentlicht=veroeffentlicht,
+                rechtskraeftig="2026-01-01", seit=None, geburtsdatum=None, fbnr=None,
+                uid=uid, kennziffer=None,
+            )
+
+        view = ColumnarView([
+            rec("Zebra GmbH", "2026-02-15", uid="ATU1"),
+            rec("Alt KG", "2025-01-01"),
+            rec("Alpha KG", "2026-01-20"),
+            rec("Kaputt", "2026-02-30"),  # invalid date is skipped
+        ])
+        assert find_recent_additions(view, days=30, today=date(2026, 2, 18)) == [
+            _make_record("Alpha KG", date(2026, 1, 20), anschrift="1010 Wien"),
+            _make_record("Zebra GmbH", date(2026, 2, 15), uid="ATU1", anschrift="1010 Wien"),
+        ]
+
 
 class TestRenderStatsMd:
     def _make_monthly(self) -> list[MonthRow]:
@@ -334,9 +360,123 @@ class TestGenerateStats:
         assert "# Scheinfirmen Österreich — Statistik" in content
         assert "| 2026-01-12T02:00:00 | 2 |" in content
 
+    def test_from_result_matches_jsonl(self, tmp_path: Path, sample_result: ParseResult) -> None:
+        jsonl = tmp_path / "sf.jsonl"
+        write_jsonl(sample_result, jsonl)
+        from_file, from_memory = tmp_path / "a.md", tmp_path / "b.md"
+        generate_stats(jsonl, from_file)
+        generate_stats(
+            tmp_path / "missing.jsonl", from_memory,
+            result=sample_result, columns=ColumnarView.from_result(sample_result),
+        )
+        assert from_memory.read_text(encoding="utf-8") == from_file.read_text(encoding="utf-8")
+
     def test_no_records_skips(self, tmp_path: Path) -> None:
         jsonl = tmp_path / "sf.jsonl"
         jsonl.write_text("", encoding="utf-8")
         output = tmp_path / "STATS.md"
         generate_stats(jsonl, output)
         assert not output.exists()
+
+
+def _write_changes(
+    path: Path, stand: str, previous_stand: str | None, added: int, removed: int
+) -> Path:
+    meta = {
+        "stand": stand,
+        "previous_stand": previous_stand,
+        "added": added,
+        "removed": removed,
+        "changed": 0,
+    }
+    path.write_text(json.dumps({"_metadata": meta}) + "\n", encoding="utf-8")
+    return path
+
+
+class TestWeeklyStats:
+    def test_fold_adds_to_iso_week(self, tmp_path: Path) -> None:
+        state = load_weekly_state(tmp_path / "missing.json")
+        changes = _write_changes(
+            tmp_path / "c.jsonl", "2026-02-11T03:00:00", "2026-02-10T03:00:00", 4, 1
+        )
+        assert fold_changes(state, changes)
+        assert state["weeks"] == {"2026-W07": {"added": 4, "removed": 1}}
+        assert state["last_stand"] == "2026-02-11T03:00:00"
+
+    def test_fold_is_idempotent(self, tmp_path: Path) -> None:
+        state = load_weekly_state(tmp_path / "missing.json")
+        changes = _write_changes(
+            tmp_path / "c.jsonl", "2026-02-11T03:00:00", "2026-02-10T03:00:00", 4, 1
+        )
+        fold_changes(state, changes)
+        assert not fold_changes(state, changes)
+        assert state["weeks"]["2026-W07"] == {"added": 4, "removed": 1}
+
+    def test_first_snapshot_is_baseline_only(self, tmp_path: Path) -> None:
+        state = load_weekly_state(tmp_path / "missing.json")
+        changes = _write_changes(tmp_path / "c.jsonl", "2026-02-10T03:00:00", None, 1500, 0)
+        assert fold_changes(state, changes)
+        assert state["weeks"] == {}
+
+    def test_compute_fills_gaps(self) -> None:
+        state = {
+            "weeks": {
+                "2026-W01": {"added": 2, "removed": 0},
+                "2026-W04": {"added": 1, "removed": 3},
+            }
+        }
+        rows = compute_weekly_stats(state)
+        assert [r.week_label for r in rows] == ["2026-W01", "2026-W02", "2026-W03", "2026-W04"]
+        assert rows[0].week_start == date(2025, 12, 29)
+        assert (rows[1].additions, rows[1].removals) == (0, 0)
+        assert (rows[3].additions, rows[3].removals) == (1, 3)
+
+    def test_compute_limits_weeks(self) -> None:
+        state = {
+            "weeks": {
+                "2025-W01": {"added": 1, "removed": 0},
+                "2026-W10": {"added": 1, "removed": 0},
+            }
+        }
+        rows = compute_weekly_stats(state, weeks=4)
+        assert [r.week_label for r in rows] == ["2026-W07", "2026-W08", "2026-W09", "2026-W10"]
+
+    def test_compute_empty(self) -> None:
+        assert compute_weekly_stats({"weeks": {}}) == []
+
+    def test_render_weekly_section(self) -> None:
+        weekly = [
+            WeekRow("2026-W06", date(2026, 2, 2), 3, 1),
+            WeekRow("2026-W07", date(2026, 2, 9), 0, 2),
+        ]
+        md = render_stats_md([], [], "2026-02-11T03:00:00", 10, weekly=weekly)
+        assert "## Zugänge und Abgänge pro Woche" in md
+        assert "bar [3, 0]" in md
+        assert "line [1, 2]" in md
+        assert "| 2026-W07 | 2026-02-09 | 0 | 2 | -2 |" in md
+        # Newest week first in the table
+        assert md.index("| 2026-W07 |") < md.index("| 2026-W06 |")
+        assert md.index("pro Woche") < md.index("## Neueste Scheinfirmen")
+
+    def test_generate_stats_folds_incrementally(self, tmp_path: Path) -> None:
+        jsonl = tmp_path / "scheinfirmen.jsonl"
+        jsonl.write_text(
+            json.dumps({"_metadata": {"stand": "2026-02-11T03:00:00", "count": 1}})
+            + "\n"
+            + json.dumps({"name": "Firma A", "anschrift": "", "veroeffentlicht": "2025-06-01"})
+            + "\n",
+            encoding="utf-8",
+        )
+        output = tmp_path / "STATS.md"
+        weekly_path = tmp_path / "STATS.weekly.json"
+        changes = tmp_path / "changes.jsonl"
+
+        _write_changes(changes, "2026-02-11T03:00:00", "2026-02-10T03:00:00", 2, 0)
+        generate_stats(jsonl, output, changes, weekly_path)
+        generate_stats(jsonl, output, changes, weekly_path)  # same delta again
+        _write_changes(changes, "2026-02-12T03:00:00", "2026-02-11T03:00:00", 1, 1)
+        generate_stats(jsonl, output, changes, weekly_path)
+
+        state = load_weekly_state(weekly_path)
+        assert state["weeks"] == {"2026-W07": {"added": 3, "removed": 1}}
+        assert "| 2026-W07 | 2026-02-09 | 3 | 1 | +2 |" in output.read_text(encoding="utf-8")
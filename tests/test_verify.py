@@ -3,10 +3,18 @@
 import json
 from pathlib import Path
 
-from scheinfirmen_at.convert import write_csv, write_jsonl, write_xml
+import pytest
+
+from scheinfirmen_at.convert import write_csv, write_jsonl, write_sqlite, write_xml
 from scheinfirmen_at.parse import ParseResult, ScheinfirmaRecord
 from scheinfirmen_at.schema import write_json_schema, write_xsd
-from scheinfirmen_at.verify import verify_outputs, verify_schemas
+from scheinfirmen_at.verify import (
+    _count_csv,
+    _count_jsonl,
+    _count_xml,
+    verify_outputs,
+    verify_schemas,
+)
 
 
 def _write_all(result: ParseResult, out: Path) -> tuple[Path, Path, Path, Path, Path]:
@@ -163,3 +171,70 @@ def test_verify_schemas_invalid_jsonl(tmp_path: Path) -> None:
     errors = verify_schemas(jsonl_p, xml_p, schema_p, xsd_p)
     jsonl_errors = [e for e in errors if "JSONL" in e]
     assert len(jsonl_errors) > 0
+
+
+def test_verify_sqlite_count(sample_result: ParseResult, tmp_path: Path) -> None:
+    csv_p, jsonl_p, xml_p, _, _ = _write_all(sample_result, tmp_path)
+    sqlite_p = tmp_path / "scheinfirmen.sqlite"
+    write_sqlite(sample_result, sqlite_p)
+    assert verify_outputs(
+        csv_p, jsonl_p, xml_p, sample_result.raw_row_count, sqlite_path=sqlite_p
+    ) == []
+
+    truncated = ParseResult(
+        records=sample_result.records[:-1],
+        stand_datum=sample_result.stand_datum,
+        stand_zeit=sample_result.stand_zeit,
+        raw_row_count=sample_result.raw_row_count,
+    )
+    write_sqlite(truncated, sqlite_p)
+    errors = verify_outputs(
+        csv_p, jsonl_p, xml_p, sample_result.raw_row_count, sqlite_path=sqlite_p
+    )
+    assert any(e.startswith("SQLite:") for e in errors)
+    assert any("Last record name mismatch" in e for e in errors)
+
+
+def test_verify_last_name_mismatch_detected(sample_result: ParseResult, tmp_path: Path) -> None:
+    """Only the boundary names are kept, but the last one is still compared."""
+    csv_p, jsonl_p, xml_p, _, _ = _write_all(sample_result, tmp_path)
+    last_name = sample_result.records[-1].name
+    content = xml_p.read_text(encoding="utf-8")
+    head, _, tail = content.rpartition(f">{last_name}<")
+    xml_p.write_text(f"{head}>TAMPERED<{tail}", encoding="utf-8")
+
+    errors = verify_outputs(csv_p, jsonl_p, xml_p, sample_result.raw_row_count)
+    assert len(errors) == 1
+    assert errors[0].startswith("Last record name mismatch")
+
+
+def test_count_xml_streams_direct_children(tmp_path: Path) -> None:
+    """Only <scheinfirma> children of the root are counted, as before."""
+    xml_p = tmp_path / "x.xml"
+    xml_p.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<scheinfirmen stand="x">'
+        "<scheinfirma>A &amp; B</scheinfirma>"
+        "<other><scheinfirma>nested</scheinfirma></other>"
+        "<scheinfirma />"
+        "<scheinfirma>Z</scheinfirma>"
+        "</scheinfirmen>",
+        encoding="utf-8",
+    )
+    assert _count_xml(xml_p) == (3, ["A & B", "Z"])
+
+
+def test_count_empty_outputs(tmp_path: Path) -> None:
+    empty = ParseResult([], "2024-01-01", "10:00:00", raw_row_count=0)
+    csv_p, jsonl_p, xml_p, _, _ = _write_all(empty, tmp_path)
+    assert _count_csv(csv_p) == (0, [])
+    assert _count_jsonl(jsonl_p) == (0, [])
+    assert _count_xml(xml_p) == (0, [])
+    assert verify_outputs(csv_p, jsonl_p, xml_p, 0) == []
+
+
+def test_verify_reader_error_propagates(sample_result: ParseResult, tmp_path: Path) -> None:
+    """A reader failing in the worker thread surfaces in the caller."""
+    csv_p, jsonl_p, _, _, _ = _write_all(sample_result, tmp_path)
+    with pytest.raises(FileNotFoundError):
+        verify_outputs(csv_p, jsonl_p, tmp_path / "missing.xml", sample_result.raw_row_count)
@@ -0,0 +1,81 @@
+# Copyright 2026 Harald Schilly <info@arjoma.at>, ARJOMA FlexCo.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Regression test: the streaming XML writer matches the ElementTree writer byte for byte."""
+
+import xml.etree.ElementTree as ET
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from scheinfirmen_at.convert import FIELD_ORDER, read_jsonl, write_xml
+from scheinfirmen_at.download import BMF_URL
+from scheinfirmen_at.parse import ParseResult
+
+DATA_JSONL = Path(__file__).parent.parent / "data" / "scheinfirmen.jsonl"
+
+
+def _write_xml_etree(result: ParseResult, path: Path) -> None:
+    """The previous write_xml implementation (full tree + ET.indent)."""
+    root = ET.Element("scheinfirmen")
+    root.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
+    root.set(
+        "xsi:noNamespaceSchemaLocation",
+        "https://raw.githubusercontent.com/arjoma/scheinfirmen-at/main/data/scheinfirmen.xsd",
+    )
+    root.set("stand", result.stand_datum)
+    root.set("zeit", result.stand_zeit)
+    root.set("quelle", BMF_URL)
+    root.set("anzahl", str(result.raw_row_count))
+    for rec in result.records:
+        attribs = {}
+        for field_name in FIELD_ORDER:
+            value = getattr(rec, field_name)
+            if field_name == "name" or value is None:
+                continue
+            attribs[field_name] = value
+        elem = ET.SubElement(root, "scheinfirma", attribs)
+        elem.text = rec.name
+    ET.indent(root, space="  ")
+    with path.open("wb") as f:
+        ET.ElementTree(root).write(f, encoding="utf-8", xml_declaration=True)
+
+
+def _assert_identical(result: ParseResult, tmp_path: Path) -> None:
+    _write_xml_etree(result, tmp_path / "etree.xml")
+    write_xml(result, tmp_path / "stream.xml")
+    assert (tmp_path / "stream.xml").read_bytes() == (tmp_path / "etree.xml").read_bytes()
+
+
+def test_sample_identical(sample_result: ParseResult, tmp_path: Path) -> None:
+    _assert_identical(sample_result, tmp_path)
+
+
+@pytest.mark.skipif(not DATA_JSONL.exists(), reason="data/scheinfirmen.jsonl not present")
+def test_published_data_identical(tmp_path: Path) -> None:
+    _assert_identical(read_jsonl(DATA_JSONL), tmp_path)
+
+
+def test_empty_list_identical(sample_result: ParseResult, tmp_path: Path) -> None:
+    _assert_identical(replace(sample_result, records=[], raw_row_count=0), tmp_path)
+
+
+def test_single_record_identical(sample_result: ParseResult, tmp_path: Path) -> None:
+    _assert_identical(replace(sample_result, records=sample_result.records[:1]), tmp_path)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "",
+        'Say "hi" <b> & co',
+        "Tab\tLine\nCR\r",
+        "Emoji 🏗 äß",
+        "lone \ud800 surrogate",
+        "]]> & &amp;",
+    ],
+)
+def test_escaping_identical(sample_result: ParseResult, tmp_path: Path, name: str) -> None:
+    rec = replace(sample_result.records[0], name=name, anschrift=name or "x", kennziffer=name)
+    _assert_identical(replace(sample_result, records=[rec, sample_result.records[1]]), tmp_path)